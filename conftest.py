@@ -0,0 +1,29 @@
+"""Fixtures for the root-level performance scripts; the unit-test suite lives in tests/."""
+
+import pytest
+
+from dbmocker.core.analyzer import SchemaAnalyzer
+from perf_helpers import make_perf_db_config, create_perf_database, remove_sqlite_files
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep tests sharing the session perf_db on one worker under ``--dist loadgroup``."""
+    for item in items:
+        if "perf_db" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.xdist_group("perf_db"))
+
+
+@pytest.fixture(scope="session")
+def perf_db():
+    """Session-wide SQLite database with the performance test tables created once."""
+    db_config = make_perf_db_config()
+    db_conn = create_perf_database(db_config)
+    yield db_conn
+    db_conn.close()
+    remove_sqlite_files(db_config.database)
+
+
+@pytest.fixture(scope="session")
+def perf_schema(perf_db):
+    """Schema of perf_db, analyzed once per session."""
+    return SchemaAnalyzer(perf_db).analyze_schema()
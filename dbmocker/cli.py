@@ -285,7 +285,7 @@ def generate(host: str, port: int, database: str, username: str, password: str,
             if enable_multiprocessing or max_workers > 1:
                 from dbmocker.core.parallel_generator import ParallelDataGenerator, ParallelDataInserter
                 generator = ParallelDataGenerator(schema, generation_config, db_conn)
-                inserter = ParallelDataInserter(db_conn, schema)
+                inserter = ParallelDataInserter(db_conn, schema, generation_config)
                 click.echo(f"🚀 Using parallel processing: MP={enable_multiprocessing}, Workers={max_workers}")
             else:
                 # Use enhanced DataGenerator with better constraint handling
@@ -605,7 +605,7 @@ def high_performance(driver, host, port, database, username, password, rows, bat
         # Initialize high-performance components
         from dbmocker.core.parallel_generator import ParallelDataGenerator, ParallelDataInserter
         generator = ParallelDataGenerator(schema, generation_config, db_conn)
-        inserter = ParallelDataInserter(db_conn, schema)
+        inserter = ParallelDataInserter(db_conn, schema, generation_config)
         
         # Show performance plan
         total_tables = len(schema.tables)
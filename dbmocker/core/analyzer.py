@@ -154,6 +154,24 @@ class SchemaAnalyzer:
         logger.info(f"Schema analysis complete. Analyzed {len(tables)} tables.")
         return schema
     
+    def analyze_table(self, table_name: str, analyze_data_patterns: bool = True) -> Optional[TableInfo]:
+        """Analyze a single table without introspecting the rest of the schema.
+        
+        Reverse relationships (referenced_by) are not populated since they
+        depend on the other tables.
+        """
+        if not self.db_connection.test_connection():
+            raise ConnectionError("Database connection is not available")
+        
+        self.inspector = inspect(self.db_connection.engine)
+        
+        if not self.inspector.has_table(table_name):
+            logger.warning(f"Table {table_name} not found in database")
+            return None
+        
+        logger.info(f"Analyzing table: {table_name}")
+        return self._analyze_table(table_name, analyze_data_patterns)
+    
     def _get_database_name(self) -> str:
         """Get the current database name."""
         try:
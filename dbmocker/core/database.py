@@ -1,8 +1,11 @@
 """Database connection and management utilities."""
 
 import logging
-from typing import Dict, Any, Optional
-from sqlalchemy import create_engine, Engine, text
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+from sqlalchemy import create_engine, Engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel, Field, validator
@@ -10,6 +13,30 @@ from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
 
+# Applied to every new SQLite connection: WAL journaling, no fsync per commit,
+# in-memory temp storage, a 256MB page cache and 256MB of memory-mapped I/O
+SQLITE_BULK_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-262144;
+PRAGMA mmap_size=268435456;
+"""
+
+# Conservative bound on bind parameters per statement (SQLite's historical default)
+SQLITE_MAX_VARIABLES = 999
+
+# INSERT SQL strings built once per (driver, table, columns, rows per statement)
+_INSERT_SQL_CACHE: Dict[tuple, str] = {}
+
+
+def tune_sqlite_connection(dbapi_connection, durable: bool = False) -> None:
+    """Apply the bulk-load PRAGMA bundle to a raw sqlite3 connection in one round-trip."""
+    script = SQLITE_BULK_PRAGMAS
+    if durable:
+        script += "PRAGMA synchronous=FULL;\n"
+    dbapi_connection.executescript(script)
+
 
 class DatabaseConfig(BaseModel):
     """Configuration model for database connections."""
@@ -22,6 +49,7 @@ class DatabaseConfig(BaseModel):
     password: str = Field(..., description="Database password")
     ssl_mode: Optional[str] = Field(default=None, description="SSL mode")
     charset: str = Field(default="utf8mb4", description="Character set")
+    durable_writes: bool = Field(default=False, description="Keep synchronous=FULL on SQLite connections")
     
     @validator("driver")
     def validate_driver(cls, v):
@@ -41,6 +69,28 @@ class DatabaseConfig(BaseModel):
         return v
 
 
+def build_connection_url(config: DatabaseConfig) -> str:
+    """Build the SQLAlchemy connection URL for a database configuration."""
+    if config.driver == "postgresql":
+        driver_name = "postgresql+psycopg2"
+    elif config.driver == "mysql":
+        driver_name = "mysql+pymysql"
+    elif config.driver == "sqlite":
+        return f"sqlite:///{config.database}"
+    else:
+        raise ValueError(f"Unsupported driver: {config.driver}")
+    
+    # Build base URL
+    base_url = f"{driver_name}://{config.username}:{config.password}@{config.host}:{config.port}"
+    
+    # Add database name if specified (for database-specific connections)
+    if config.database:
+        return f"{base_url}/{config.database}"
+    else:
+        # Server-level connection (for listing databases)
+        return base_url
+
+
 class DatabaseConnection:
     """Manages database connections and provides utilities for database operations."""
     
@@ -49,6 +99,7 @@ class DatabaseConnection:
         self.config = config
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
+        self._bulk_state = threading.local()  # per-thread active bulk transaction
         
     def connect(self) -> None:
         """Establish connection to the database."""
@@ -70,6 +121,10 @@ class DatabaseConnection:
             
             self._engine = create_engine(connection_url, **engine_kwargs)
             
+            # Tune every pooled SQLite connection before it is first used
+            if self.config.driver == "sqlite":
+                event.listen(self._engine, "connect", self._on_sqlite_connect)
+            
             # Test connection
             with self._engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -81,26 +136,13 @@ class DatabaseConnection:
             logger.error(f"Failed to connect to database: {e}")
             raise ConnectionError(f"Database connection failed: {e}")
     
+    def _on_sqlite_connect(self, dbapi_connection, connection_record) -> None:
+        """Engine connect hook applying the SQLite PRAGMA bundle."""
+        tune_sqlite_connection(dbapi_connection, durable=self.config.durable_writes)
+    
     def _build_connection_url(self) -> str:
         """Build SQLAlchemy connection URL from config."""
-        if self.config.driver == "postgresql":
-            driver_name = "postgresql+psycopg2"
-        elif self.config.driver == "mysql":
-            driver_name = "mysql+pymysql"
-        elif self.config.driver == "sqlite":
-            return f"sqlite:///{self.config.database}"
-        else:
-            raise ValueError(f"Unsupported driver: {self.config.driver}")
-        
-        # Build base URL
-        base_url = f"{driver_name}://{self.config.username}:{self.config.password}@{self.config.host}:{self.config.port}"
-        
-        # Add database name if specified (for database-specific connections)
-        if self.config.database:
-            return f"{base_url}/{self.config.database}"
-        else:
-            # Server-level connection (for listing databases)
-            return base_url
+        return build_connection_url(self.config)
     
     def _get_connect_args(self) -> Dict[str, Any]:
         """Get driver-specific connection arguments."""
@@ -113,6 +155,10 @@ class DatabaseConnection:
         elif self.config.driver == "postgresql":
             if self.config.ssl_mode:
                 args["sslmode"] = self.config.ssl_mode
+        elif self.config.driver == "sqlite":
+            # Pooled connections are handed between worker threads; wait on locks instead of failing
+            args["check_same_thread"] = False
+            args["timeout"] = 30
         
         return args
     
@@ -139,6 +185,62 @@ class DatabaseConnection:
             logger.error(f"Query execution failed: {e}")
             raise
     
+    @property
+    def bulk_connection(self):
+        """Raw DBAPI connection of this thread's active bulk transaction, if any."""
+        return getattr(self._bulk_state, "connection", None)
+    
+    @contextmanager
+    def bulk_transaction(self) -> Iterator[Any]:
+        """Run a block of writes inside one explicit transaction on a single raw connection.
+        
+        Writers that honour ``bulk_connection`` reuse the yielded connection instead of
+        committing per batch, turning one commit per statement into one per block. The
+        transaction belongs to the calling thread; other threads must be handed the
+        yielded connection explicitly.
+        """
+        if self.bulk_connection is not None:
+            raise RuntimeError("A bulk transaction is already active on this connection")
+        
+        raw_connection = self.engine.raw_connection()
+        dbapi_connection = raw_connection.driver_connection
+        previous_isolation_level = None
+        previous_autocommit = None
+        if self.config.driver == "sqlite":
+            # Disable sqlite3's implicit transactions so BEGIN/COMMIT are ours alone
+            previous_isolation_level = dbapi_connection.isolation_level
+            dbapi_connection.isolation_level = None
+        elif self.config.driver == "postgresql":
+            # Outside autocommit psycopg2 has already opened a transaction, and BEGIN would warn
+            previous_autocommit = dbapi_connection.autocommit
+            dbapi_connection.autocommit = True
+        
+        cursor = raw_connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE" if self.config.driver == "sqlite" else "BEGIN")
+        self._bulk_state.connection = raw_connection
+        try:
+            yield raw_connection
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            self._bulk_state.connection = None
+            if self.config.driver == "sqlite":
+                dbapi_connection.isolation_level = previous_isolation_level
+            elif self.config.driver == "postgresql":
+                dbapi_connection.autocommit = previous_autocommit
+            raw_connection.close()
+    
+    def commit_bulk_transaction(self) -> None:
+        """Commit this thread's bulk transaction's work so far and open the next one."""
+        connection = self.bulk_connection
+        if connection is None:
+            raise RuntimeError("No bulk transaction is active")
+        cursor = connection.cursor()
+        cursor.execute("COMMIT")
+        cursor.execute("BEGIN IMMEDIATE" if self.config.driver == "sqlite" else "BEGIN")
+    
     def test_connection(self) -> bool:
         """Test if the database connection is alive."""
         try:
@@ -177,6 +279,27 @@ class DatabaseConnection:
         self.close()
 
 
+def get_insert_sql(db_connection: DatabaseConnection, table_name: str,
+                   column_names: List[str], group_size: int) -> str:
+    """Return the cached INSERT carrying ``group_size`` rows in its VALUES list.
+    
+    The SQL string is built once per (driver, table, columns, group size) and
+    interned, so batches skip rebuilding and re-joining the placeholder text.
+    """
+    key = (db_connection.config.driver, table_name, tuple(column_names), group_size)
+    sql = _INSERT_SQL_CACHE.get(key)
+    if sql is None:
+        placeholder = '?' if db_connection.engine.dialect.paramstyle == 'qmark' else '%s'
+        row_placeholders = f"({', '.join([placeholder] * len(column_names))})"
+        quoted_columns = ', '.join([db_connection.quote_identifier(col) for col in column_names])
+        quoted_table = db_connection.quote_identifier(table_name)
+        sql = sys.intern(
+            f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES {', '.join([row_placeholders] * group_size)}"
+        )
+        _INSERT_SQL_CACHE[key] = sql
+    return sql
+
+
 def create_database_connection(
     host: str,
     port: int,
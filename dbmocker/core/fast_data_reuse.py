@@ -5,22 +5,27 @@ while respecting database constraints.
 """
 
 import logging
+import queue
+import threading
 import time
 import random
 import uuid
+from itertools import chain
 from typing import List, Dict, Any, Optional, Set, Callable
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from sqlalchemy import text, inspect
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
 
-from .database import DatabaseConnection
+from .database import DatabaseConnection, SQLITE_MAX_VARIABLES, get_insert_sql
 from .models import DatabaseSchema, TableInfo, ColumnInfo, ConstraintType, ColumnType
 
 
 logger = logging.getLogger(__name__)
 
+SAMPLING_STRATEGIES = ("rowid", "bernoulli", "order_by_random")
+
 
 @dataclass
 class DataReuse:
@@ -33,6 +38,8 @@ class DataReuse:
     progress_interval: int = 1000  # Progress update interval
     fk_cache_size: int = 1000  # Size of FK value cache pool (OPTIMIZATION)
     enable_fk_caching: bool = True  # Enable FK value caching for performance
+    multi_row_group_size: int = 100  # Rows per multi-row INSERT ... VALUES statement
+    sampling_strategy: str = "rowid"  # SQLite sampling: 'rowid', 'bernoulli' or 'order_by_random'
 
 
 @dataclass
@@ -44,6 +51,7 @@ class ReusableDataPool:
     constraint_safe_data: List[Dict[str, Any]] = field(default_factory=list)
     primary_keys: Set[Any] = field(default_factory=set)
     unique_values: Dict[str, Set[Any]] = field(default_factory=dict)
+    column_arrays: Dict[str, np.ndarray] = field(default_factory=dict)  # constraint_safe_data by column
     created_at: float = field(default_factory=time.time)
 
 
@@ -143,8 +151,11 @@ class ConstraintAnalyzer:
 class ExistingDataSampler:
     """Samples existing data from database for reuse."""
     
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(self, db_connection: DatabaseConnection, sampling_strategy: str = "rowid"):
+        if sampling_strategy not in SAMPLING_STRATEGIES:
+            raise ValueError(f"Unknown sampling strategy: {sampling_strategy}. Supported: {SAMPLING_STRATEGIES}")
         self.db_connection = db_connection
+        self.sampling_strategy = sampling_strategy
         self.sample_cache = {}
     
     def sample_existing_data(self, table_name: str, sample_size: int = 10000) -> ReusableDataPool:
@@ -162,7 +173,7 @@ class ExistingDataSampler:
         
         # Sample data
         actual_sample_size = min(sample_size, total_rows)
-        sampled_data = self._sample_random_rows(table_name, actual_sample_size)
+        sampled_data = self._sample_random_rows(table_name, actual_sample_size, total_rows)
         
         # Create data pool
         pool = ReusableDataPool(
@@ -192,14 +203,15 @@ class ExistingDataSampler:
             logger.error(f"Failed to get row count for {table_name}: {e}")
             return 0
     
-    def _sample_random_rows(self, table_name: str, sample_size: int) -> List[Dict[str, Any]]:
+    def _sample_random_rows(self, table_name: str, sample_size: int,
+                            total_rows: Optional[int] = None) -> List[Dict[str, Any]]:
         """Sample random rows from a table."""
         try:
             quoted_table = self.db_connection.quote_identifier(table_name)
             
             # Database-specific random sampling
             if self.db_connection.config.driver == "sqlite":
-                query = f"SELECT * FROM {quoted_table} ORDER BY RANDOM() LIMIT {sample_size}"
+                query = self._sqlite_sample_query(quoted_table, sample_size, total_rows)
             elif self.db_connection.config.driver == "postgresql":
                 query = f"SELECT * FROM {quoted_table} TABLESAMPLE SYSTEM(10) LIMIT {sample_size}"
             elif self.db_connection.config.driver == "mysql":
@@ -208,7 +220,16 @@ class ExistingDataSampler:
                 # Fallback
                 query = f"SELECT * FROM {quoted_table} LIMIT {sample_size}"
             
-            result = self.db_connection.execute_query(query)
+            try:
+                result = self.db_connection.execute_query(query)
+            except SQLAlchemyError:
+                if self.db_connection.config.driver != "sqlite" or self.sampling_strategy != "rowid":
+                    raise
+                # WITHOUT ROWID tables have no rowid to shuffle; fall back to a full shuffle
+                logger.debug(f"rowid sampling failed on {table_name}; using ORDER BY RANDOM()")
+                result = self.db_connection.execute_query(
+                    f"SELECT * FROM {quoted_table} ORDER BY RANDOM() LIMIT {sample_size}"
+                )
             
             if not result:
                 return []
@@ -231,6 +252,26 @@ class ExistingDataSampler:
             logger.error(f"Failed to sample data from {table_name}: {e}")
             return []
     
+    def _sqlite_sample_query(self, quoted_table: str, sample_size: int,
+                             total_rows: Optional[int]) -> str:
+        """Build the SQLite sampling query for the configured strategy.
+        
+        'rowid' shuffles only the rowid index and fetches full rows for the winners;
+        'bernoulli' keeps each row independently with probability sample_size/total_rows,
+        a single scan with no sort that may return somewhat fewer rows than requested.
+        """
+        if self.sampling_strategy == "rowid":
+            return (
+                f"SELECT * FROM {quoted_table} WHERE rowid IN "
+                f"(SELECT rowid FROM {quoted_table} ORDER BY RANDOM() LIMIT {sample_size})"
+            )
+        if self.sampling_strategy == "bernoulli" and total_rows:
+            return (
+                f"SELECT * FROM {quoted_table} "
+                f"WHERE abs(random() % {total_rows}) < {sample_size} LIMIT {sample_size}"
+            )
+        return f"SELECT * FROM {quoted_table} ORDER BY RANDOM() LIMIT {sample_size}"
+    
     def _extract_constraint_data(self, pool: ReusableDataPool):
         """Extract constraint-related data from sampled data."""
         if not pool.sampled_data:
@@ -245,6 +286,81 @@ class ExistingDataSampler:
                     pool.unique_values[column_name].add(value)
 
 
+class StorageWorker(threading.Thread):
+    """Background writer draining a bounded queue of columnar batches in one transaction.
+    
+    Reuses the bulk transaction active in the constructing thread, if any; otherwise
+    it opens its own and commits every ``commit_every`` batches. The first write error stops
+    further writes and is re-raised by ``submit``/``finish``.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db_connection: DatabaseConnection, write_batch: Callable[[Any, Any], int],
+                 on_batch_written: Optional[Callable[[int, int], None]] = None,
+                 commit_every: int = 10, max_pending: int = 4):
+        super().__init__(name="dbmocker-storage-worker", daemon=True)
+        self.db_connection = db_connection
+        self.rows_written = 0
+        self._connection = db_connection.bulk_connection  # bulk transactions are per thread
+        self._write_batch = write_batch
+        self._on_batch_written = on_batch_written
+        self._commit_every = commit_every
+        self._queue = queue.Queue(maxsize=max_pending)  # bounded: generation cannot outrun writes
+        self._error: Optional[BaseException] = None
+    
+    def submit(self, batch: Any) -> None:
+        """Queue a batch for writing, blocking while the queue is full."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(batch)
+    
+    def finish(self) -> None:
+        """Flush pending batches, stop the worker and re-raise any write error."""
+        self._queue.put(self._STOP)
+        self.join()
+        if self._error is not None:
+            raise self._error
+    
+    def run(self):
+        try:
+            if self._connection is not None:
+                self._drain(self._connection, owns_transaction=False)
+            else:
+                with self.db_connection.bulk_transaction() as connection:
+                    self._drain(connection, owns_transaction=True)
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+    
+    def _drain(self, connection, owns_transaction: bool):
+        written_batches = 0
+        while True:
+            batch = self._queue.get()
+            if batch is self._STOP:
+                break
+            if self._error is not None:
+                continue  # Keep consuming so a blocked producer can reach finish()
+            
+            try:
+                batch_rows = self._write_batch(connection, batch)
+                self.rows_written += batch_rows
+            except Exception as e:
+                logger.error(f"Storage worker batch failed: {e}")
+                self._error = e
+                continue
+            
+            if self._on_batch_written:
+                self._on_batch_written(self.rows_written, batch_rows)
+            
+            written_batches += 1
+            if owns_transaction and written_batches % self._commit_every == 0:
+                self.db_connection.commit_bulk_transaction()
+        
+        if self._error is not None:
+            raise self._error  # Roll back a transaction this worker owns
+
+
 class FastDataReuser:
     """Ultra-fast data reuser that creates millions of records by reusing existing data."""
     
@@ -256,7 +372,7 @@ class FastDataReuser:
         
         # Initialize components
         self.constraint_analyzer = ConstraintAnalyzer(db_connection, schema)
-        self.data_sampler = ExistingDataSampler(db_connection)
+        self.data_sampler = ExistingDataSampler(db_connection, self.config.sampling_strategy)
         
         # Track unique value counters to ensure truly unique values across millions of records
         self.unique_counters = {}
@@ -264,6 +380,9 @@ class FastDataReuser:
         # Cache for reusable data
         self.data_pools = {}
         
+        # Vectorized random source for template, FK and id columns
+        self.rng = np.random.default_rng()
+        
         # Performance tracking
         self.insertion_stats = {
             'total_rows_inserted': 0,
@@ -297,6 +416,13 @@ class FastDataReuser:
             data_pool, constraints
         )
         
+        # Cache each reusable column as an array so batches are drawn in C, not per row
+        if data_pool.constraint_safe_data:
+            data_pool.column_arrays = {
+                column_name: self._to_object_array([row.get(column_name) for row in data_pool.constraint_safe_data])
+                for column_name in data_pool.constraint_safe_data[0]
+            }
+        
         self.data_pools[table_name] = data_pool
         
         logger.info(f"✅ {table_name} prepared: {len(data_pool.constraint_safe_data):,} reusable records")
@@ -555,10 +681,17 @@ class FastDataReuser:
             return f"reuse_fallback_{random.randint(1, 1000)}"
     
     def fast_insert_millions(self, table_name: str, target_rows: int,
-                           progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
-        """Insert millions of records ultra-fast using data reuse."""
+                           progress_callback: Optional[Callable] = None,
+                           wrap_transaction: bool = True) -> Dict[str, Any]:
+        """Insert millions of records ultra-fast using data reuse.
+        
+        ``progress_callback(table, current, total, batch_size)`` fires at most once per
+        ``progress_interval`` rows. With ``wrap_transaction`` every batch is written inside
+        one bulk transaction; pass False when the caller already holds
+        ``db_connection.bulk_transaction()``.
+        """
         logger.info(f"🚀 Starting ultra-fast insertion: {target_rows:,} rows into {table_name}")
-
+        
         # Prepare table if not already prepared
         if table_name not in self.data_pools:
             if not self.prepare_table_for_fast_insertion(table_name):
@@ -569,6 +702,14 @@ class FastDataReuser:
         if not data_pool.constraint_safe_data:
             raise ValueError(f"No reusable data available for {table_name}")
         
+        if wrap_transaction and self.db_connection.bulk_connection is None:
+            with self.db_connection.bulk_transaction():
+                return self._insert_with_strategy(table_name, target_rows, progress_callback)
+        return self._insert_with_strategy(table_name, target_rows, progress_callback)
+    
+    def _insert_with_strategy(self, table_name: str, target_rows: int,
+                              progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+        """Dispatch to the bulk or batch insertion strategy based on row count."""
         # Use ultra-fast insertion strategy
         if self.config.fast_mode and target_rows >= 100000:
             return self._ultra_fast_bulk_insert(table_name, target_rows, progress_callback)
@@ -577,49 +718,52 @@ class FastDataReuser:
     
     def _ultra_fast_bulk_insert(self, table_name: str, target_rows: int,
                               progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
-        """Ultra-fast bulk insertion using multiple strategies."""
+        """Ultra-fast bulk insertion overlapping batch generation with a background writer."""
         logger.info(f"⚡ Using ultra-fast bulk insertion for {target_rows:,} rows")
         
         start_time = time.time()  # Add start_time to this method scope
         data_pool = self.data_pools[table_name]
         batch_size = 50000  # Large batches for maximum speed
-        total_inserted = 0
         
-        # Pre-generate all data in memory (for maximum speed)
-        logger.info("📦 Pre-generating reusable data in memory...")
-        all_data = self._pre_generate_reusable_data(data_pool, target_rows)
+        # OPTIMIZATION 1: Pre-cache FK values to avoid per-row database queries
+        fk_value_cache = {}
+        if self.config.enable_fk_caching:
+            cache_start = time.time()
+            fk_value_cache = self._build_fk_value_cache(
+                data_pool, min(target_rows, self.config.fk_cache_size)
+            )
+            cache_time = time.time() - cache_start
+            logger.info(f"✅ FK caching completed in {cache_time:.2f}s ({len(fk_value_cache)} columns)")
+        next_ids = self._get_next_ids(table_name)
         
-        logger.info(f"💾 Pre-generated {len(all_data):,} rows, starting bulk insertion...")
+        notify_progress = self._throttled_progress(progress_callback, table_name, target_rows)
         
-        # Insert in large batches with parallel processing
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            
-            for batch_start in range(0, len(all_data), batch_size):
-                batch_end = min(batch_start + batch_size, len(all_data))
-                batch_data = all_data[batch_start:batch_end]
-                
-                future = executor.submit(self._insert_batch_ultra_fast, table_name, batch_data)
-                futures.append((future, len(batch_data)))
+        def report_progress(total_inserted: int, batch_rows: int):
+            notify_progress(total_inserted, batch_rows)
             
-            # Collect results with progress tracking
-            for future, batch_size in futures:
-                try:
-                    rows_inserted = future.result(timeout=300)  # 5 minute timeout
-                    total_inserted += rows_inserted
-                    
-                    if progress_callback and total_inserted % self.config.progress_interval == 0:
-                        progress_callback(table_name, total_inserted, target_rows)
-                    
-                    # Log progress every 50K rows
-                    if total_inserted % 50000 == 0:
-                        elapsed = time.time() - start_time
-                        rate = total_inserted / elapsed if elapsed > 0 else 0
-                        logger.info(f"📈 Progress: {total_inserted:,}/{target_rows:,} rows ({rate:,.0f} rows/s)")
-                
-                except Exception as e:
-                    logger.error(f"Batch insertion failed: {e}")
+            # Log progress every 50K rows
+            if total_inserted % 50000 == 0:
+                elapsed = time.time() - start_time
+                rate = total_inserted / elapsed if elapsed > 0 else 0
+                logger.info(f"📈 Progress: {total_inserted:,}/{target_rows:,} rows ({rate:,.0f} rows/s)")
+        
+        # OPTIMIZATION 2: the worker writes batch N while batch N+1 is being generated
+        worker = StorageWorker(
+            self.db_connection,
+            lambda connection, batch_columns: self._insert_batch_ultra_fast(table_name, batch_columns, connection),
+            on_batch_written=report_progress
+        )
+        worker.start()
+        try:
+            for batch_start in range(0, target_rows, batch_size):
+                current_batch_size = min(batch_size, target_rows - batch_start)
+                worker.submit(self._generate_reusable_batch(
+                    data_pool, current_batch_size, fk_value_cache, next_ids
+                ))
+        finally:
+            worker.finish()
         
+        total_inserted = worker.rows_written
         total_time = time.time() - start_time
         avg_rate = total_inserted / total_time if total_time > 0 else 0
         
@@ -644,21 +788,27 @@ class FastDataReuser:
         total_inserted = 0
         start_time = time.time()
         
+        # Resolve FK pools and the next free ids once for the whole run
+        fk_value_cache = self._build_fk_value_cache(data_pool, min(batch_size, 100))
+        next_ids = self._get_next_ids(data_pool.table_name)
+        
+        notify_progress = self._throttled_progress(progress_callback, table_name, target_rows)
+        
         with tqdm(total=target_rows, desc=f"Inserting {table_name}", unit="rows") as pbar:
             for batch_start in range(0, target_rows, batch_size):
                 current_batch_size = min(batch_size, target_rows - batch_start)
                 
                 # Generate batch data
-                batch_data = self._generate_reusable_batch(data_pool, current_batch_size)
+                batch_columns = self._generate_reusable_batch(
+                    data_pool, current_batch_size, fk_value_cache, next_ids
+                )
                 
                 # Insert batch
-                rows_inserted = self._insert_batch_fast(table_name, batch_data)
+                rows_inserted = self._insert_batch_fast(table_name, batch_columns)
                 total_inserted += rows_inserted
                 
                 pbar.update(rows_inserted)
-                
-                if progress_callback and total_inserted % self.config.progress_interval == 0:
-                    progress_callback(table_name, total_inserted, target_rows)
+                notify_progress(total_inserted, rows_inserted)
         
         total_time = time.time() - start_time
         avg_rate = total_inserted / total_time if total_time > 0 else 0
@@ -674,256 +824,275 @@ class FastDataReuser:
         
         return result
     
-    def _pre_generate_reusable_data(self, data_pool: ReusableDataPool, target_rows: int) -> List[Dict[str, Any]]:
-        """Pre-generate all reusable data in memory for maximum speed."""
-        if not data_pool.constraint_safe_data:
-            return []
-        
-        logger.info(f"🚀 Pre-generating {target_rows:,} rows for {data_pool.table_name}...")
-        start_time = time.time()
-        
-        all_data = []
-        pool_size = len(data_pool.constraint_safe_data)
-        
-        # Get constraints for this table to handle unique columns
+    def _throttled_progress(self, progress_callback: Optional[Callable], table_name: str,
+                            target_rows: int) -> Callable[[int, int], None]:
+        """Wrap a progress callback so it fires at most once per ``progress_interval`` rows."""
+        interval = max(self.config.progress_interval, 1)
+        last_step = 0
+        
+        def notify(total_inserted: int, batch_rows: int):
+            nonlocal last_step
+            step = total_inserted // interval
+            if progress_callback and (step > last_step or total_inserted == target_rows):
+                last_step = step
+                progress_callback(table_name, total_inserted, target_rows, batch_rows)
+        
+        return notify
+    
+    def _build_fk_value_cache(self, data_pool: ReusableDataPool, pool_size: int) -> Dict[str, np.ndarray]:
+        """Fetch a pool of valid values for every FK column of the table."""
         constraints = self.constraint_analyzer.analyze_table_constraints(data_pool.table_name)
-        unique_columns = set(constraints.get('unique_columns', []))
-        fk_columns = set(constraints.get('foreign_keys', []))
+        fk_columns = set(constraints.get('foreign_keys', [])) - set(self._get_id_columns(data_pool.table_name))
+        table_info = self.schema.get_table(data_pool.table_name)
         
-        # Get table info for column details
-        table_info = None
-        for table in self.schema.tables:
-            if table.name == data_pool.table_name:
-                table_info = table
-                break
-        
-        # OPTIMIZATION 1: Pre-cache FK values to avoid per-row database queries
         fk_value_cache = {}
-        if table_info and fk_columns and self.config.enable_fk_caching:
-            logger.info(f"🔄 Pre-caching FK values for {len(fk_columns)} foreign key columns...")
-            cache_start = time.time()
-            
-            for column_info in table_info.columns:
-                column_name = column_info.name
-                if column_name in fk_columns:
-                    # Get a pool of valid FK values for this column (instead of querying for each row)
-                    cache_size = min(target_rows, self.config.fk_cache_size)
-                    fk_value_pool = self._get_fk_value_pool(column_info, data_pool.table_name, cache_size)
-                    if fk_value_pool:
-                        fk_value_cache[column_name] = fk_value_pool
-                        logger.debug(f"  Cached {len(fk_value_pool)} values for FK column {column_name}")
-            
-            cache_time = time.time() - cache_start
-            logger.info(f"✅ FK caching completed in {cache_time:.2f}s")
-        
-        # Use numpy for ultra-fast random selection
-        indices = np.random.randint(0, pool_size, size=target_rows)
+        if not table_info or not fk_columns:
+            return fk_value_cache
+        
+        for column_info in table_info.columns:
+            if column_info.name in fk_columns:
+                fk_value_pool = self._get_fk_value_pool(column_info, data_pool.table_name, pool_size)
+                if fk_value_pool:
+                    if all(isinstance(value, int) for value in fk_value_pool):
+                        fk_value_cache[column_info.name] = np.asarray(fk_value_pool, dtype=np.int64)
+                    else:
+                        fk_value_cache[column_info.name] = self._to_object_array(fk_value_pool)
+                    logger.debug(f"  Cached {len(fk_value_pool)} values for FK column {column_info.name}")
         
-        # OPTIMIZATION 2: Process in batches with progress tracking
-        batch_size = 10000
-        progress_logged = 0
+        return fk_value_cache
+    
+    def _get_id_columns(self, table_name: str) -> List[str]:
+        """Get integer primary key columns that must be filled with fresh sequential ids."""
+        table_info = self.schema.get_table(table_name)
+        if not table_info:
+            return []
         
-        for batch_start in range(0, target_rows, batch_size):
-            batch_end = min(batch_start + batch_size, target_rows)
-            
-            for i in range(batch_start, batch_end):
-                row_data = data_pool.constraint_safe_data[indices[i]].copy()
-                
-                # For unique columns, generate fresh unique values for each row
-                # For foreign key columns, use cached FK values
-                if table_info:
-                    for column_info in table_info.columns:
-                        column_name = column_info.name
-                        # Priority: FK columns first (even if they're unique), then regular unique columns
-                        if column_name in fk_columns:
-                            # OPTIMIZATION: Use cached FK values instead of database queries
-                            if column_name in fk_value_cache:
-                                # Randomly select from cached FK values
-                                cached_values = fk_value_cache[column_name]
-                                row_data[column_name] = random.choice(cached_values)
-                            else:
-                                # Fallback: single query (but this should be rare now)
-                                valid_fk_value = self._get_valid_foreign_key_value(column_info, data_pool.table_name)
-                                if valid_fk_value is not None:
-                                    row_data[column_name] = valid_fk_value
-                        elif column_name in unique_columns:
-                            # Generate a fresh unique value for non-FK unique columns
-                            unique_value = self._generate_unique_value_for_column(column_info, data_pool.table_name)
-                            row_data[column_name] = unique_value
-                
-                all_data.append(row_data)
-            
-            # Progress logging every batch
-            if batch_end - progress_logged >= batch_size:
-                elapsed = time.time() - start_time
-                rate = batch_end / elapsed if elapsed > 0 else 0
-                progress = (batch_end / target_rows) * 100
-                logger.info(f"  📊 Pre-generation progress: {batch_end:,}/{target_rows:,} ({progress:.1f}%) | {rate:,.0f} rows/s")
-                progress_logged = batch_end
+        constraints = self.constraint_analyzer.analyze_table_constraints(table_name)
+        primary_keys = constraints.get('primary_keys', [])
+        if len(primary_keys) != 1:
+            return []
         
-        total_time = time.time() - start_time
-        avg_rate = target_rows / total_time if total_time > 0 else 0
-        logger.info(f"✅ Pre-generation completed: {len(all_data):,} rows in {total_time:.2f}s ({avg_rate:,.0f} rows/s)")
+        # Explicit FK-backed keys (1:1 tables) keep drawing from the referenced table
+        explicit_fk_columns = {column for fk in table_info.foreign_keys for column in fk.columns}
+        column_info = table_info.get_column(primary_keys[0])
+        if (column_info is None or column_info.is_auto_increment
+                or column_info.name in explicit_fk_columns
+                or column_info.data_type not in [ColumnType.INTEGER, ColumnType.BIGINT, ColumnType.SMALLINT]):
+            return []
         
-        return all_data
+        return [column_info.name]
     
-    def _generate_reusable_batch(self, data_pool: ReusableDataPool, batch_size: int) -> List[Dict[str, Any]]:
-        """Generate a batch of reusable data with fresh unique values for each row."""
+    def _get_next_ids(self, table_name: str) -> Dict[str, int]:
+        """Get the next free value of each sequential id column."""
+        quoted_table = self.db_connection.quote_identifier(table_name)
+        next_ids = {}
+        for column_name in self._get_id_columns(table_name):
+            quoted_column = self.db_connection.quote_identifier(column_name)
+            result = self.db_connection.execute_query(f"SELECT MAX({quoted_column}) FROM {quoted_table}")
+            max_id = result[0][0] if result and result[0][0] is not None else 0
+            next_ids[column_name] = int(max_id) + 1
+        return next_ids
+    
+    @staticmethod
+    def _is_dense_pk_reference(fk_values: np.ndarray) -> bool:
+        """Check whether an FK pool holds every id from 1 to its size."""
+        return (fk_values.dtype == np.int64 and fk_values.size > 0
+                and fk_values.min() == 1 and fk_values.max() == fk_values.size)
+    
+    @staticmethod
+    def _to_object_array(values: List[Any]) -> np.ndarray:
+        """Build a 1-D object array without NumPy unpacking nested values."""
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    
+    @staticmethod
+    def _slice_columns(columns: Dict[str, List[Any]], start: int, end: int) -> Dict[str, List[Any]]:
+        """Slice every column of a columnar batch to the same row range."""
+        return {name: values[start:end] for name, values in columns.items()}
+    
+    def _generate_reusable_batch(self, data_pool: ReusableDataPool, batch_size: int,
+                                 fk_value_cache: Dict[str, np.ndarray],
+                                 next_ids: Dict[str, int]) -> Dict[str, List[Any]]:
+        """Generate a columnar batch of reusable data with fresh unique values for each row.
+        
+        Template values are drawn with one NumPy call per column; ``next_ids`` is
+        advanced in place so consecutive batches keep their ids disjoint.
+        """
         if not data_pool.constraint_safe_data:
-            return []
+            return {}
         
-        batch_data = []
-
         # Get constraints for this table
         constraints = self.constraint_analyzer.analyze_table_constraints(data_pool.table_name)
         unique_columns = set(constraints.get('unique_columns', []))
         fk_columns = set(constraints.get('foreign_keys', []))
+        table_info = self.schema.get_table(data_pool.table_name)
         
-        # Get table info for column details
-        table_info = None
-        for table in self.schema.tables:
-            if table.name == data_pool.table_name:
-                table_info = table
-                break
-        
-        # OPTIMIZATION: Cache FK values for the batch to avoid repeated queries
-        fk_value_cache = {}
-        if table_info and fk_columns:
-            for column_info in table_info.columns:
-                column_name = column_info.name
-                if column_name in fk_columns:
-                    # Get a small pool of FK values for this batch
-                    fk_value_pool = self._get_fk_value_pool(column_info, data_pool.table_name, min(batch_size, 100))
-                    if fk_value_pool:
-                        fk_value_cache[column_name] = fk_value_pool
-        
-        for _ in range(batch_size):
-            # Randomly select a row from constraint-safe data as template
-            source_row = random.choice(data_pool.constraint_safe_data)
-            new_row = source_row.copy()
-            
-            # For unique columns, generate fresh unique values for each row
-            # For foreign key columns, use cached FK values  
-            if table_info:
-                for column_info in table_info.columns:
-                    column_name = column_info.name
-                    # Priority: FK columns first (even if they're unique), then regular unique columns
-                    if column_name in fk_columns:
-                        # OPTIMIZATION: Use cached FK values instead of database queries
-                        if column_name in fk_value_cache:
-                            # Randomly select from cached FK values
-                            cached_values = fk_value_cache[column_name]
-                            new_row[column_name] = random.choice(cached_values)
-                        else:
-                            # Fallback: single query (but this should be rare now)
-                            logger.debug(f"Processing FK column {column_name}, getting valid FK value...")
-                            valid_fk_value = self._get_valid_foreign_key_value(column_info, data_pool.table_name)
-                            if valid_fk_value is not None:
-                                new_row[column_name] = valid_fk_value
-                                logger.debug(f"Replaced FK value for {column_name}: {valid_fk_value}")
-                            else:
-                                logger.warning(f"Could not get valid FK value for {column_name}, keeping original")
-                    elif column_name in unique_columns:
-                        # Generate a fresh unique value for non-FK unique columns
-                        unique_value = self._generate_unique_value_for_column(column_info, data_pool.table_name)
-                        new_row[column_name] = unique_value
-                        logger.debug(f"Generated unique value for {column_name}: {unique_value}")
-            
-            batch_data.append(new_row)
+        # Pick template rows once and gather every column with fancy indexing
+        row_indices = self.rng.integers(0, len(data_pool.constraint_safe_data), size=batch_size)
+        columns = {
+            column_name: values[row_indices].tolist()
+            for column_name, values in data_pool.column_arrays.items()
+        }
         
-        return batch_data
+        if not table_info:
+            return columns
+        
+        for column_info in table_info.columns:
+            column_name = column_info.name
+            if column_name in next_ids:
+                # Sequential ids can never collide with existing or earlier rows
+                next_id = next_ids[column_name]
+                columns[column_name] = np.arange(next_id, next_id + batch_size).tolist()
+                next_ids[column_name] = next_id + batch_size
+            elif column_name in fk_columns:
+                # FK columns draw from the cached pool; without one the template value stays
+                if column_name in fk_value_cache:
+                    fk_values = fk_value_cache[column_name]
+                    if self._is_dense_pk_reference(fk_values):
+                        # Pool is exactly 1..N: draw ids directly instead of indexing the pool
+                        columns[column_name] = self.rng.integers(
+                            1, len(fk_values) + 1, size=batch_size, dtype=np.int64
+                        ).tolist()
+                    else:
+                        columns[column_name] = self.rng.choice(
+                            fk_values, size=batch_size, replace=True, shuffle=False
+                        ).tolist()
+            elif column_name in unique_columns:
+                # Generate a fresh unique value for non-FK unique columns
+                columns[column_name] = [
+                    self._generate_unique_value_for_column(column_info, data_pool.table_name)
+                    for _ in range(batch_size)
+                ]
+        
+        return columns
     
-    def _insert_batch_ultra_fast(self, table_name: str, batch_data: List[Dict[str, Any]]) -> int:
+    def _insert_batch_ultra_fast(self, table_name: str, batch_columns: Dict[str, List[Any]],
+                                 connection=None) -> int:
         """Insert a batch with ultra-fast optimizations and improved error handling."""
-        if not batch_data:
+        if not batch_columns:
             return 0
         
         # For very large batches, split them to reduce constraint collision risk
         max_batch_size = 10000  # Smaller batches for better constraint handling
-        if len(batch_data) > max_batch_size:
+        row_count = len(next(iter(batch_columns.values())))
+        if row_count > max_batch_size:
             total_inserted = 0
-            for i in range(0, len(batch_data), max_batch_size):
-                chunk = batch_data[i:i + max_batch_size]
+            for i in range(0, row_count, max_batch_size):
+                chunk = self._slice_columns(batch_columns, i, i + max_batch_size)
                 try:
-                    inserted = self._insert_single_chunk_ultra_fast(table_name, chunk)
+                    inserted = self._insert_single_chunk_ultra_fast(table_name, chunk, connection)
                     total_inserted += inserted
                 except Exception as e:
                     logger.warning(f"Chunk insertion failed, falling back to individual inserts: {e}")
                     # Try individual inserts for this chunk to identify problem records
-                    for row in chunk:
+                    for j in range(len(next(iter(chunk.values())))):
                         try:
-                            individual_inserted = self._insert_single_chunk_ultra_fast(table_name, [row])
+                            row = self._slice_columns(chunk, j, j + 1)
+                            individual_inserted = self._insert_single_chunk_ultra_fast(table_name, row, connection)
                             total_inserted += individual_inserted
                         except Exception as row_error:
                             logger.debug(f"Skipping problematic row: {row_error}")
                             continue
             return total_inserted
         else:
-            return self._insert_single_chunk_ultra_fast(table_name, batch_data)
+            return self._insert_single_chunk_ultra_fast(table_name, batch_columns, connection)
     
-    def _insert_single_chunk_ultra_fast(self, table_name: str, batch_data: List[Dict[str, Any]]) -> int:
+    def _insert_single_chunk_ultra_fast(self, table_name: str, batch_columns: Dict[str, List[Any]],
+                                        connection=None) -> int:
         """Insert a single chunk with ultra-fast optimizations."""
-        if not batch_data:
+        if not batch_columns:
             return 0
         
         try:
-            with self.db_connection.get_session() as session:
-                # Disable integrity checks for maximum speed
-                if self.db_connection.config.driver == "sqlite":
-                    session.execute(text("PRAGMA synchronous = OFF"))
-                    session.execute(text("PRAGMA journal_mode = MEMORY"))
-                    session.execute(text("PRAGMA cache_size = 100000"))
-                elif self.db_connection.config.driver == "postgresql":
-                    session.execute(text("SET synchronous_commit = OFF"))
-                    session.execute(text("SET wal_buffers = '32MB'"))
-                elif self.db_connection.config.driver == "mysql":
-                    session.execute(text("SET autocommit = 0"))
-                    session.execute(text("SET unique_checks = 0"))
-                    session.execute(text("SET foreign_key_checks = 0"))
-                
-                # Build bulk insert query
-                column_names = list(batch_data[0].keys())
-                placeholders = ', '.join([f':{col}' for col in column_names])
-                quoted_columns = ', '.join([self.db_connection.quote_identifier(col) for col in column_names])
-                quoted_table = self.db_connection.quote_identifier(table_name)
-                
-                query = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
-                
-                # Execute bulk insert
-                session.execute(text(query), batch_data)
-                session.commit()
-                
-                return len(batch_data)
+            return self._execute_columnar_insert(table_name, batch_columns, ultra_fast=True, connection=connection)
         
         except Exception as e:
             logger.error(f"Ultra-fast chunk insert failed: {e}")
             raise
     
-    def _insert_batch_fast(self, table_name: str, batch_data: List[Dict[str, Any]]) -> int:
+    def _insert_batch_fast(self, table_name: str, batch_columns: Dict[str, List[Any]]) -> int:
         """Insert a batch with fast optimizations."""
-        if not batch_data:
+        if not batch_columns:
             return 0
         
         try:
-            with self.db_connection.get_session() as session:
-                # Build insert query
-                column_names = list(batch_data[0].keys())
-                placeholders = ', '.join([f':{col}' for col in column_names])
-                quoted_columns = ', '.join([self.db_connection.quote_identifier(col) for col in column_names])
-                quoted_table = self.db_connection.quote_identifier(table_name)
-                
-                query = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
-                
-                # Execute batch insert
-                session.execute(text(query), batch_data)
-                session.commit()
-                
-                return len(batch_data)
+            return self._execute_columnar_insert(table_name, batch_columns)
         
         except Exception as e:
             logger.error(f"Fast batch insert failed: {e}")
             raise
     
+    def _execute_columnar_insert(self, table_name: str, batch_columns: Dict[str, List[Any]],
+                                 ultra_fast: bool = False, connection=None) -> int:
+        """Zip a columnar batch into row tuples and hand them to a single DBAPI executemany.
+        
+        ``connection`` (or the active bulk connection) is written without committing.
+        """
+        column_names = list(batch_columns.keys())
+        rows = list(zip(*batch_columns.values()))
+        row_count = len(rows)
+        
+        # Pack several rows into each statement, staying under the bind-parameter limit
+        group_size = self.config.multi_row_group_size
+        if self.db_connection.config.driver == "sqlite":
+            group_size = min(group_size, SQLITE_MAX_VARIABLES // len(column_names))
+        group_size = max(group_size, 1)
+        
+        bulk_connection = connection or self.db_connection.bulk_connection
+        if bulk_connection is not None:
+            # Inside a bulk transaction: a savepoint keeps a failed batch all-or-nothing
+            cursor = bulk_connection.cursor()
+            cursor.execute("SAVEPOINT dbmocker_batch")
+            try:
+                self._execute_grouped_rows(cursor, table_name, column_names, rows, group_size)
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT dbmocker_batch")
+                cursor.execute("RELEASE SAVEPOINT dbmocker_batch")
+                raise
+            cursor.execute("RELEASE SAVEPOINT dbmocker_batch")
+            return row_count
+        
+        raw_connection = self.db_connection.engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            if ultra_fast:
+                # Disable integrity checks for maximum speed
+                # (journal mode and cache size for SQLite are set when the connection opens)
+                if self.db_connection.config.driver == "sqlite":
+                    cursor.execute("PRAGMA synchronous = OFF")
+                elif self.db_connection.config.driver == "postgresql":
+                    cursor.execute("SET synchronous_commit = OFF")
+                    cursor.execute("SET wal_buffers = '32MB'")
+                elif self.db_connection.config.driver == "mysql":
+                    cursor.execute("SET autocommit = 0")
+                    cursor.execute("SET unique_checks = 0")
+                    cursor.execute("SET foreign_key_checks = 0")
+            
+            self._execute_grouped_rows(cursor, table_name, column_names, rows, group_size)
+            raw_connection.commit()
+            return row_count
+        except Exception:
+            raw_connection.rollback()
+            raise
+        finally:
+            raw_connection.close()
+    
+    def _execute_grouped_rows(self, cursor, table_name: str, column_names: List[str],
+                              rows: List[tuple], group_size: int) -> None:
+        """Send full groups through the multi-row statement and the remainder row by row."""
+        grouped_rows = len(rows) - len(rows) % group_size
+        if grouped_rows:
+            cursor.executemany(
+                get_insert_sql(self.db_connection, table_name, column_names, group_size),
+                [list(chain.from_iterable(rows[i:i + group_size])) for i in range(0, grouped_rows, group_size)]
+            )
+        if grouped_rows < len(rows):
+            cursor.executemany(
+                get_insert_sql(self.db_connection, table_name, column_names, 1),
+                rows[grouped_rows:]
+            )
+    
     def get_reuse_statistics(self, table_name: str) -> Dict[str, Any]:
         """Get statistics about data reuse for a table."""
         if table_name not in self.data_pools:
@@ -949,7 +1118,8 @@ class FastDataReuser:
 
 def create_fast_data_reuser(db_connection: DatabaseConnection, schema: DatabaseSchema,
                           sample_size: int = 10000, fast_mode: bool = True, 
-                          enable_fk_caching: bool = True, fk_cache_size: int = 1000) -> FastDataReuser:
+                          enable_fk_caching: bool = True, fk_cache_size: int = 1000,
+                          sampling_strategy: str = "rowid") -> FastDataReuser:
     """Factory function to create a FastDataReuser."""
     config = DataReuse(
         enable_data_reuse=True,
@@ -958,7 +1128,8 @@ def create_fast_data_reuser(db_connection: DatabaseConnection, schema: DatabaseS
         fast_mode=fast_mode,
         progress_interval=1000,
         fk_cache_size=fk_cache_size,
-        enable_fk_caching=enable_fk_caching
+        enable_fk_caching=enable_fk_caching,
+        sampling_strategy=sampling_strategy
     )
     
     return FastDataReuser(db_connection, schema, config)
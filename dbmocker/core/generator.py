@@ -4,14 +4,18 @@ import logging
 import random
 import re
 import string
+import sys
 import uuid
+from array import array
 from datetime import datetime, timedelta, date
 from decimal import Decimal
-from typing import Any, List, Dict, Optional, Union, Callable, Set
+from typing import Any, List, Dict, Optional, Union, Callable, Set, Iterator
 from faker import Faker
+import numpy as np
 import json
 from sqlalchemy import text
 
+from .kernels_numba import fill_choice
 from .models import (
     TableInfo, ColumnInfo, ConstraintInfo, DatabaseSchema,
     ColumnType, ConstraintType, GenerationConfig, TableGenerationConfig,
@@ -21,26 +25,64 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Pool picks drawn per NumPy call once a smart-duplicate pool is full
+SMART_DUPLICATE_BLOCK_SIZE = 4096
+
+# Rows of plain ENUM values drawn per random.choices call during row generation
+ENUM_BATCH_SIZE = 1024
+
+# Generated key values kept per column as a fallback pool for foreign keys
+GENERATED_KEY_CACHE_LIMIT = 100_000
+
 
 class DataGenerator:
     """Generates realistic mock data respecting database constraints."""
     
-    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection=None):
-        """Initialize data generator with schema and configuration."""
+    # Custom generator name -> Faker provider it calls
+    CUSTOM_FAKER_PROVIDERS = {
+        'name': 'name',
+        'email': 'email',
+        'phone': 'phone_number',
+        'address': 'address',
+        'company': 'company',
+        'username': 'user_name',
+        'password': 'password',
+        'credit_card': 'credit_card_number',
+        'ip_address': 'ipv4',
+        'url': 'url',
+        'country': 'country',
+        'city': 'city',
+        'state': 'state',
+        'zipcode': 'zipcode',
+    }
+    
+    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection=None,
+                 faker: Optional[Faker] = None):
+        """Initialize data generator with schema and configuration.
+        
+        An existing ``faker`` can be passed in to skip Faker's provider setup; with
+        ``config.seed`` set it is reseeded, so its output is reproducible as well.
+        """
         self.schema = schema
         self.config = config
         self.db_connection = db_connection
-        self.faker = Faker()
+        self.faker = faker or Faker()
         
         # Set random seed for reproducibility
         if config.seed is not None:
             random.seed(config.seed)
             Faker.seed(config.seed)
+            if faker is not None:
+                # Faker.seed does not reach instances already seeded with seed_instance()
+                self.faker.seed_instance(config.seed)
         
         # Cache for generated values to maintain referential integrity
-        self._generated_values: Dict[str, Dict[str, List[Any]]] = {}
+        self._generated_values: Dict[str, Dict[str, Union[array, List[Any]]]] = {}
         self._existing_values: Dict[str, Dict[str, Set[Any]]] = {}
         self._primary_key_counters: Dict[str, int] = {}
+        self._constant_columns: Dict[str, Dict[str, Any]] = {}
+        self._enum_batch_columns: Dict[str, List[ColumnInfo]] = {}
+        self._cached_key_columns: Dict[str, List[str]] = {}
         
         # Stop flag for halting generation mid-process
         self.stop_flag = None
@@ -65,10 +107,6 @@ class DataGenerator:
             from .pattern_analyzer import PatternBasedGenerator
             self._pattern_generator = PatternBasedGenerator(self.schema.table_patterns)
     
-    def _build_custom_generators(self) -> Dict[str, Callable]:
-        """Build custom generator functions."""
-        return {}
-    
     def _generate_fallback_value_for_not_null_column(self, column: ColumnInfo) -> Any:
         """Generate a safe fallback value for NOT NULL columns when other methods fail."""
         logger.info(f"Generating fallback value for NOT NULL column {column.name} ({column.data_type})")
@@ -121,30 +159,62 @@ class DataGenerator:
         self.stop_flag = stop_flag
     
     def generate_data_for_table(self, table_name: str, num_rows: int) -> List[Dict[str, Any]]:
-        """Generate data for a specific table."""
+        """Generate data for a specific table.
+        
+        Raises ValueError if the table is not in the schema.
+        """
+        generated_rows = []
+        for chunk in self.generate_data_for_table_iter(table_name, num_rows, chunk_size=num_rows):
+            generated_rows.extend(chunk)
+        
+        logger.info(f"Successfully generated {len(generated_rows)} rows for {table_name}")
+        return generated_rows
+    
+    def generate_data_for_table_iter(self, table_name: str, num_rows: int,
+                                     chunk_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield generated rows for a table in chunks of ``chunk_size`` (default: ``config.batch_size``).
+        
+        Only the current chunk of rows is held, so callers can insert it and let it be
+        reclaimed; beyond that, only key columns are cached (see ``_cache_generated_values``).
+        Raises ValueError if the table is not in the schema.
+        """
         table = self.schema.get_table(table_name)
-        if not table:
-            logger.warning(f"Table {table_name} not found in schema, skipping generation")
-            return []
+        if table is None:
+            raise ValueError(f"Table {table_name} not found in schema")
         
         logger.info(f"Generating {num_rows} rows for table: {table_name}")
         
-        generated_rows = []
+        chunk_size = max(1, chunk_size or self.config.batch_size)
+        chunk = []
         table_config = self.config.table_configs.get(table_name, TableGenerationConfig())
         
         # Initialize value cache for this table
         if table_name not in self._generated_values:
             self._generated_values[table_name] = {}
         
+        enum_columns = self._enum_batch_columns.get(table_name)
+        if enum_columns is None:
+            enum_columns = self._enum_batch_columns[table_name] = self._get_enum_batch_columns(table, table_config)
+        enum_draws: Dict[str, List[str]] = {}
+        
         for i in range(num_rows):
             # Check stop flag every 100 rows for responsiveness
             if self.stop_flag and i % 100 == 0 and self.stop_flag.is_set():
                 logger.info(f"🛑 Generation stopped at row {i + 1}/{num_rows} for table {table_name}")
                 break
+            
+            # Plain ENUM columns are drawn ENUM_BATCH_SIZE rows at a time
+            presampled = None
+            if enum_columns:
+                offset = i % ENUM_BATCH_SIZE
+                if offset == 0:
+                    n = min(ENUM_BATCH_SIZE, num_rows - i)
+                    enum_draws = {column.name: self._generate_enum_batch(column, n) for column in enum_columns}
+                presampled = {name: values[offset] for name, values in enum_draws.items()}
                 
             try:
-                row = self._generate_row(table, table_config)
-                generated_rows.append(row)
+                row = self._generate_row(table, table_config, presampled)
+                chunk.append(row)
                 
                 # Cache generated values for FK references
                 self._cache_generated_values(table_name, row)
@@ -155,13 +225,24 @@ class DataGenerator:
             except Exception as e:
                 logger.error(f"Failed to generate row {i + 1} for {table_name}: {e}")
                 continue
+            
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
         
-        logger.info(f"Successfully generated {len(generated_rows)} rows for {table_name}")
-        return generated_rows
+        if chunk:
+            yield chunk
     
-    def _generate_row(self, table: TableInfo, table_config: TableGenerationConfig) -> Dict[str, Any]:
-        """Generate a single row of data for a table."""
+    def _generate_row(self, table: TableInfo, table_config: TableGenerationConfig,
+                      presampled: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate a single row of data for a table.
+        
+        ``presampled`` holds values already drawn for this row (see ``_get_enum_batch_columns``).
+        """
         row = {}
+        constants = self._constant_columns.get(table.name)
+        if constants is None:
+            constants = self._constant_columns[table.name] = self._get_constant_columns(table, table_config)
         
         # First pass: generate all columns EXCEPT auto-increment columns (including FK columns with configuration)
         for column in table.columns:
@@ -169,6 +250,12 @@ class DataGenerator:
             if hasattr(column, 'is_auto_increment') and column.is_auto_increment:
                 logger.debug(f"Skipping auto-increment column {column.name}")
                 continue
+            if column.name in constants:
+                row[column.name] = constants[column.name]
+                continue
+            if presampled and column.name in presampled:
+                row[column.name] = presampled[column.name]
+                continue
             row[column.name] = self._generate_column_value(column, table_config, table)
         
         # Second pass: generate FK columns with proper references (but respect column configuration and skip auto-increment)
@@ -193,6 +280,51 @@ class DataGenerator:
         
         return row
     
+    def _get_constant_columns(self, table: TableInfo,
+                              table_config: TableGenerationConfig) -> Dict[str, Any]:
+        """Columns whose value is fixed for every row, resolved once per table.
+        
+        These are ``allow_duplicates`` columns with an explicit ``duplicate_value``
+        that no global duplicate mode overrides; rows take the value directly
+        instead of going through ``_generate_column_value``.
+        """
+        constants = {}
+        for column in table.columns:
+            column_config = table_config.column_configs.get(column.name)
+            if (column_config is None or column_config.duplicate_mode != "allow_duplicates"
+                    or column_config.duplicate_value is None):
+                continue
+            if self.config.duplicate_allowed and self._can_allow_duplicates(table, column.name):
+                continue
+            value = column_config.duplicate_value
+            constants[column.name] = sys.intern(value) if isinstance(value, str) else value
+        return constants
+    
+    def _get_enum_batch_columns(self, table: TableInfo,
+                                table_config: TableGenerationConfig) -> List[ColumnInfo]:
+        """ENUM columns whose value is a plain uniform pick from ``enum_values``, resolved once per table.
+        
+        These are the columns for which ``_generate_column_value`` would end in
+        ``random.choice(column.enum_values)``: no column config, no duplicate mode,
+        default, key, uniqueness or pattern handling. Rows take them from
+        ``_generate_enum_batch`` draws instead.
+        """
+        if self._pattern_generator:
+            return []
+        fk_columns = {name for fk in table.foreign_keys for name in fk.columns}
+        return [
+            column for column in table.columns
+            if column.data_type == ColumnType.ENUM and column.enum_values
+            and not column.is_auto_increment and not column.detected_pattern
+            and column.name not in table_config.column_configs
+            and column.name not in fk_columns
+            and not (self.config.duplicate_allowed and self._can_allow_duplicates(table, column.name))
+            and not (not column.is_nullable and self._has_default_value(column))
+            and not self._is_primary_key_column(table, column.name)
+            and not self._is_unique_column(table, column.name)
+            and not self._should_use_column_name_generation(column)
+        ]
+    
     def _generate_column_value(self, column: ColumnInfo, 
                              table_config: TableGenerationConfig,
                              table: Optional[TableInfo] = None) -> Any:
@@ -563,7 +695,8 @@ class DataGenerator:
         if config and config.possible_values:
             return random.choice(config.possible_values)
         
-        max_length = config.max_length if config else 1000
+        # A config without max_length (e.g. only duplicate settings) keeps the default
+        max_length = (config.max_length if config else None) or 1000
         
         # Handle short text fields
         if max_length < 5:
@@ -803,6 +936,15 @@ class DataGenerator:
         # Fallback to generic enum values
         return random.choice(['option1', 'option2', 'option3'])
     
+    def _generate_enum_batch(self, column: ColumnInfo, n: int,
+                             config: Optional[ColumnGenerationConfig] = None) -> List[str]:
+        """Generate ``n`` enum values with a single ``random.choices`` call."""
+        if config and config.possible_values:
+            values = config.possible_values
+        else:
+            values = column.enum_values or ['option1', 'option2', 'option3']
+        return random.choices(values, k=n)
+    
     def _generate_blob(self, column: ColumnInfo, 
                       config: Optional[ColumnGenerationConfig]) -> bytes:
         """Generate blob value."""
@@ -1008,18 +1150,6 @@ class DataGenerator:
                 return True
         return False
     
-    def _is_primary_key_column(self, table: TableInfo, column_name: str) -> bool:
-        """Check if column is a primary key."""
-        pk_columns = table.get_primary_key_columns()
-        return column_name in pk_columns
-    
-    def _is_unique_column(self, table: TableInfo, column_name: str) -> bool:
-        """Check if column has a unique constraint."""
-        for constraint in table.constraints:
-            if constraint.type == ConstraintType.UNIQUE and column_name in constraint.columns:
-                return True
-        return False
-    
     def _get_unique_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
         """Get all unique constraints for a table."""
         return [c for c in table.constraints if c.type == ConstraintType.UNIQUE]
@@ -1640,12 +1770,42 @@ class DataGenerator:
             return None
     
     def _cache_generated_values(self, table_name: str, row: Dict[str, Any]) -> None:
-        """Cache generated values for foreign key references."""
-        for column_name, value in row.items():
-            if value is not None:
-                if column_name not in self._generated_values[table_name]:
-                    self._generated_values[table_name][column_name] = []
-                self._generated_values[table_name][column_name].append(value)
+        """Cache generated values for foreign key references.
+        
+        Only primary key and FK-referenced columns are kept, each capped at
+        ``GENERATED_KEY_CACHE_LIMIT`` values. Integer columns (the usual FK targets)
+        are kept in a compact int64 ``array``; other values, or ints that overflow
+        int64, fall back to a list.
+        """
+        key_columns = self._cached_key_columns.get(table_name)
+        if key_columns is None:
+            key_columns = self._cached_key_columns[table_name] = self._get_cached_key_columns(table_name)
+        
+        table_cache = self._generated_values.setdefault(table_name, {})
+        for column_name in key_columns:
+            value = row.get(column_name)
+            if value is None:
+                continue
+            values = table_cache.get(column_name)
+            if values is None:
+                values = table_cache[column_name] = array('q') if type(value) is int else []
+            elif len(values) >= GENERATED_KEY_CACHE_LIMIT:
+                continue
+            try:
+                values.append(value)
+            except (TypeError, OverflowError):
+                values = table_cache[column_name] = list(values)
+                values.append(value)
+    
+    def _get_cached_key_columns(self, table_name: str) -> List[str]:
+        """Columns of a table that foreign keys can draw from: its primary key and any FK targets."""
+        table = self.schema.get_table(table_name)
+        columns = list(table.get_primary_key_columns()) if table else []
+        for other in self.schema.tables:
+            for fk in other.foreign_keys:
+                if fk.referenced_table == table_name:
+                    columns.extend(fk.referenced_columns or ['id'])
+        return list(dict.fromkeys(columns))
     
     def _get_existing_values(self, table_name: str, column_name: str) -> Set[Any]:
         """Get existing values from the database (cached)."""
@@ -1682,31 +1842,24 @@ class DataGenerator:
     
     def _apply_custom_generator(self, generator_name: str, column: ColumnInfo) -> Any:
         """Apply custom generator function."""
-        if generator_name in self._custom_generators:
-            return self._custom_generators[generator_name](column)
-        else:
-            logger.warning(f"Custom generator '{generator_name}' not found")
-            return self._generate_by_type(column, None)
+        generator = self._custom_generators.get(generator_name)
+        if generator is not None:
+            return generator(column)
+        logger.warning(f"Custom generator '{generator_name}' not found")
+        return self._generate_by_type(column, None)
     
     def _build_custom_generators(self) -> Dict[str, Callable]:
-        """Build dictionary of custom generator functions."""
-        return {
-            'name': lambda col: self.faker.name(),
-            'email': lambda col: self.faker.email(),
-            'phone': lambda col: self.faker.phone_number(),
-            'address': lambda col: self.faker.address(),
-            'company': lambda col: self.faker.company(),
-            'username': lambda col: self.faker.user_name(),
-            'password': lambda col: self.faker.password(),
-            'credit_card': lambda col: self.faker.credit_card_number(),
-            'ip_address': lambda col: self.faker.ipv4(),
-            'url': lambda col: self.faker.url(),
-            'lorem': lambda col: self._safe_text_generation(col.max_length or 100),
-            'country': lambda col: self.faker.country(),
-            'city': lambda col: self.faker.city(),
-            'state': lambda col: self.faker.state(),
-            'zipcode': lambda col: self.faker.zipcode(),
+        """Build dictionary of custom generator functions.
+        
+        Faker providers are bound here once; resolving them through the Faker proxy on
+        every call costs more than the lookup itself.
+        """
+        generators = {
+            name: (lambda col, provider=getattr(self.faker, provider_name): provider())
+            for name, provider_name in self.CUSTOM_FAKER_PROVIDERS.items()
         }
+        generators['lorem'] = lambda col: self._safe_text_generation(col.max_length or 100)
+        return generators
     
     def _is_primary_key_column(self, table: Optional[TableInfo], column_name: str) -> bool:
         """Check if a column is a primary key."""
@@ -1728,10 +1881,7 @@ class DataGenerator:
             self._smart_duplicate_cache = {}
         
         if cache_key not in self._smart_duplicate_cache:
-            self._smart_duplicate_cache[cache_key] = {
-                'values': [],
-                'usage_count': {}
-            }
+            self._smart_duplicate_cache[cache_key] = self._new_smart_duplicate_cache()
         
         cache = self._smart_duplicate_cache[cache_key]
         
@@ -1740,34 +1890,11 @@ class DataGenerator:
         if len(cache['values']) < max_values:
             new_value = self._generate_by_type(column, config, table)
             cache['values'].append(new_value)
-            cache['usage_count'][new_value] = 0
             logger.debug(f"Added new smart duplicate value for {column.name}: {new_value}")
             return new_value
         
-        # Use probability to decide between reusing and generating new
-        duplicate_prob = getattr(config, 'duplicate_probability', 0.5)
-        
-        if random.random() < duplicate_prob:
-            # Reuse existing value (prefer less used ones)
-            values_by_usage = sorted(cache['values'], key=lambda v: cache['usage_count'].get(v, 0))
-            selected_value = values_by_usage[0]  # Pick least used
-            cache['usage_count'][selected_value] += 1
-            logger.debug(f"Reusing smart duplicate value for {column.name}: {selected_value}")
-            return selected_value
-        else:
-            # Generate new value but limit total unique values
-            if len(cache['values']) < max_values:
-                new_value = self._generate_by_type(column, config, table)
-                cache['values'].append(new_value)
-                cache['usage_count'][new_value] = 1
-                logger.debug(f"Generated new smart duplicate value for {column.name}: {new_value}")
-                return new_value
-            else:
-                # Reuse random existing value
-                selected_value = random.choice(cache['values'])
-                cache['usage_count'][selected_value] += 1
-                logger.debug(f"Reusing random smart duplicate value for {column.name}: {selected_value}")
-                return selected_value
+        # Pool is full: every further row reuses one of its values
+        return self._next_smart_duplicate_value(cache, getattr(config, 'duplicate_probability', 0.5))
     
     def _generate_smart_duplicate_value_global(self, column: ColumnInfo, 
                                              table: Optional[TableInfo] = None) -> Any:
@@ -1782,10 +1909,7 @@ class DataGenerator:
             self._global_smart_duplicate_cache = {}
         
         if cache_key not in self._global_smart_duplicate_cache:
-            self._global_smart_duplicate_cache[cache_key] = {
-                'values': [],
-                'usage_count': {}
-            }
+            self._global_smart_duplicate_cache[cache_key] = self._new_smart_duplicate_cache()
         
         cache = self._global_smart_duplicate_cache[cache_key]
         
@@ -1795,35 +1919,41 @@ class DataGenerator:
             column_config = None
             new_value = self._generate_by_type(column, column_config, table)
             cache['values'].append(new_value)
-            cache['usage_count'][new_value] = 0
             logger.debug(f"Added new global smart duplicate value for {column.name}: {new_value}")
             return new_value
         
-        # Use global probability to decide between reusing and generating new
-        duplicate_prob = self.config.global_duplicate_probability
-        
-        if random.random() < duplicate_prob:
-            # Reuse existing value (prefer less used ones)
-            values_by_usage = sorted(cache['values'], key=lambda v: cache['usage_count'].get(v, 0))
-            selected_value = values_by_usage[0]  # Pick least used
-            cache['usage_count'][selected_value] += 1
-            logger.debug(f"Reusing global smart duplicate value for {column.name}: {selected_value}")
-            return selected_value
-        else:
-            # Generate new value but limit total unique values
-            if len(cache['values']) < max_values:
-                column_config = None
-                new_value = self._generate_by_type(column, column_config, table)
-                cache['values'].append(new_value)
-                cache['usage_count'][new_value] = 1
-                logger.debug(f"Generated new global smart duplicate value for {column.name}: {new_value}")
-                return new_value
-            else:
-                # Reuse random existing value
-                selected_value = random.choice(cache['values'])
-                cache['usage_count'][selected_value] += 1
-                logger.debug(f"Reusing random global smart duplicate value for {column.name}: {selected_value}")
-                return selected_value
+        # Pool is full: every further row reuses one of its values
+        return self._next_smart_duplicate_value(cache, self.config.global_duplicate_probability)
+    
+    @staticmethod
+    def _new_smart_duplicate_cache() -> Dict[str, Any]:
+        """Empty smart-duplicate pool with its own NumPy generator, seeded from ``random``."""
+        return {
+            'values': [],
+            'picks': iter(()),
+            'cursor': 0,
+            'rng': np.random.default_rng(random.getrandbits(64))
+        }
+    
+    @staticmethod
+    def _next_smart_duplicate_value(cache: Dict[str, Any], duplicate_prob: float) -> Any:
+        """Return the next pool value, drawing pool indices a block at a time with NumPy.
+        
+        With probability ``duplicate_prob`` a row takes the next value in rotation
+        (keeping usage balanced, like picking the least used); otherwise it takes
+        a uniformly random pool value.
+        """
+        index = next(cache['picks'], None)
+        if index is None:
+            pool_size = len(cache['values'])
+            rng = cache['rng']
+            rotate = rng.random(SMART_DUPLICATE_BLOCK_SIZE) < duplicate_prob
+            rotation = (cache['cursor'] + np.cumsum(rotate) - 1) % pool_size
+            picks = np.where(rotate, rotation, fill_choice(pool_size, SMART_DUPLICATE_BLOCK_SIZE, rng))
+            cache['cursor'] = int(cache['cursor'] + rotate.sum()) % pool_size
+            cache['picks'] = iter(picks.tolist())
+            index = next(cache['picks'])
+        return cache['values'][index]
     
     def _is_unique_column(self, table: Optional[TableInfo], column_name: str) -> bool:
         """Check if a column has a unique constraint."""
@@ -15,7 +15,7 @@ import numpy as np
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator, Union
 from dataclasses import dataclass, field
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from sqlalchemy import create_engine, text
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
@@ -391,11 +391,17 @@ class StreamingDataGenerator:
 class HighPerformanceGenerator:
     """Ultra-high performance data generator optimized for millions of records."""
     
-    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection: DatabaseConnection):
-        """Initialize high-performance generator."""
+    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection: DatabaseConnection,
+                 write_lock: Optional[Any] = None):
+        """Initialize high-performance generator.
+        
+        ``write_lock`` (e.g. a ``multiprocessing.Lock``) is held around each bulk insert so
+        generators in several processes can share a single-writer database such as SQLite.
+        """
         self.schema = schema
         self.config = config
         self.db_connection = db_connection
+        self.write_lock = write_lock
         
         # Performance components
         self.connection_pool = ConnectionPool(db_connection.config, pool_size=20, max_overflow=10)
@@ -416,7 +422,8 @@ class HighPerformanceGenerator:
     
     def _calculate_optimal_settings(self):
         """Calculate optimal settings based on system resources."""
-        cpu_count = psutil.cpu_count()
+        # Size thread pools by physical cores; hyperthreads share caches and memory bandwidth
+        cpu_count = psutil.cpu_count(logical=False) or psutil.cpu_count()
         memory_gb = psutil.virtual_memory().total / (1024**3)
         
         # Adaptive batch sizing
@@ -708,7 +715,8 @@ class HighPerformanceGenerator:
         query = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
         
         # Execute bulk insert using connection pool
-        return self.connection_pool.execute_bulk_insert(query, data)
+        with self.write_lock or nullcontext():
+            return self.connection_pool.execute_bulk_insert(query, data)
     
     def _quote_identifier(self, identifier: str) -> str:
         """Quote identifier based on database type."""
@@ -2,9 +2,9 @@
 
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from sqlalchemy import text, insert
+from sqlalchemy import text, insert, TextClause
 from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
 
@@ -22,7 +22,21 @@ class DataInserter:
         """Initialize data inserter."""
         self.db_connection = db_connection
         self.schema = schema
+        # Named-parameter INSERT statements keyed by (table, columns), built once per shape
+        self._insert_statements: Dict[Tuple[str, Tuple[str, ...]], TextClause] = {}
         
+    def _get_insert_statement(self, table_name: str, column_names: Tuple[str, ...]) -> TextClause:
+        """Return the cached INSERT ``TextClause`` for a table and column order."""
+        key = (table_name, column_names)
+        statement = self._insert_statements.get(key)
+        if statement is None:
+            placeholders = ', '.join([f':{col}' for col in column_names])
+            quoted_columns = ', '.join([self.db_connection.quote_identifier(col) for col in column_names])
+            quoted_table = self.db_connection.quote_identifier(table_name)
+            statement = text(f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})")
+            self._insert_statements[key] = statement
+        return statement
+    
     def insert_data(self, table_name: str, data: List[Dict[str, Any]], 
                    batch_size: int = 1000, max_workers: int = 4,
                    progress_callback: Optional[callable] = None) -> GenerationStats:
@@ -98,17 +112,10 @@ class DataInserter:
             return 0
         
         try:
+            statement = self._get_insert_statement(table.name, tuple(batch[0].keys()))
             with self.db_connection.get_session() as session:
-                # Build insert query with properly quoted column names
-                column_names = list(batch[0].keys())
-                placeholders = ', '.join([f':{col}' for col in column_names])
-                quoted_columns = ', '.join([self.db_connection.quote_identifier(col) for col in column_names])
-                
-                quoted_table = self.db_connection.quote_identifier(table.name)
-                query = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
-                
                 # Execute batch insert
-                session.execute(text(query), batch)
+                session.execute(statement, batch)
                 session.commit()
                 
                 return len(batch)
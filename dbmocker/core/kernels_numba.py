@@ -0,0 +1,69 @@
+"""Vectorized value-fill kernels for columnar generation.
+
+The kernels are JIT-compiled with Numba (``parallel=True``) when it is installed;
+otherwise they fall back to a NumPy ``Generator``, which is already vectorized.
+Numba draws from its own unseeded per-thread state, so whenever a caller passes
+an ``rng`` the NumPy path is used to keep seeded runs reproducible.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional
+    HAS_NUMBA = False
+
+_default_rng = np.random.default_rng()
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _fill_int_uniform_kernel(lo, hi, out):
+        for i in prange(out.size):
+            out[i] = np.random.randint(lo, hi)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_float_uniform_kernel(lo, hi, out):
+        span = hi - lo
+        for i in prange(out.size):
+            out[i] = lo + span * np.random.random()
+
+
+def fill_int_uniform(lo: int, hi: int, n: int,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Return ``n`` int64 values drawn uniformly from ``[lo, hi)``.
+
+    Passing ``rng`` always uses it; only unseeded calls go through the Numba kernel.
+    """
+    if HAS_NUMBA and rng is None:
+        out = np.empty(n, dtype=np.int64)
+        _fill_int_uniform_kernel(lo, hi, out)
+        return out
+    return (rng or _default_rng).integers(lo, hi, size=n, dtype=np.int64)
+
+
+def fill_float_uniform(lo: float, hi: float, n: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Return ``n`` float64 values drawn uniformly from ``[lo, hi)``."""
+    if HAS_NUMBA and rng is None:
+        out = np.empty(n, dtype=np.float64)
+        _fill_float_uniform_kernel(lo, hi, out)
+        return out
+    return (rng or _default_rng).uniform(lo, hi, size=n)
+
+
+def fill_timestamp(start_ns: int, end_ns: int, n: int,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Return ``n`` epoch-nanosecond timestamps (int64) uniform in ``[start_ns, end_ns)``."""
+    return fill_int_uniform(start_ns, end_ns, n, rng)
+
+
+def fill_choice(pool_size: int, n: int,
+                rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Return ``n`` int32 indices into a pool of ``pool_size`` values, uniformly chosen."""
+    return fill_int_uniform(0, pool_size, n, rng).astype(np.int32)
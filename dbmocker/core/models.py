@@ -84,9 +84,9 @@ class ColumnInfo:
     avg_length: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConstraintInfo:
-    """Information about database constraints."""
+    """Information about database constraints (immutable, so instances can be shared)."""
     name: str
     type: ConstraintType
     columns: List[str]
@@ -122,12 +122,22 @@ class TableInfo:
     foreign_keys: List[ConstraintInfo] = field(default_factory=list)
     referenced_by: List[ConstraintInfo] = field(default_factory=list)
     
+    # Name -> column lookup, rebuilt when ``columns`` is replaced or resized
+    _col_index: Optional[Dict[str, ColumnInfo]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _col_index_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False)
+    
     def get_column(self, name: str) -> Optional[ColumnInfo]:
         """Get column by name."""
-        for column in self.columns:
-            if column.name == name:
-                return column
-        return None
+        key = (id(self.columns), len(self.columns))
+        if self._col_index is None or self._col_index_key != key:
+            index = {}
+            for column in self.columns:
+                index.setdefault(column.name, column)
+            self._col_index = index
+            self._col_index_key = key
+        return self._col_index.get(name)
     
     def get_primary_key_columns(self) -> List[str]:
         """Get primary key column names."""
@@ -155,6 +165,18 @@ class DatabaseSchema:
     procedures: List[str] = field(default_factory=list)
     table_patterns: Dict[str, Any] = field(default_factory=dict)  # For pattern analysis results
     
+    # Bumped by add_table; get_table_dependencies caches its result per version
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _deps_cache: Optional[Dict[str, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _deps_cache_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def add_table(self, table: TableInfo) -> None:
+        """Add a table to the schema."""
+        self.tables.append(table)
+        self._version += 1
+    
     def get_table(self, name: str) -> Optional[TableInfo]:
         """Get table by name."""
         for table in self.tables:
@@ -163,7 +185,14 @@ class DatabaseSchema:
         return None
     
     def get_table_dependencies(self) -> Dict[str, List[str]]:
-        """Get table dependency graph based on foreign keys."""
+        """Get table dependency graph based on foreign keys.
+        
+        The result is cached until the schema changes and shared between callers; treat it as read-only.
+        """
+        key = (self._version, len(self.tables))
+        if self._deps_cache is not None and self._deps_cache_key == key:
+            return self._deps_cache
+        
         dependencies = {}
         
         for table in self.tables:
@@ -173,6 +202,8 @@ class DatabaseSchema:
                     deps.append(fk.referenced_table)
             dependencies[table.name] = deps
         
+        self._deps_cache = dependencies
+        self._deps_cache_key = key
         return dependencies
 
 
@@ -186,6 +217,7 @@ class GenerationConfig(BaseModel):
     max_processes: int = Field(default=2, description="Number of processes for multiprocessing")
     rows_per_process: int = Field(default=100000, description="Rows per process threshold for multiprocessing")
     truncate_existing: bool = Field(default=False, description="Truncate existing data")
+    bulk_copy: bool = Field(default=False, description="Load PostgreSQL batches with COPY instead of INSERT")
     seed: Optional[int] = Field(default=None, description="Random seed for reproducible data")
     
     # Global duplicate handling
@@ -1,27 +1,163 @@
 """High-performance parallel data generator with multi-threading and multi-processing support."""
 
+import asyncio
+import atexit
+import functools
+import io
+import json
 import logging
 import multiprocessing as mp
+import queue
 import time
 import sys
 import gc
+import threading
 import psutil
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from contextlib import contextmanager
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator
 import random
+from collections import namedtuple
+from itertools import chain
 from dataclasses import dataclass
 
-from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
 
-from .models import DatabaseSchema, TableInfo, GenerationConfig, GenerationStats, ColumnGenerationConfig, TableGenerationConfig
-from .database import DatabaseConnection
+from .models import DatabaseSchema, TableInfo, GenerationConfig, GenerationStats, ColumnGenerationConfig, TableGenerationConfig, ColumnType
+from .database import DatabaseConnection, SQLITE_MAX_VARIABLES, get_insert_sql
 from .generator import DataGenerator
 from .inserter import DataInserter
 
+try:
+    from psycopg2.extras import execute_values
+except ImportError:  # psycopg2 is only needed for PostgreSQL targets
+    execute_values = None
+
 logger = logging.getLogger(__name__)
 
+# Rows packed into each multi-row INSERT ... VALUES statement
+MULTI_ROW_GROUP_SIZE = 500
+
+# Threads currently inside _gc_paused(); the collector is re-enabled when the last one leaves
+_GC_PAUSE_DEPTH = 0
+_GC_PAUSE_LOCK = threading.Lock()
+_GC_WAS_ENABLED = True
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector around allocation-heavy loops.
+    
+    Generated rows are acyclic, so refcounting frees them anyway; pausing only
+    avoids repeated gen-2 scans of millions of live dicts and tuples. Nested and
+    concurrent uses share one pause, and the collector's prior state is restored.
+    """
+    global _GC_PAUSE_DEPTH, _GC_WAS_ENABLED
+    with _GC_PAUSE_LOCK:
+        if _GC_PAUSE_DEPTH == 0:
+            _GC_WAS_ENABLED = gc.isenabled()
+            gc.disable()
+        _GC_PAUSE_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _GC_PAUSE_LOCK:
+            _GC_PAUSE_DEPTH -= 1
+            if _GC_PAUSE_DEPTH == 0 and _GC_WAS_ENABLED:
+                gc.enable()
+
+
+# Per-process state of pooled generation workers, filled once by _init_worker_process
+_WORKER_STATE: Dict[str, Any] = {}
+
+# Spawned process pools reused across generation calls, keyed by (processes, db config)
+_PROCESS_POOLS: Dict[tuple, ProcessPoolExecutor] = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+def _compute_shards(total_rows: int, parts: int) -> List[Tuple[int, int]]:
+    """Split ``[0, total_rows)`` into at most ``parts`` contiguous, near-equal ranges.
+    
+    The split depends only on its arguments, so each range can be generated independently
+    without shared state; empty ranges are dropped.
+    """
+    parts = max(1, parts)
+    bounds = [i * total_rows // parts for i in range(parts + 1)]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _get_process_pool(max_processes: int, db_config) -> Tuple[tuple, ProcessPoolExecutor]:
+    """Return the shared process pool for these settings, starting it on first use."""
+    key = (max_processes, tuple(sorted(db_config.dict().items())))
+    with _PROCESS_POOLS_LOCK:
+        pool = _PROCESS_POOLS.get(key)
+        if pool is None:
+            # Use spawn method for better isolation
+            pool = ProcessPoolExecutor(
+                max_workers=max_processes,
+                mp_context=mp.get_context('spawn'),
+                initializer=_init_worker_process,
+                initargs=(db_config,)
+            )
+            _PROCESS_POOLS[key] = pool
+    return key, pool
+
+
+def _discard_process_pool(key: tuple, futures: Iterable[Future] = ()) -> None:
+    """Drop a pool that failed so the next call starts a fresh one.
+    
+    ``futures`` still pending on the pool are cancelled first, since
+    ``shutdown(cancel_futures=True)`` is not available before Python 3.9.
+    """
+    for future in futures:
+        future.cancel()
+    with _PROCESS_POOLS_LOCK:
+        pool = _PROCESS_POOLS.pop(key, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_process_pools() -> None:
+    """Stop pooled worker processes when the interpreter exits."""
+    with _PROCESS_POOLS_LOCK:
+        pools = list(_PROCESS_POOLS.values())
+        _PROCESS_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def _copy_csv_field(value: Any) -> str:
+    """Encode one value as a PostgreSQL ``COPY ... (FORMAT csv, NULL '\\N')`` field.
+    
+    Only NULL goes out as the bare ``\\N`` marker; every other value is quoted, and
+    COPY never reads a quoted field as NULL, so a literal ``\\N`` text survives.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input format
+        value = "\\x" + bytes(value).hex()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# NumPy dtypes for column types that can be stored unboxed; everything else is an object array
+_COLUMNAR_DTYPES = {
+    ColumnType.INTEGER: np.int64,
+    ColumnType.BIGINT: np.int64,
+    ColumnType.SMALLINT: np.int64,
+    ColumnType.FLOAT: np.float64,
+    ColumnType.DOUBLE: np.float64,
+    ColumnType.BOOLEAN: np.bool_,
+}
+
 
 @dataclass
 class GenerationTask:
@@ -36,12 +172,24 @@ class GenerationTask:
 class ParallelDataGenerator:
     """High-performance data generator with multi-threading and multi-processing support."""
     
-    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection: DatabaseConnection):
-        """Initialize parallel data generator."""
+    def __init__(self, schema: DatabaseSchema, config: GenerationConfig, db_connection: DatabaseConnection,
+                 memory_estimator: Optional[Callable[[TableInfo, int], float]] = None,
+                 rng: Optional[np.random.Generator] = None):
+        """Initialize parallel data generator.
+        
+        memory_estimator, if given, returns the expected MB for (table, num_rows) and
+        replaces the built-in estimate when choosing a generation strategy.
+        rng, if given, is a shared NumPy generator used to draw worker seeds.
+        """
         self.schema = schema
         self.config = config
         self.db_connection = db_connection
         self.stop_flag = None  # For stopping generation mid-process
+        self._memory_estimator = memory_estimator or self._estimate_memory_usage
+        self._rng = rng
+        
+        # Per-thread standard generators, seeded once and reused instead of on every call
+        self._thread_local = threading.local()
         
         # Performance tracking
         self.generation_stats = GenerationStats()
@@ -52,12 +200,29 @@ class ParallelDataGenerator:
         # Memory monitoring for large datasets
         self._memory_threshold = 0.8  # 80% memory usage threshold
         
+        # Cached compact row types per table: (namedtuple class, source column names)
+        self._row_classes: Dict[str, Tuple[type, Tuple[str, ...]]] = {}
+        
         logger.info(f"Parallel generator initialized: {self._adaptive_config}")
     
     def set_stop_flag(self, stop_flag):
         """Set the stop flag for halting generation."""
         self.stop_flag = stop_flag
     
+    def reconfigure(self, **overrides) -> None:
+        """Update generation settings in place instead of building a new generator."""
+        for key, value in overrides.items():
+            if key not in GenerationConfig.model_fields:
+                raise ValueError(f"Unknown generation setting: {key}")
+            setattr(self.config, key, value)
+        
+        # Reused generators cache seeding and per-table column decisions, so start fresh ones
+        self._thread_local = threading.local()
+        
+        # Worker and process limits feed the adaptive configuration
+        self._adaptive_config = self._calculate_adaptive_config()
+        logger.info(f"Parallel generator reconfigured: {self._adaptive_config}")
+    
     def _calculate_adaptive_config(self) -> Dict[str, Any]:
         """Calculate optimal configuration based on system resources."""
         cpu_count = mp.cpu_count()
@@ -108,24 +273,25 @@ class ParallelDataGenerator:
         logger.info(f"👥 Max workers: {self._adaptive_config['max_processes']} processes" if use_multiprocessing else f"🧵 Max workers: {self.config.max_workers} threads")
         
         # Memory check for very large datasets
-        estimated_memory_mb = self._estimate_memory_usage(table, num_rows)
+        estimated_memory_mb = self._memory_estimator(table, num_rows)
         available_memory_mb = psutil.virtual_memory().available / (1024**2)
         
         logger.info(f"💾 Memory estimate: {estimated_memory_mb:.1f}MB, Available: {available_memory_mb:.1f}MB")
         
-        if estimated_memory_mb > available_memory_mb * 0.8:
-            logger.warning("⚠️ Large dataset detected, using streaming generation for memory efficiency")
-            return self._generate_with_streaming(table, num_rows)
-        elif use_multiprocessing:
-            logger.info(f"🔀 Using multi-processing generation with {self._adaptive_config['max_processes']} processes")
-            return self._generate_with_multiprocessing(table, num_rows)
-        elif num_rows >= 10000 and self.config.max_workers > 1:
-            logger.info(f"🧵 Using multi-threading generation with {self.config.max_workers} threads")
-            return self._generate_with_multithreading(table, num_rows)
-        else:
-            logger.info(f"🔄 Using single-threaded generation (rows: {num_rows:,} < 10K threshold)")
-            # Use single-threaded generation for smaller datasets
-            return self._generate_single_threaded(table, num_rows)
+        with _gc_paused():
+            if estimated_memory_mb > available_memory_mb * 0.8:
+                logger.warning("⚠️ Large dataset detected, using streaming generation for memory efficiency")
+                return self._generate_with_streaming(table, num_rows)
+            elif use_multiprocessing:
+                logger.info(f"🔀 Using multi-processing generation with {self._adaptive_config['max_processes']} processes")
+                return self._generate_with_multiprocessing(table, num_rows)
+            elif num_rows >= 10000 and self.config.max_workers > 1:
+                logger.info(f"🧵 Using multi-threading generation with {self.config.max_workers} threads")
+                return self._generate_with_multithreading(table, num_rows)
+            else:
+                logger.info(f"🔄 Using single-threaded generation (rows: {num_rows:,} < 10K threshold)")
+                # Use single-threaded generation for smaller datasets
+                return self._generate_single_threaded(table, num_rows)
     
     def _estimate_memory_usage(self, table: TableInfo, num_rows: int) -> float:
         """Estimate memory usage for generating data."""
@@ -141,74 +307,59 @@ class ParallelDataGenerator:
         """Generate data using multiprocessing for very large datasets."""
         logger.info(f"Using multiprocessing with {self.config.max_processes} processes for {num_rows:,} rows")
         
-        # Calculate rows per process
-        rows_per_process = max(1, num_rows // self.config.max_processes)
-        tasks = []
-        
-        # Create generation tasks
-        for i in range(self.config.max_processes):
-            start_row = i * rows_per_process
-            if i == self.config.max_processes - 1:
-                # Last process gets remaining rows
-                end_row = num_rows
-            else:
-                end_row = start_row + rows_per_process
-            
-            if start_row >= num_rows:
-                break
-                
-            # Create unique seed for each process
-            process_seed = None
-            if self.config.seed is not None:
-                process_seed = self.config.seed + i
-            
-            task = GenerationTask(
+        # One fixed row range per process, each seeded from (base seed, shard index)
+        tasks = [
+            GenerationTask(
                 table_name=table.name,
                 start_row=start_row,
                 end_row=end_row,
-                seed=process_seed,
+                seed=self._task_seed(i),
                 task_id=f"process_{i}"
             )
-            tasks.append(task)
+            for i, (start_row, end_row) in enumerate(_compute_shards(num_rows, self.config.max_processes))
+        ]
         
-        # Process tasks in parallel
-        all_data = []
+        # Process tasks in parallel on the shared pool; workers keep their connection between calls
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        future_to_task = {}
+        pool_key = None
         
         try:
-            # Use spawn method for better isolation
-            ctx = mp.get_context('spawn')
-            with ProcessPoolExecutor(
-                max_workers=self.config.max_processes,
-                mp_context=ctx
-            ) as executor:
-                # Submit tasks
-                future_to_task = {
-                    executor.submit(
-                        _generate_data_worker_process,
-                        self.schema, 
-                        self.config, 
-                        self.db_connection.config, 
-                        task
-                    ): task for task in tasks
-                }
-                
-                # Collect results
-                for future in as_completed(future_to_task):
-                    task = future_to_task[future]
-                    try:
-                        result = future.result(timeout=300)  # 5 minute timeout per process
-                        all_data.extend(result)
-                        logger.info(f"Process {task.task_id} completed: {len(result)} rows")
-                    except Exception as e:
-                        logger.error(f"Process {task.task_id} failed: {e}")
-                        # Continue with other processes
+            pool_key, executor = _get_process_pool(self.config.max_processes, self.db_connection.config)
+            
+            # Submit tasks
+            future_to_task = {
+                executor.submit(
+                    _generate_data_worker_process,
+                    self.schema, 
+                    self.config, 
+                    task
+                ): (index, task) for index, task in enumerate(tasks)
+            }
+            
+            # Collect results
+            for future in as_completed(future_to_task):
+                index, task = future_to_task[future]
+                try:
+                    result = future.result(timeout=300)  # 5 minute timeout per process
+                    results[index] = result
+                    logger.info(f"Process {task.task_id} completed: {len(result)} rows")
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.error(f"Process {task.task_id} failed: {e}")
+                    # Continue with other processes
         
         except Exception as e:
             logger.error(f"Multiprocessing failed: {e}")
+            if pool_key is not None:
+                _discard_process_pool(pool_key, future_to_task)
             # Fallback to single-threaded generation
             logger.info("Falling back to single-threaded generation")
             return self._generate_single_threaded(table, num_rows)
         
+        # Concatenate in shard order so seeded runs are reproducible regardless of completion order
+        all_data = [row for index in sorted(results) for row in results[index]]
         logger.info(f"Multiprocessing completed: {len(all_data):,} rows generated")
         return all_data
     
@@ -216,43 +367,11 @@ class ParallelDataGenerator:
         """Generate data using multithreading for medium datasets."""
         logger.info(f"🧵 Using multithreading with {self.config.max_workers} threads for {num_rows:,} rows")
         
-        # Calculate rows per thread
-        rows_per_thread = max(1, num_rows // self.config.max_workers)
-        tasks = []
-        
-        logger.info(f"📦 Distributing work: {rows_per_thread:,} rows per thread")
-        
-        # Create generation tasks
-        for i in range(self.config.max_workers):
-            start_row = i * rows_per_thread
-            if i == self.config.max_workers - 1:
-                # Last thread gets remaining rows
-                end_row = num_rows
-            else:
-                end_row = start_row + rows_per_thread
-            
-            if start_row >= num_rows:
-                break
-                
-            thread_rows = end_row - start_row
-            logger.debug(f"🧵 Thread {i+1}: Processing rows {start_row:,} to {end_row:,} ({thread_rows:,} rows)")
-                
-            # Create unique seed for each thread
-            thread_seed = None
-            if self.config.seed is not None:
-                thread_seed = self.config.seed + i * 1000
-            
-            task = GenerationTask(
-                table_name=table.name,
-                start_row=start_row,
-                end_row=end_row,
-                seed=thread_seed,
-                task_id=f"thread_{i}"
-            )
-            tasks.append(task)
+        logger.info(f"📦 Distributing work: {max(1, num_rows // self.config.max_workers):,} rows per thread")
+        tasks = self._build_thread_tasks(table.name, num_rows)
         
         # Process tasks in parallel
-        all_data = []
+        results: Dict[int, List[Dict[str, Any]]] = {}
         completed_tasks = 0
         total_tasks = len(tasks)
         
@@ -268,7 +387,7 @@ class ParallelDataGenerator:
                     self.db_connection, 
                     task,
                     self.stop_flag  # Pass stop flag to worker
-                ): task for task in tasks
+                ): (index, task) for index, task in enumerate(tasks)
             }
             
             # Collect results with progress tracking
@@ -282,10 +401,10 @@ class ParallelDataGenerator:
                             remaining_future.cancel()
                     break
                     
-                task = future_to_task[future]
+                index, task = future_to_task[future]
                 try:
                     result = future.result(timeout=120)  # 2 minute timeout per thread
-                    all_data.extend(result)
+                    results[index] = result
                     completed_tasks += 1
                     
                     progress_pct = (completed_tasks / total_tasks) * 100
@@ -297,17 +416,191 @@ class ParallelDataGenerator:
                     logger.error(f"Thread {task.task_id} failed: {e}")
                     # Continue with other threads
         
+        all_data = [row for index in sorted(results) for row in results[index]]
         logger.info(f"Multithreading completed: {len(all_data):,} rows generated")
         return all_data
     
+    def _build_thread_tasks(self, table_name: str, num_rows: int, seed_offset: int = 0) -> List[GenerationTask]:
+        """Split a table's rows into one generation task per worker thread."""
+        tasks = []
+        
+        for i, (start_row, end_row) in enumerate(_compute_shards(num_rows, self.config.max_workers)):
+            thread_rows = end_row - start_row
+            logger.debug(f"🧵 Thread {i+1}: Processing rows {start_row:,} to {end_row:,} ({thread_rows:,} rows)")
+            
+            # Create unique seed for each thread
+            tasks.append(GenerationTask(
+                table_name=table_name,
+                start_row=start_row,
+                end_row=end_row,
+                seed=self._task_seed(seed_offset + i * 1000),
+                task_id=f"thread_{i}"
+            ))
+        
+        return tasks
+    
+    def generate_for_tables(self, spec: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate several tables through one shared thread pool.
+        
+        ``spec`` maps table names to row counts. Every table is split into per-thread
+        tasks up front, so the pool starts once for the whole set instead of per table.
+        """
+        tasks = []
+        for table_index, (table_name, num_rows) in enumerate(spec.items()):
+            if not self.schema.get_table(table_name):
+                logger.warning(f"Table {table_name} not found in schema")
+                continue
+            seed_offset = table_index * self.config.max_workers * 1000
+            tasks.extend(self._build_thread_tasks(table_name, num_rows, seed_offset))
+        
+        logger.info(f"🚀 Generating {len(spec)} tables as {len(tasks)} tasks on {self.config.max_workers} threads")
+        
+        chunks = {}
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            future_to_index = {
+                executor.submit(
+                    _generate_data_worker_thread,
+                    self.schema,
+                    self.config,
+                    self.db_connection,
+                    task,
+                    self.stop_flag
+                ): index for index, task in enumerate(tasks)
+            }
+            
+            for future in as_completed(future_to_index):
+                if self.stop_flag and self.stop_flag.is_set():
+                    logger.info("🛑 Stopping multi-table generation - cancelling remaining workers")
+                    for remaining_future in future_to_index:
+                        if not remaining_future.done():
+                            remaining_future.cancel()
+                    break
+                
+                task = tasks[future_to_index[future]]
+                try:
+                    chunks[future_to_index[future]] = future.result(timeout=120)
+                except Exception as e:
+                    logger.error(f"Thread {task.task_id} for {task.table_name} failed: {e}")
+        
+        # Reassemble each table's rows in task order
+        results = {table_name: [] for table_name in spec}
+        for index, task in enumerate(tasks):
+            results[task.table_name].extend(chunks.get(index, []))
+        return results
+    
+    def _task_seed(self, offset: int) -> Optional[int]:
+        """Seed for a worker task, drawn from the shared RNG when one was provided."""
+        if self._rng is not None:
+            return int(self._rng.integers(0, 2**31 - 1))
+        if self.config.seed is not None:
+            return self.config.seed + offset
+        return None
+    
     def _generate_single_threaded(self, table: TableInfo, num_rows: int) -> List[Dict[str, Any]]:
         """Generate data using single thread."""
         logger.info(f"Using single-threaded generation for {num_rows:,} rows")
         
-        # Create a standard generator
-        generator = DataGenerator(self.schema, self.config, self.db_connection)
+        # Reuse this thread's standard generator so seeding and caches are set up only once
+        generator = getattr(self._thread_local, 'generator', None)
+        if generator is None:
+            generator = DataGenerator(self.schema, self.config, self.db_connection)
+            self._thread_local.generator = generator
+        generator.set_stop_flag(self.stop_flag)
         return generator.generate_data_for_table(table.name, num_rows)
     
+    def get_row_class(self, table_name: str) -> Tuple[type, Tuple[str, ...]]:
+        """Return a cached namedtuple type and its column names for a table's generated rows."""
+        cached = self._row_classes.get(table_name)
+        if cached is None:
+            table = self.schema.get_table(table_name)
+            if not table:
+                raise ValueError(f"Table {table_name} not found in schema")
+            
+            # Auto-increment columns are left to the database, matching the dict rows
+            column_names = tuple(c.name for c in table.columns if not c.is_auto_increment)
+            cached = (namedtuple("Row", column_names, rename=True), column_names)
+            self._row_classes[table_name] = cached
+        return cached
+    
+    async def generate_data_for_table_async(self, table_name: str, num_rows: int) -> List[Dict[str, Any]]:
+        """Awaitable ``generate_data_for_table_parallel`` that runs off the event loop thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.generate_data_for_table_parallel, table_name, num_rows)
+        )
+    
+    def generate_data_for_table_as_tuples(self, table_name: str, num_rows: int) -> List[tuple]:
+        """Generate data for a table as compact namedtuples instead of dicts."""
+        row_cls, column_names = self.get_row_class(table_name)
+        return [
+            row_cls._make(map(row.get, column_names))
+            for row in self.generate_data_for_table_parallel(table_name, num_rows)
+        ]
+    
+    def generate_data_for_table_as_columns(self, table_name: str, num_rows: int) -> Dict[str, List[Any]]:
+        """Generate data for a table as one value list per column instead of per-row dicts."""
+        _, column_names = self.get_row_class(table_name)
+        rows = self.generate_data_for_table_parallel(table_name, num_rows)
+        return {name: [row.get(name) for row in rows] for name in column_names}
+    
+    def generate_columnar(self, table_name: str, num_rows: int) -> Dict[str, np.ndarray]:
+        """Generate data for a table as a struct of arrays, one NumPy array per column.
+        
+        Numeric and boolean columns without NULLs get a native dtype; the rest are
+        object arrays. ``generate_data_for_table_parallel`` remains the row-based API.
+        """
+        return self._to_columnar(table_name, self.generate_data_for_table_as_columns(table_name, num_rows))
+    
+    def generate_columnar_chunks(self, table_name: str, num_rows: int,
+                                 chunk_size: int = 10000) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield ``generate_columnar``-style arrays for a table in chunks of ``chunk_size`` rows."""
+        _, column_names = self.get_row_class(table_name)
+        for rows in self.generate_data_for_table_stream(table_name, num_rows, chunk_size):
+            with _gc_paused():
+                columns = self._to_columnar(table_name, {name: [row.get(name) for row in rows] for name in column_names})
+            yield columns
+    
+    def _to_columnar(self, table_name: str, columns: Dict[str, List[Any]]) -> Dict[str, np.ndarray]:
+        """Convert per-column value lists into typed NumPy arrays."""
+        table = self.schema.get_table(table_name)
+        data_types = {column.name: column.data_type for column in table.columns}
+        
+        arrays = {}
+        for name, values in columns.items():
+            dtype = _COLUMNAR_DTYPES.get(data_types.get(name))
+            if dtype is not None and None not in values:
+                arrays[name] = np.array(values, dtype=dtype)
+            else:
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+                arrays[name] = array
+        return arrays
+    
+    def generate_data_for_table_stream(self, table_name: str, num_rows: int,
+                                       chunk_size: int = 2000) -> Iterator[List[Dict[str, Any]]]:
+        """Yield generated rows for a table in bounded chunks instead of one full list."""
+        table = self.schema.get_table(table_name)
+        if not table:
+            logger.warning(f"Table {table_name} not found in schema")
+            return
+        
+        chunk_size = max(1, chunk_size)
+        logger.info(f"Streaming generation for {table_name}: {num_rows:,} rows in chunks of {chunk_size:,}")
+        
+        # One generator for the whole stream keeps unique-value tracking consistent across chunks
+        generator = DataGenerator(self.schema, self.config, self.db_connection)
+        if self.stop_flag:
+            generator.set_stop_flag(self.stop_flag)
+        
+        for chunk_start in range(0, num_rows, chunk_size):
+            if self.stop_flag and self.stop_flag.is_set():
+                logger.info(f"🛑 Streaming stopped at row {chunk_start:,}/{num_rows:,} for {table_name}")
+                return
+            
+            chunk_rows = min(chunk_size, num_rows - chunk_start)
+            with _gc_paused():
+                rows = generator.generate_data_for_table(table_name, chunk_rows)
+            yield rows
+    
     def generate_data_for_all_tables_parallel(self, rows_per_table: int = 10) -> Dict[str, List[Dict[str, Any]]]:
         """Generate data for all tables using parallel processing."""
         logger.info("Starting parallel generation for all tables")
@@ -425,26 +718,30 @@ class ParallelDataGenerator:
         return all_data
 
 
+def _init_worker_process(db_config) -> None:
+    """Process-pool initializer: open the one database connection this worker reuses."""
+    db_conn = DatabaseConnection(db_config)
+    try:
+        db_conn.connect()
+    except ConnectionError as e:
+        # Generation still works without existing-data lookups
+        logger.warning(f"Worker process could not connect to the database: {e}")
+    _WORKER_STATE['conn'] = db_conn
+    atexit.register(db_conn.close)
+
+
 def _generate_data_worker_process(schema: DatabaseSchema, config: GenerationConfig, 
-                                 db_config, task: GenerationTask) -> List[Dict[str, Any]]:
+                                 task: GenerationTask) -> List[Dict[str, Any]]:
     """Worker function for multiprocessing data generation."""
-    # Create new database connection for this process
-    db_conn = DatabaseConnection(db_config)
+    # Create generator with task-specific seed
+    task_config = GenerationConfig(**config.dict())
+    task_config.seed = task.seed
     
-    try:
-        # Create generator with task-specific seed
-        task_config = GenerationConfig(**config.dict())
-        task_config.seed = task.seed
-        
-        generator = EnhancedDataGenerator(schema, task_config, db_conn)
-        
-        # Generate data for the specified range
-        num_rows = task.end_row - task.start_row
-        return generator.generate_data_for_table(task.table_name, num_rows)
+    generator = EnhancedDataGenerator(schema, task_config, _WORKER_STATE['conn'])
     
-    finally:
-        if db_conn:
-            db_conn.close()
+    # Generate data for the specified range
+    num_rows = task.end_row - task.start_row
+    return generator.generate_data_for_table(task.table_name, num_rows)
 
 
 def _generate_data_worker_thread(schema: DatabaseSchema, config: GenerationConfig,
@@ -489,6 +786,18 @@ def _generate_data_worker_thread(schema: DatabaseSchema, config: GenerationConfi
 class EnhancedDataGenerator(DataGenerator):
     """Enhanced data generator with duplicate support and other improvements."""
     
+    def _get_constant_columns(self, table, table_config):
+        """No constant folding while the probabilistic global duplicate mode may apply."""
+        if self.config.allow_duplicates:
+            return {}
+        return super()._get_constant_columns(table, table_config)
+    
+    def _get_enum_batch_columns(self, table, table_config):
+        """No batched ENUM draws while the probabilistic global duplicate mode may apply."""
+        if self.config.allow_duplicates:
+            return []
+        return super()._get_enum_batch_columns(table, table_config)
+    
     def _generate_column_value(self, column, table_config, table=None):
         """Enhanced column value generation with duplicate support."""
         # Check for custom column configuration
@@ -542,6 +851,19 @@ class EnhancedDataGenerator(DataGenerator):
 class ParallelDataInserter(DataInserter):
     """Enhanced data inserter with parallel processing support."""
     
+    def __init__(self, db_connection: DatabaseConnection, schema: DatabaseSchema,
+                 config: Optional[GenerationConfig] = None):
+        """Initialize the inserter; ``config.bulk_copy`` enables the PostgreSQL COPY path."""
+        super().__init__(db_connection, schema)
+        self.bulk_copy = bool(config and config.bulk_copy)
+        self._tables: Dict[str, Optional[TableInfo]] = {}
+    
+    def _get_table(self, table_name: str) -> Optional[TableInfo]:
+        """Look up a table once per inserter instead of scanning the schema per call."""
+        if table_name not in self._tables:
+            self._tables[table_name] = self.schema.get_table(table_name)
+        return self._tables[table_name]
+    
     def insert_data_parallel(self, table_name: str, data: List[Dict[str, Any]], 
                            batch_size: int = 1000, max_workers: int = 4,
                            progress_callback: Optional[Callable] = None) -> GenerationStats:
@@ -550,17 +872,18 @@ class ParallelDataInserter(DataInserter):
             logger.warning(f"No data to insert for table: {table_name}")
             return GenerationStats()
         
-        table = self.schema.get_table(table_name)
+        table = self._get_table(table_name)
         if not table:
             logger.warning(f"Table {table_name} not found in schema")
             return GenerationStats()
         
-        logger.info(f"Starting parallel insertion: {len(data):,} rows into {table_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting parallel insertion: %s rows into %s", format(len(data), ','), table_name)
         start_time = time.time()
         
         # Split data into batches
         batches = [data[i:i + batch_size] for i in range(0, len(data), batch_size)]
-        logger.info(f"Split data into {len(batches)} batches of size {batch_size}")
+        logger.info("Split data into %d batches of size %d", len(batches), batch_size)
         
         stats = GenerationStats()
         stats.table_stats[table_name] = {
@@ -570,6 +893,8 @@ class ParallelDataInserter(DataInserter):
         }
         
         total_inserted = 0
+        log_every = max(1, len(data) // 20)
+        next_log = log_every
         
         # Use threading for database operations (not multiprocessing due to connection sharing)
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -588,7 +913,9 @@ class ParallelDataInserter(DataInserter):
                     if progress_callback:
                         progress_callback(table_name, total_inserted, len(data))
                     
-                    logger.debug(f"Batch {batch_idx + 1}/{len(batches)} completed: {rows_inserted} rows")
+                    if total_inserted >= next_log:
+                        next_log = total_inserted + log_every
+                        logger.debug("Inserted %d/%d rows into %s", total_inserted, len(data), table_name)
                 
                 except Exception as e:
                     error_msg = f"Batch {batch_idx + 1} failed: {e}"
@@ -604,38 +931,269 @@ class ParallelDataInserter(DataInserter):
         stats.table_stats[table_name]['rows_inserted'] = total_inserted
         stats.table_stats[table_name]['time_seconds'] = end_time - start_time
         
-        logger.info(f"Parallel insertion completed: {total_inserted:,}/{len(data)} rows in {end_time - start_time:.2f}s")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Parallel insertion completed: %s/%d rows in %.2fs",
+                        format(total_inserted, ','), len(data), end_time - start_time)
         
         return stats
     
-    def _insert_batch_safe(self, table: TableInfo, batch: List[Dict[str, Any]], batch_idx: int) -> int:
-        """Thread-safe batch insertion with individual connection."""
-        if not batch:
-            return 0
+    async def insert_data_async(self, table_name: str, data: List[Dict[str, Any]],
+                                batch_size: int = 1000, max_workers: int = 4,
+                                progress_callback: Optional[Callable] = None) -> GenerationStats:
+        """Awaitable ``insert_data_parallel`` that runs off the event loop thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.insert_data_parallel, table_name, data, batch_size,
+                                    max_workers, progress_callback)
+        )
+    
+    def insert_columns_parallel(self, table_name: str, columns: Dict[str, Any],
+                                batch_size: int = 1000, max_workers: int = 4,
+                                progress_callback: Optional[Callable] = None) -> GenerationStats:
+        """Insert columnar data (e.g. from ``generate_columnar``) without building row dicts.
         
-        try:
-            # Create a new connection for this thread to avoid conflicts
-            thread_db_conn = DatabaseConnection(self.db_connection.config)
-            thread_db_conn.connect()
+        Each batch is zipped into row tuples and bound through one DBAPI ``executemany``.
+        """
+        table = self._get_table(table_name)
+        if not table:
+            logger.warning(f"Table {table_name} not found in schema")
+            return GenerationStats()
+        
+        column_names = list(columns.keys())
+        # tolist() turns NumPy scalars into Python values the drivers can bind
+        values = [col.tolist() if isinstance(col, np.ndarray) else list(col) for col in columns.values()]
+        total_rows = len(values[0]) if values else 0
+        if not total_rows:
+            logger.warning(f"No data to insert for table: {table_name}")
+            return GenerationStats()
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting parallel columnar insertion: %s rows into %s", format(total_rows, ','), table_name)
+        start_time = time.time()
+        
+        stats = GenerationStats()
+        stats.table_stats[table_name] = {
+            'rows_requested': total_rows,
+            'rows_inserted': 0,
+            'errors': []
+        }
+        
+        total_inserted = 0
+        log_every = max(1, total_rows // 20)
+        next_log = log_every
+        batch_starts = range(0, total_rows, batch_size)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_batch = {
+                executor.submit(
+                    self._insert_rows_safe, table, column_names,
+                    list(zip(*(col[start:start + batch_size] for col in values))), batch_idx
+                ): batch_idx
+                for batch_idx, start in enumerate(batch_starts)
+            }
             
-            try:
-                with thread_db_conn.get_session() as session:
-                    # Build insert query with properly quoted column names
-                    column_names = list(batch[0].keys())
-                    placeholders = ', '.join([f':{col}' for col in column_names])
-                    quoted_columns = ', '.join([thread_db_conn.quote_identifier(col) for col in column_names])
-                    
-                    quoted_table = thread_db_conn.quote_identifier(table.name)
-                    query = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
+            for future in as_completed(future_to_batch):
+                batch_idx = future_to_batch[future]
+                try:
+                    total_inserted += future.result(timeout=60)
                     
-                    # Execute batch insert
-                    session.execute(text(query), batch)
-                    session.commit()
+                    if progress_callback:
+                        progress_callback(table_name, total_inserted, total_rows)
                     
-                    return len(batch)
-            finally:
-                thread_db_conn.close()
+                    if total_inserted >= next_log:
+                        next_log = total_inserted + log_every
+                        logger.debug("Inserted %d/%d rows into %s", total_inserted, total_rows, table_name)
+                
+                except Exception as e:
+                    error_msg = f"Batch {batch_idx + 1} failed: {e}"
+                    logger.error(error_msg)
+                    stats.errors.append(error_msg)
+                    stats.table_stats[table_name]['errors'].append(error_msg)
+        
+        end_time = time.time()
+        stats.tables_processed = 1
+        stats.total_rows_generated = total_inserted
+        stats.total_time_seconds = end_time - start_time
+        stats.table_stats[table_name]['rows_inserted'] = total_inserted
+        stats.table_stats[table_name]['time_seconds'] = end_time - start_time
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Parallel columnar insertion completed: %s/%d rows in %.2fs",
+                        format(total_inserted, ','), total_rows, end_time - start_time)
+        
+        return stats
+    
+    def insert_columns_pipelined(self, table_name: str, chunks: Iterable[Dict[str, Any]],
+                                 max_workers: int = 4, prefetch: int = 2,
+                                 progress_callback: Optional[Callable] = None) -> GenerationStats:
+        """Insert columnar chunks while they are still being generated.
+        
+        The calling thread pulls chunks from ``chunks`` (e.g. ``generate_columnar_chunks``)
+        into a bounded queue that ``max_workers`` insert threads drain, so generation
+        and insertion overlap and at most ``prefetch`` chunks wait in memory. Failed
+        inserts are recorded in the returned stats like ``insert_data_parallel``; any
+        other worker error (e.g. from ``progress_callback``) is re-raised here.
+        """
+        table = self._get_table(table_name)
+        if not table:
+            logger.warning(f"Table {table_name} not found in schema")
+            return GenerationStats()
         
+        logger.info("Starting pipelined insertion into %s with %d workers", table_name, max_workers)
+        start_time = time.time()
+        
+        stats = GenerationStats()
+        stats.table_stats[table_name] = {
+            'rows_requested': 0,
+            'rows_inserted': 0,
+            'errors': []
+        }
+        
+        work_queue: queue.Queue = queue.Queue(maxsize=max(1, prefetch))
+        lock = threading.Lock()
+        totals = {'requested': 0, 'inserted': 0}
+        worker_errors: List[BaseException] = []
+        
+        def consume() -> None:
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    return
+                try:
+                    insert_chunk(*item)
+                except Exception as e:
+                    # Keep draining so the producer never blocks on a full queue
+                    with lock:
+                        worker_errors.append(e)
+        
+        def insert_chunk(batch_idx: int, columns: Dict[str, Any]) -> None:
+            if worker_errors:
+                return
+            with _gc_paused():
+                values = [col.tolist() if isinstance(col, np.ndarray) else list(col) for col in columns.values()]
+                rows = list(zip(*values))
+            try:
+                rows_inserted = self._insert_rows_safe(table, list(columns.keys()), rows, batch_idx)
+            except Exception as e:
+                error_msg = f"Batch {batch_idx + 1} failed: {e}"
+                logger.error(error_msg)
+                with lock:
+                    stats.errors.append(error_msg)
+                    stats.table_stats[table_name]['errors'].append(error_msg)
+                return
+            with lock:
+                totals['inserted'] += rows_inserted
+                if progress_callback:
+                    progress_callback(table_name, totals['inserted'], totals['requested'])
+        
+        workers = [threading.Thread(target=consume, daemon=True) for _ in range(max(1, max_workers))]
+        for worker in workers:
+            worker.start()
+        try:
+            for batch_idx, columns in enumerate(chunks):
+                with lock:
+                    totals['requested'] += len(next(iter(columns.values()), ()))
+                work_queue.put((batch_idx, columns))
+        finally:
+            for _ in workers:
+                work_queue.put(None)
+            for worker in workers:
+                worker.join()
+        if worker_errors:
+            raise worker_errors[0]
+        
+        end_time = time.time()
+        stats.tables_processed = 1
+        stats.total_rows_generated = totals['inserted']
+        stats.total_time_seconds = end_time - start_time
+        stats.table_stats[table_name]['rows_requested'] = totals['requested']
+        stats.table_stats[table_name]['rows_inserted'] = totals['inserted']
+        stats.table_stats[table_name]['time_seconds'] = end_time - start_time
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Pipelined insertion completed: %s/%d rows in %.2fs",
+                        format(totals['inserted'], ','), totals['requested'], end_time - start_time)
+        
+        return stats
+    
+    def _insert_rows_safe(self, table: TableInfo, column_names: List[str],
+                          rows: List[tuple], batch_idx: int) -> int:
+        """Insert a batch of row tuples through a raw DBAPI cursor on its own connection."""
+        if not rows:
+            return 0
+        
+        raw_connection = self.db_connection.engine.raw_connection()
+        try:
+            self._execute_rows(raw_connection.cursor(), table.name, column_names, rows)
+            raw_connection.commit()
+            return len(rows)
         except Exception as e:
+            raw_connection.rollback()
             logger.error(f"Thread batch insert failed for batch {batch_idx}: {e}")
             raise
+        finally:
+            raw_connection.close()
+    
+    def _execute_rows(self, cursor, table_name: str, column_names: List[str], rows: List[tuple]) -> None:
+        """Send rows as multi-row INSERTs, picking the cheapest path for the driver.
+        
+        PostgreSQL uses psycopg2's ``execute_values`` and MySQL relies on PyMySQL
+        collapsing ``executemany`` into one statement; otherwise rows are grouped
+        into multi-row VALUES lists below the bind-parameter limit.
+        """
+        driver = self.db_connection.config.driver
+        if driver == "postgresql" and self.bulk_copy:
+            self._copy_rows(cursor, table_name, column_names, rows)
+            return
+        if driver == "postgresql" and execute_values is not None:
+            quoted_columns = ', '.join(self.db_connection.quote_identifier(col) for col in column_names)
+            execute_values(
+                cursor,
+                f"INSERT INTO {self.db_connection.quote_identifier(table_name)} ({quoted_columns}) VALUES %s",
+                rows, page_size=len(rows)
+            )
+            return
+        
+        group_size = 1 if driver == "mysql" else MULTI_ROW_GROUP_SIZE
+        if driver == "sqlite":
+            group_size = max(1, min(group_size, SQLITE_MAX_VARIABLES // len(column_names)))
+        
+        grouped_rows = len(rows) - len(rows) % group_size
+        if grouped_rows and group_size > 1:
+            cursor.executemany(
+                get_insert_sql(self.db_connection, table_name, column_names, group_size),
+                [list(chain.from_iterable(rows[i:i + group_size])) for i in range(0, grouped_rows, group_size)]
+            )
+        else:
+            grouped_rows = 0
+        if grouped_rows < len(rows):
+            cursor.executemany(
+                get_insert_sql(self.db_connection, table_name, column_names, 1),
+                rows[grouped_rows:]
+            )
+    
+    def _copy_rows(self, cursor, table_name: str, column_names: List[str], rows: List[tuple]) -> None:
+        """Stream rows into PostgreSQL with ``COPY ... FROM STDIN`` in CSV form.
+        
+        ``synchronous_commit`` is turned off for the caller's transaction, so the batch
+        skips both per-statement parsing and the wait for the WAL flush; committing or
+        rolling back is left to the connection that owns the cursor.
+        """
+        # NULLs travel as a bare \N marker; all other fields are quoted, so empty
+        # strings stay empty strings and a literal \N text is not read as NULL
+        buffer = io.StringIO("".join(",".join(map(_copy_csv_field, row)) + "\n" for row in rows))
+        
+        quoted_columns = ', '.join(self.db_connection.quote_identifier(col) for col in column_names)
+        cursor.execute("SET LOCAL synchronous_commit = OFF")
+        cursor.copy_expert(
+            f"COPY {self.db_connection.quote_identifier(table_name)} ({quoted_columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
+    
+    def _insert_batch_safe(self, table: TableInfo, batch: List[Dict[str, Any]], batch_idx: int) -> int:
+        """Thread-safe batch insertion of row dicts via the multi-row tuple path."""
+        if not batch:
+            return 0
+        
+        column_names = list(batch[0].keys())
+        rows = [tuple(map(row.get, column_names)) for row in batch]
+        return self._insert_rows_safe(table, column_names, rows, batch_idx)
@@ -4,7 +4,10 @@ Designed specifically for generating and inserting millions of records with maxi
 """
 
 import logging
+import math
+import re
 import time
+from functools import lru_cache
 import gc
 import psutil
 import threading
@@ -21,6 +24,7 @@ import sqlite3
 import io
 import csv
 import json
+from decimal import Decimal
 from pathlib import Path
 
 from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, DateTime, Boolean, Float
@@ -28,17 +32,79 @@ from sqlalchemy.dialects import postgresql, mysql, sqlite
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import QueuePool, StaticPool
 
-from .models import DatabaseSchema, TableInfo, GenerationConfig, ColumnType
+from .models import DatabaseSchema, TableInfo, GenerationConfig, ColumnType, ConstraintType
 from .database import DatabaseConnection
 from .enhanced_models import (
     EnhancedGenerationConfig, PerformanceMode, DuplicateStrategy, 
     InsertionStrategy, PerformanceReport
 )
 from .fast_data_reuse import FastDataReuser, create_fast_data_reuser, DataReuse
+from .kernels_numba import fill_int_uniform, fill_float_uniform, fill_timestamp, fill_choice, NS_PER_DAY
 
 
 logger = logging.getLogger(__name__)
 
+# Simple range predicates in CHECK constraints, e.g. "age >= 18", "65 > age" or "qty BETWEEN 1 AND 10"
+_CHECK_COMPARISON = re.compile(r'(\w+)\s*(>=|<=|>|<)\s*(-?\d+(?:\.\d+)?)')
+_CHECK_REVERSED = re.compile(r'(?<![\w.])(-?\d+(?:\.\d+)?)\s*(>=|<=|>|<)\s*([a-z_]\w*)')
+_FLIPPED_OPERATORS = {'>=': '<=', '<=': '>=', '>': '<', '<': '>'}
+_CHECK_BETWEEN = re.compile(r'(\w+)\s+between\s+(-?\d+(?:\.\d+)?)\s+and\s+(-?\d+(?:\.\d+)?)')
+
+# Invariant string components, built once per process and indexed per batch
+_PREFIXES = ["user", "admin", "test", "prod", "dev", "demo", "temp", "sys",
+             "app", "web", "api", "db", "cache", "queue", "worker", "service"]
+_SUFFIXES = ["001", "002", "003", "data", "info", "main", "backup", "temp",
+             "new", "old", "active", "inactive", "primary", "secondary"]
+_WORDS = ["apple", "banana", "cherry", "dragon", "eagle", "forest", "garden", "house",
+          "island", "jungle", "kingdom", "laptop", "mountain", "network", "ocean", "planet"]
+_NAME_PREFIXES = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Phoenix', 'Dragon', 'Eagle', 'Tiger']
+
+_POOLS: Dict[str, np.ndarray] = {
+    'email_domain': np.array(["example.com", "test.org", "demo.net", "fake.io", "mock.dev"], dtype=object),
+    'phone_format': np.array(["###-###-####", "(###) ###-####", "###.###.####"], dtype=object),
+    'word': np.array(_WORDS, dtype=object),
+    'text': np.array(['Sample description', 'Lorem ipsum text', 'Generated content'], dtype=object),
+    'common': np.array([f"{prefix}_{suffix}" for prefix in _PREFIXES[:8] for suffix in _SUFFIXES[:8]] +
+                       [f"{word}{i}" for word in _WORDS[:10] for i in range(100, 1000, 100)], dtype=object),
+    'name': np.array([f"{prefix}{i}" for prefix in _NAME_PREFIXES for i in range(1000, 10000)], dtype=object),
+    'json_provider': np.array([json.dumps(provider) for provider in
+                               ["Stripe", "Fynd", "Jio", "Razorpay", "Openapi", "Jiopay"]], dtype=object),
+    'json_bool': np.array(['false', 'true'], dtype=object),
+}
+
+# Fixed-shape JSON payloads, formatted exactly as json.dumps would render them
+_JSON_AGGREGATOR_TEMPLATE = '{%s: "cust_%d"}'
+_JSON_DEFAULT_TEMPLATE = '{"id": %d, "type": "default", "active": %s}'
+
+
+def _pick(pool: np.ndarray, n: int) -> np.ndarray:
+    """Return ``n`` values drawn uniformly from a pool with one index draw."""
+    return pool[fill_choice(len(pool), n)]
+
+
+@lru_cache(maxsize=None)
+def _name_pool(max_length: int) -> np.ndarray:
+    """The name pool truncated to ``max_length`` characters."""
+    pool = _POOLS['name']
+    if max_length >= max(map(len, pool)):
+        return pool
+    return np.array([name[:max_length] for name in pool], dtype=object)
+
+
+# One NumPy array or value list per column, all of the batch's length (struct of arrays)
+ColumnBatch = Dict[str, Union[np.ndarray, List[Any]]]
+
+
+def _column_lists(columns: ColumnBatch) -> List[List[Any]]:
+    """Per-column Python value lists, converting NumPy arrays in one C-level pass each."""
+    return [values.tolist() if isinstance(values, np.ndarray) else values
+            for values in columns.values()]
+
+
+def _batch_length(columns: ColumnBatch) -> int:
+    """Number of rows in a column batch."""
+    return len(next(iter(columns.values()))) if columns else 0
+
 
 @dataclass
 class UltraFastTask:
@@ -145,58 +211,33 @@ class UltraFastStringGenerator:
     
     def __init__(self):
         """Initialize string generator."""
-        # Pre-computed string components
-        self.prefixes = [
-            "user", "admin", "test", "prod", "dev", "demo", "temp", "sys",
-            "app", "web", "api", "db", "cache", "queue", "worker", "service"
-        ]
-        
-        self.suffixes = [
-            "001", "002", "003", "data", "info", "main", "backup", "temp",
-            "new", "old", "active", "inactive", "primary", "secondary"
-        ]
-        
-        self.words = [
-            "apple", "banana", "cherry", "dragon", "eagle", "forest", "garden", "house",
-            "island", "jungle", "kingdom", "laptop", "mountain", "network", "ocean", "planet"
-        ]
-        
-        # Pre-compute common combinations
-        self._precompute_combinations()
+        # String components are module-level pools shared by every generator
+        self.prefixes = _PREFIXES
+        self.suffixes = _SUFFIXES
+        self.words = _WORDS
+        self.email_domains = _POOLS['email_domain']
+        self.phone_formats = _POOLS['phone_format']
+        self.common_strings = _POOLS['common']
         
         logger.info(f"🔤 Initialized ultra-fast string generator")
     
-    def _precompute_combinations(self):
-        """Pre-compute common string combinations."""
-        self.email_domains = ["example.com", "test.org", "demo.net", "fake.io", "mock.dev"]
-        self.phone_formats = ["###-###-####", "(###) ###-####", "###.###.####"]
-        
-        # Pre-generate common patterns
-        self.common_strings = []
-        for prefix in self.prefixes[:8]:
-            for suffix in self.suffixes[:8]:
-                self.common_strings.append(f"{prefix}_{suffix}")
-        
-        for word in self.words[:10]:
-            for i in range(100, 1000, 100):
-                self.common_strings.append(f"{word}{i}")
-    
     def generate_batch(self, count: int, pattern: str = "default", 
                       max_length: int = 50) -> List[str]:
         """Generate batch of strings ultra-fast."""
+        # Each branch draws all of its random picks in one NumPy call
         if pattern == "email":
-            return [f"user{i}@{np.random.choice(self.email_domains)}" 
-                   for i in range(count)]
+            domains = _pick(self.email_domains, count).tolist()
+            return [f"user{i}@{domain}" for i, domain in enumerate(domains)]
         elif pattern == "name":
-            return [f"{np.random.choice(self.words).title()}{i}" 
-                   for i in range(count)]
+            words = _pick(_POOLS['word'], count).tolist()
+            return [f"{word.title()}{i}" for i, word in enumerate(words)]
         elif pattern == "phone":
-            format_template = np.random.choice(self.phone_formats)
-            return [format_template.replace("#", str(np.random.randint(0, 9)))
-                   for _ in range(count)]
+            format_template = _pick(self.phone_formats, 1)[0]
+            digits = np.random.randint(0, 9, size=count).astype(str).tolist()
+            return [format_template.replace("#", digit) for digit in digits]
         else:
             # Use pre-computed combinations for speed
-            return [np.random.choice(self.common_strings) for _ in range(count)]
+            return _pick(self.common_strings, count).tolist()
 
 
 class UltraFastDataGenerator:
@@ -216,6 +257,12 @@ class UltraFastDataGenerator:
         # Pre-allocate arrays for batch generation
         self.batch_arrays = {}
         
+        # (referenced table, referenced column) -> array of parent key values
+        self.parent_pk_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        
+        # Guards the next_val counters of 'sequence' strategies across worker threads
+        self._sequence_lock = threading.Lock()
+        
         # Performance tracking
         self.rows_generated = 0
         self.start_time = None
@@ -322,11 +369,32 @@ class UltraFastDataGenerator:
             else:
                 strategy['min_val'] = column.min_value or 1
                 strategy['max_val'] = column.max_value or 100000  # More reasonable than 1M
+            
+            low, high = self._check_bounds(column, step=1)
+            if strategy['method'] == 'numpy_int' and self._is_unique_key_column(column):
+                # Unique by construction: consecutive values after the current maximum,
+                # unless the column's upper bound cannot hold every requested row
+                next_val = max(self._next_key_value(column), column.min_value or 1,
+                               math.ceil(low) if low is not None else 1)
+                upper_bounds = [bound for bound in (high, column.max_value) if bound is not None]
+                if not upper_bounds or next_val + self._requested_rows() - 1 <= min(upper_bounds):
+                    strategy['method'] = 'sequence'
+                    strategy['next_val'] = next_val
+                else:
+                    logger.debug(f"Upper bound on {column.name} cannot hold a key sequence; drawing at random")
+            
+            if strategy['method'] == 'numpy_int':
+                # fill_int_uniform excludes max_val, so an inclusive CHECK bound moves up by one
+                if low is not None:
+                    strategy['min_val'] = max(strategy['min_val'], math.ceil(low))
+                if high is not None:
+                    strategy['max_val'] = min(strategy['max_val'], math.floor(high) + 1)
         
         elif column.data_type in [ColumnType.FLOAT, ColumnType.DOUBLE]:
             strategy['method'] = 'numpy_float'
             strategy['min_val'] = column.min_value or 0.0
             strategy['max_val'] = column.max_value or 10000.0  # More reasonable range
+            self._apply_check_bounds(strategy, column, step=1e-6)
         
         # Handle DECIMAL columns
         elif column.data_type == ColumnType.DECIMAL:
@@ -335,6 +403,7 @@ class UltraFastDataGenerator:
             strategy['max_val'] = column.max_value or 10000.0
             strategy['precision'] = getattr(column, 'precision', 10)
             strategy['scale'] = getattr(column, 'scale', 2)
+            self._apply_check_bounds(strategy, column, step=10.0 ** -(strategy['scale'] or 0))
         
         # Handle string columns with smart type detection
         elif column.data_type in [ColumnType.VARCHAR, ColumnType.TEXT, ColumnType.CHAR]:
@@ -376,11 +445,87 @@ class UltraFastDataGenerator:
         else:
             strategy['method'] = 'fallback'
         
+        if strategy['method'] == 'enum':
+            strategy['enum_pool'] = np.array(strategy['enum_values'], dtype=object)
+        
         # Add null avoidance flag - never generate nulls for NOT NULL columns
         strategy['avoid_null'] = not strategy.get('nullable', True)
         
         return strategy
     
+    def _is_unique_key_column(self, column) -> bool:
+        """Check if a column alone forms the current table's primary key or a UNIQUE constraint."""
+        for constraint in self.current_table.constraints:
+            if (constraint.type in (ConstraintType.PRIMARY_KEY, ConstraintType.UNIQUE)
+                    and constraint.columns == [column.name]):
+                return True
+        return False
+    
+    def _requested_rows(self) -> int:
+        """Rows the config asks for in the current table (1 when it does not say)."""
+        table_name = self.current_table.name
+        if table_name in self.config.target_rows_per_table:
+            return self.config.target_rows_per_table[table_name]
+        table_config = self.config.table_configs.get(table_name)
+        return table_config.rows_to_generate if table_config else 1
+    
+    def _next_key_value(self, column) -> int:
+        """First value above the column's current maximum (1 for an empty table)."""
+        try:
+            if self.db_connection:
+                quote = self.db_connection.quote_identifier
+                result = self.db_connection.execute_query(
+                    f"SELECT MAX({quote(column.name)}) FROM {quote(self.current_table.name)}")
+                if result and result[0][0] is not None:
+                    return int(result[0][0]) + 1
+        except Exception as e:
+            logger.debug(f"Could not read MAX({column.name}) from {self.current_table.name}: {e}")
+        return 1
+    
+    def _check_bounds(self, column, step: float) -> Tuple[Optional[float], Optional[float]]:
+        """Inclusive bounds implied by the current table's simple range CHECKs on ``column``.
+        
+        Strict comparisons are tightened by ``step``; ``18 <= age`` reads as ``age >= 18``.
+        Conditions using OR or NOT are ignored.
+        """
+        low = high = None
+        name = column.name.lower()
+        
+        for constraint in self.current_table.constraints:
+            if constraint.type != ConstraintType.CHECK or not constraint.check_condition:
+                continue
+            # Drop identifier quoting so "age", `age` and [age] compare as age
+            condition = re.sub(r'["`\[\]]', '', constraint.check_condition.lower())
+            if re.search(r'\b(or|not)\b', condition):
+                continue
+            
+            bounds = []
+            for col, between_low, between_high in _CHECK_BETWEEN.findall(condition):
+                if col == name:
+                    bounds += [('>=', between_low), ('<=', between_high)]
+            bounds += [(op, value) for col, op, value in _CHECK_COMPARISON.findall(condition) if col == name]
+            bounds += [(_FLIPPED_OPERATORS[op], value)
+                       for value, op, col in _CHECK_REVERSED.findall(condition) if col == name]
+            
+            for op, value in bounds:
+                value = float(value)
+                if op in ('>=', '>'):
+                    value = value + step if op == '>' else value
+                    low = value if low is None else max(low, value)
+                else:
+                    value = value - step if op == '<' else value
+                    high = value if high is None else min(high, value)
+        
+        return low, high
+    
+    def _apply_check_bounds(self, strategy: Dict[str, Any], column, step: float) -> None:
+        """Narrow a float/decimal strategy's [min_val, max_val) draw range to its CHECK bounds."""
+        low, high = self._check_bounds(column, step)
+        if low is not None:
+            strategy['min_val'] = max(strategy['min_val'], low)
+        if high is not None:
+            strategy['max_val'] = min(strategy['max_val'], high)
+    
     def _get_enum_values(self, column_name: str) -> List[str]:
         """Get ENUM values for a specific column by querying INFORMATION_SCHEMA."""
         try:
@@ -474,19 +619,34 @@ class UltraFastDataGenerator:
                     # For unique FKs, get unused values or create new referenced records
                     return self._generate_unique_fk_batch(referenced_table, referenced_column, column_name, batch_size)
                 else:
-                    # For non-unique FKs, get any available values
-                    query = f"SELECT DISTINCT {referenced_column} FROM {referenced_table} WHERE {referenced_column} IS NOT NULL LIMIT 1000"
-                    result = self.db_connection.execute_query(query)
-                    if result:
-                        available_values = [row[0] for row in result]
-                        if available_values:
-                            return [random.choice(available_values) for _ in range(batch_size)]
+                    # For non-unique FKs, index the cached parent keys with one vectorized draw
+                    pool = self._parent_key_pool(referenced_table, referenced_column)
+                    if pool is not None:
+                        return _pick(pool, batch_size)
         except Exception as e:
             logger.warning(f"Failed to fetch FK values for {referenced_table}.{referenced_column}: {e}")
         
         # Fallback to a reasonable range for FK values
         return [random.randint(1, 10) for _ in range(batch_size)]
     
+    def _parent_key_pool(self, referenced_table: str, referenced_column: str) -> Optional[np.ndarray]:
+        """Referenced key values as an array, loaded once and reused for every batch.
+        
+        Empty results are not cached, so a parent table filled later is picked up.
+        """
+        key = (referenced_table, referenced_column)
+        pool = self.parent_pk_cache.get(key)
+        if pool is None:
+            query = f"SELECT DISTINCT {referenced_column} FROM {referenced_table} WHERE {referenced_column} IS NOT NULL"
+            result = self.db_connection.execute_query(query)
+            if not result:
+                return None
+            pool = np.array([row[0] for row in result])
+            if pool.dtype.kind not in 'iu':
+                pool = pool.astype(object)  # keep str/Decimal keys as bindable Python objects
+            self.parent_pk_cache[key] = pool
+        return pool
+    
     def _is_unique_fk_column(self, column_name: str) -> bool:
         """Check if FK column has unique constraint."""
         if hasattr(self, 'current_table') and self.current_table:
@@ -586,42 +746,30 @@ class UltraFastDataGenerator:
     
     def generate_ultra_fast_batch(self, table_name: str, batch_size: int, 
                                  offset: int = 0) -> List[Dict[str, Any]]:
-        """Generate batch using ultra-fast methods."""
+        """Generate batch using ultra-fast methods, as one dict per row."""
+        column_data = self.generate_ultra_fast_columns(table_name, batch_size, offset)
+        column_names = list(column_data)
+        return [dict(zip(column_names, row)) for row in zip(*_column_lists(column_data))]
+    
+    def generate_ultra_fast_columns(self, table_name: str, batch_size: int,
+                                    offset: int = 0) -> ColumnBatch:
+        """Generate batch using ultra-fast methods, as one array or list per column."""
         if table_name not in self.table_strategies:
             logger.error(f"No strategy found for table {table_name}")
-            return []
-        
-        strategy = self.table_strategies[table_name]
-        table = self.schema.get_table(table_name)
-        
-        # Pre-allocate result array
-        batch_data = []
+            return {}
         
         # Generate using vectorized operations where possible
         column_data = {}
         
-        for column in table.columns:
-            # Skip auto-increment columns - let the database handle them
-            if hasattr(column, 'is_auto_increment') and column.is_auto_increment:
-                continue
-            col_strategy = strategy['column_strategies'][column.name]
-            column_data[column.name] = self._generate_column_batch(
-                col_strategy, batch_size, offset
-            )
+        # Column strategies were resolved once per table, in column order and without
+        # auto-increment columns, so a batch only dispatches on each column's method
+        for column_name, col_strategy in self.table_strategies[table_name]['column_strategies'].items():
+            values = self._generate_column_batch(col_strategy, batch_size, offset)
+            if not isinstance(values, (np.ndarray, list)):
+                values = [values] * batch_size
+            column_data[column_name] = values
         
-        # Combine into rows
-        for i in range(batch_size):
-            row = {}
-            for col_name, values in column_data.items():
-                if isinstance(values, np.ndarray):
-                    row[col_name] = values[i].item()
-                elif isinstance(values, list):
-                    row[col_name] = values[i]
-                else:
-                    row[col_name] = values
-            batch_data.append(row)
-        
-        return batch_data
+        return column_data
     
     def _generate_column_batch(self, strategy: Dict[str, Any], 
                               batch_size: int, offset: int) -> Union[np.ndarray, List[Any]]:
@@ -630,17 +778,17 @@ class UltraFastDataGenerator:
         
         # Handle boolean columns properly (return 0/1 instead of large integers)
         if method == 'boolean':
-            return np.random.randint(0, 2, size=batch_size)  # More compatible way to generate 0/1
+            return fill_int_uniform(0, 2, batch_size)  # 0/1 rather than True/False for compatibility
         
         # Handle datetime/timestamp columns
         elif method == 'datetime':
             from datetime import datetime, timedelta
-            import random
             base_date = datetime.now() - timedelta(days=365)  # Start from 1 year ago
-            return [(base_date + timedelta(days=random.randint(0, 365), 
-                                         hours=random.randint(0, 23),
-                                         minutes=random.randint(0, 59))).strftime('%Y-%m-%d %H:%M:%S')
-                   for i in range(batch_size)]
+            start_ns = int(np.datetime64(base_date, 'ns').astype(np.int64))
+            stamps = fill_timestamp(start_ns, start_ns + 366 * NS_PER_DAY, batch_size)
+            # Vectorized '%Y-%m-%d %H:%M:%S' formatting
+            formatted = np.datetime_as_string(stamps.astype('datetime64[ns]'), unit='s')
+            return np.char.replace(formatted, 'T', ' ').tolist()
         
         # Handle foreign key columns
         elif method == 'foreign_key':
@@ -655,7 +803,7 @@ class UltraFastDataGenerator:
             if min_val >= max_val:
                 max_val = min_val + 1000
             
-            return np.random.randint(min_val, max_val, size=batch_size, dtype=np.int64)
+            return fill_int_uniform(min_val, max_val, batch_size)
         
         # Handle float columns
         elif method == 'numpy_float':
@@ -666,10 +814,17 @@ class UltraFastDataGenerator:
             if min_val >= max_val:
                 max_val = min_val + 1000.0
                 
-            return np.random.uniform(min_val, max_val, size=batch_size)
+            return fill_float_uniform(min_val, max_val, batch_size)
+        
+        elif method == 'sequence':
+            # Hand out a disjoint block per batch; no set of seen values is needed
+            with self._sequence_lock:
+                start = strategy['next_val']
+                strategy['next_val'] = start + batch_size
+            return np.arange(start, start + batch_size, dtype=np.int64)
         
         elif method == 'numpy_bool':
-            return np.random.randint(0, 2, size=batch_size)  # Use 0/1 instead of True/False
+            return fill_int_uniform(0, 2, batch_size)  # Use 0/1 instead of True/False
         
         # Handle string columns with improved generation
         elif method.startswith('string_'):
@@ -678,69 +833,39 @@ class UltraFastDataGenerator:
             
             # Generate specific types instead of using generic string generator
             if pattern == 'email':
-                domains = ['test.org', 'example.com', 'demo.net', 'fake.io', 'mock.dev']
-                return [f"user{offset + i}@{np.random.choice(domains)}" 
-                       for i in range(batch_size)]
+                picks = _pick(_POOLS['email_domain'], batch_size).tolist()
+                return [f"user{offset + i}@{domain}" for i, domain in enumerate(picks)]
             elif pattern == 'id':
                 # Add randomness to avoid collisions with existing unique values
-                import random
                 base_id = random.randint(100000, 999999)
                 return [f"ID{base_id + i:06d}" for i in range(batch_size)]
             elif pattern == 'text':
-                texts = ['Sample description', 'Lorem ipsum text', 'Generated content']
-                return [f"{np.random.choice(texts)} {offset + i}" for i in range(batch_size)]
+                picks = _pick(_POOLS['text'], batch_size).tolist()
+                return [f"{text} {offset + i}" for i, text in enumerate(picks)]
             elif pattern in ['name', 'default']:
                 # Add randomness to avoid collisions for potentially unique string columns
-                import random
-                prefixes = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Phoenix', 'Dragon', 'Eagle', 'Tiger']
-                max_length = strategy.get('max_length', 50)
-                results = []
-                for i in range(batch_size):
-                    prefix = np.random.choice(prefixes)
-                    suffix = random.randint(1000, 9999)
-                    generated = f"{prefix}{suffix}"
-                    # Truncate to max_length if needed
-                    if len(generated) > max_length:
-                        generated = generated[:max_length]
-                    results.append(generated)
-                return results
+                return _pick(_name_pool(max_length), batch_size)
             else:
                 # Use the existing string generator for other patterns
                 return self.string_generator.generate_batch(batch_size, pattern, max_length)
         
         # Handle JSON columns
         elif method == 'json_aggregator':
-            # Generate simple aggregator JSON objects
-            import json
-            providers = ["Stripe", "Fynd", "Jio", "Razorpay", "Openapi", "Jiopay"]
-            result = []
-            for i in range(batch_size):
-                provider = np.random.choice(providers)
-                data = {provider: f"cust_{np.random.randint(100, 999)}"}
-                result.append(json.dumps(data))
-            return result
+            # Fill a json.dumps-identical template with pre-encoded keys instead of dumping a dict per row
+            keys = _pick(_POOLS['json_provider'], batch_size).tolist()
+            ids = fill_int_uniform(100, 999, batch_size).tolist()
+            return [_JSON_AGGREGATOR_TEMPLATE % pair for pair in zip(keys, ids)]
         
         elif method == 'json_default':
-            # Generate simple JSON objects
-            import json
-            result = []
-            for i in range(batch_size):
-                data = {
-                    "id": offset + i,
-                    "type": "default", 
-                    "active": bool(np.random.randint(0, 2))
-                }
-                result.append(json.dumps(data))
-            return result
+            flags = _POOLS['json_bool'][fill_choice(2, batch_size)].tolist()
+            return [_JSON_DEFAULT_TEMPLATE % (offset + i, flag) for i, flag in enumerate(flags)]
         
         # Handle ENUM columns
         elif method == 'enum':
-            enum_values = strategy.get('enum_values', ['default'])
-            return [np.random.choice(enum_values) for _ in range(batch_size)]
+            return _pick(strategy['enum_pool'], batch_size)
         
         # Handle DECIMAL columns
         elif method == 'decimal':
-            from decimal import Decimal
             min_val = strategy.get('min_val', 0.0)
             max_val = strategy.get('max_val', 10000.0)
             scale = strategy.get('scale', 2)
@@ -749,14 +874,9 @@ class UltraFastDataGenerator:
             if min_val >= max_val:
                 max_val = min_val + 1000.0
             
-            result = []
-            for i in range(batch_size):
-                # Generate random float and convert to Decimal with proper scale
-                random_float = np.random.uniform(min_val, max_val)
-                # Round to the specified scale
-                decimal_value = Decimal(str(round(random_float, scale)))
-                result.append(decimal_value)
-            return result
+            # Draw and round the whole column at once; only the Decimal wrapping is per value
+            values = fill_float_uniform(min_val, max_val, batch_size).round(scale)
+            return [Decimal(str(value)) for value in values.tolist()]
         
         else:
             # Improved fallback generation
@@ -776,6 +896,7 @@ class UltraFastInserter:
         
         # Prepare for bulk operations
         self.prepared_statements = {}
+        self.positional_statements: Dict[Tuple[str, Tuple[str, ...]], str] = {}
         
         logger.info(f"🚀 Ultra-fast inserter initialized")
     
@@ -843,38 +964,76 @@ class UltraFastInserter:
         stmt = f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})"
         self.prepared_statements[table_name] = stmt
     
+    def ultra_fast_insert_columns(self, table_name: str, columns: ColumnBatch) -> int:
+        """Insert a column batch, building positional row tuples only as the driver reads them.
+        
+        Skips per-row dicts and SQLAlchemy's named-parameter processing entirely.
+        """
+        if not columns:
+            return 0
+        
+        key = (table_name, tuple(columns))
+        stmt = self.positional_statements.get(key)
+        if stmt is None:
+            placeholder = '?' if self.engine.dialect.paramstyle == 'qmark' else '%s'
+            quoted_columns = ', '.join(self._quote_identifier(col) for col in columns)
+            stmt = (f"INSERT INTO {self._quote_identifier(table_name)} ({quoted_columns}) "
+                    f"VALUES ({', '.join([placeholder] * len(columns))})")
+            self.positional_statements[key] = stmt
+        
+        with self.engine.connect() as conn:
+            self._apply_session_settings(conn)
+            try:
+                # The DB-API cursor consumes a lazy row iterator, so only the column
+                # lists are materialized rather than a full list of row tuples
+                values = _column_lists(columns)
+                if self.db_config.driver == 'sqlite':
+                    # sqlite3 cannot bind Decimal; NUMERIC affinity parses the exact text form
+                    values = [[str(v) for v in col] if col and isinstance(col[0], Decimal) else col
+                              for col in values]
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.executemany(stmt, zip(*values))
+                finally:
+                    cursor.close()
+                conn.commit()
+            except Exception as e:
+                logger.error(f"Ultra-fast bulk insert failed: {e}")
+                raise
+        return _batch_length(columns)
+    
+    def _apply_session_settings(self, conn) -> None:
+        """Apply database-specific bulk-load settings to a connection."""
+        if self.db_config.driver == 'sqlite':
+            # SQLite-specific optimizations; journal mode stays WAL from the
+            # connection PRAGMA bundle, leaving it needs exclusive access
+            conn.execute(text("PRAGMA synchronous = OFF"))
+            conn.execute(text("PRAGMA temp_store = MEMORY"))
+            conn.execute(text("PRAGMA cache_size = 100000"))
+        
+        elif self.db_config.driver == 'postgresql':
+            # PostgreSQL-specific optimizations
+            conn.execute(text("SET synchronous_commit = OFF"))
+            conn.execute(text("SET wal_buffers = '16MB'"))
+            conn.execute(text("SET checkpoint_segments = 32"))
+        
+        elif self.db_config.driver == 'mysql':
+            # MySQL-specific optimizations
+            # Don't set autocommit=0 since DatabaseConnection already handles isolation_level
+            conn.execute(text("SET unique_checks = 0"))
+            conn.execute(text("SET foreign_key_checks = 0"))
+            # Enable autocommit for this specific operation to ensure immediate commit
+            conn.execute(text("SET autocommit = 1"))
+    
     def _execute_bulk_insert(self, table_name: str, data: List[Dict[str, Any]]) -> int:
         """Execute bulk insert with database-specific optimizations."""
         stmt = self.prepared_statements[table_name]
         
         with self.engine.connect() as conn:
-            # Configure database-specific optimizations
-            if self.db_config.driver == 'sqlite':
-                # SQLite-specific optimizations
-                conn.execute(text("PRAGMA synchronous = OFF"))
-                conn.execute(text("PRAGMA journal_mode = MEMORY"))
-                conn.execute(text("PRAGMA temp_store = MEMORY"))
-                conn.execute(text("PRAGMA cache_size = 100000"))
-            
-            elif self.db_config.driver == 'postgresql':
-                # PostgreSQL-specific optimizations
-                conn.execute(text("SET synchronous_commit = OFF"))
-                conn.execute(text("SET wal_buffers = '16MB'"))
-                conn.execute(text("SET checkpoint_segments = 32"))
-            
-            elif self.db_config.driver == 'mysql':
-                # MySQL-specific optimizations
-                # Don't set autocommit=0 since DatabaseConnection already handles isolation_level
-                conn.execute(text("SET unique_checks = 0"))
-                conn.execute(text("SET foreign_key_checks = 0"))
+            self._apply_session_settings(conn)
             
             # Execute bulk insert with proper transaction management
             try:
-                # For AUTOCOMMIT mode, execute directly without manual transaction management
-                if self.db_config.driver == "mysql":
-                    # Enable autocommit for this specific operation to ensure immediate commit
-                    conn.execute(text("SET autocommit = 1"))
-                
                 conn.execute(text(stmt), data)
                 
                 # Ensure the operation is flushed immediately
@@ -982,14 +1141,14 @@ class UltraFastProcessor:
                 
                 # Generate batch
                 batch_gen_start = time.time()
-                batch_data = self.generator.generate_ultra_fast_batch(
+                batch_columns = self.generator.generate_ultra_fast_columns(
                     table_name, current_batch_size, batch_start
                 )
                 batch_gen_time = time.time() - batch_gen_start
                 
                 # Insert batch
                 batch_insert_start = time.time()
-                inserted = self.inserter.ultra_fast_insert(table_name, batch_data)
+                inserted = self.inserter.ultra_fast_insert_columns(table_name, batch_columns)
                 batch_insert_time = time.time() - batch_insert_start
                 
                 total_inserted += inserted
@@ -1000,7 +1159,7 @@ class UltraFastProcessor:
                     progress_callback(table_name, total_inserted, total_rows)
                 
                 # Performance metrics
-                gen_rate = len(batch_data) / batch_gen_time if batch_gen_time > 0 else 0
+                gen_rate = _batch_length(batch_columns) / batch_gen_time if batch_gen_time > 0 else 0
                 insert_rate = inserted / batch_insert_time if batch_insert_time > 0 else 0
                 
                 logger.info(f"📊 Batch {batch_number}: Gen={gen_rate:,.0f} rows/s, Insert={insert_rate:,.0f} rows/s")
@@ -1096,11 +1255,11 @@ class UltraFastProcessor:
         for batch_start in range(0, total_rows, batch_size):
             current_batch_size = min(batch_size, total_rows - batch_start)
             
-            batch_data = self.generator.generate_ultra_fast_batch(
+            batch_columns = self.generator.generate_ultra_fast_columns(
                 table_name, current_batch_size, batch_start
             )
             
-            inserted = self.inserter.ultra_fast_insert(table_name, batch_data)
+            inserted = self.inserter.ultra_fast_insert_columns(table_name, batch_columns)
             total_inserted += inserted
             
             if progress_callback:
@@ -1124,7 +1283,7 @@ class UltraFastProcessor:
         
         try:
             # Enhanced progress callback that includes performance tracking
-            def enhanced_progress_callback(table, current, total):
+            def enhanced_progress_callback(table, current, total, batch_size):
                 if progress_callback:
                     progress_callback(table, current, total)
                 
@@ -1172,11 +1331,11 @@ class UltraFastProcessor:
             batch_end = min(batch_start + task.batch_size, task.row_end)
             batch_size = batch_end - batch_start
             
-            batch_data = self.generator.generate_ultra_fast_batch(
+            batch_columns = self.generator.generate_ultra_fast_columns(
                 task.table_name, batch_size, batch_start
             )
             
-            inserted = self.inserter.ultra_fast_insert(task.table_name, batch_data)
+            inserted = self.inserter.ultra_fast_insert_columns(task.table_name, batch_columns)
             total_inserted += inserted
         
         return {
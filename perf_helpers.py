@@ -0,0 +1,77 @@
+"""SQLite database helpers shared by the root-level test and performance scripts."""
+
+import os
+import tempfile
+
+from sqlalchemy import text
+
+from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+
+
+# Tables the performance scripts generate into
+PERF_TABLES_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS test_users (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        email TEXT,
+        status TEXT,
+        age INTEGER,
+        created_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS test_products (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        category TEXT,
+        status TEXT,
+        priority INTEGER
+    )
+    """,
+)
+
+
+def scratch_db_dir() -> str:
+    """Directory for the root scripts' scratch databases.
+    
+    tmpfs (``/dev/shm``) when it is writable, so bulk loads never wait on fsync;
+    otherwise the system temp directory.
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def make_perf_db_config() -> DatabaseConfig:
+    """Config for a fresh on-disk SQLite database (WAL) that worker threads can share."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    return DatabaseConfig(
+        host="localhost",
+        port=0,  # SQLite ignores the port
+        database=path,
+        username="",
+        password="",
+        driver="sqlite"
+    )
+
+
+def create_perf_database(db_config: DatabaseConfig) -> DatabaseConnection:
+    """Connect to a performance test database and create its tables."""
+    db_conn = DatabaseConnection(db_config)
+    db_conn.connect()
+    with db_conn.get_session() as session:
+        for ddl in PERF_TABLES_DDL:
+            session.execute(text(ddl))
+        session.commit()
+    return db_conn
+
+
+def remove_sqlite_files(path: str) -> None:
+    """Delete a SQLite database file together with its WAL companions."""
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.unlink(path + suffix)
+        except FileNotFoundError:
+            pass
@@ -6,16 +6,21 @@ Demonstrates ultra-fast insertion of millions of records by reusing existing dat
 
 import os
 import sys
+import shutil
 import sqlite3
 import time
 import logging
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+from dbmocker.core.database import DatabaseConnection, DatabaseConfig, tune_sqlite_connection
+from sqlalchemy import text
+
 from dbmocker.core.analyzer import SchemaAnalyzer
 from dbmocker.core.enhanced_models import (
     EnhancedGenerationConfig, PerformanceMode, DuplicateStrategy,
@@ -23,6 +28,7 @@ from dbmocker.core.enhanced_models import (
 )
 from dbmocker.core.ultra_fast_processor import create_ultra_fast_processor
 from dbmocker.core.fast_data_reuse import create_fast_data_reuser
+from perf_helpers import scratch_db_dir
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +38,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pass --persist to copy the final scratch database back into the project directory
+DB_DIR = Path(scratch_db_dir()) / "dbmocker_tests"
+DB_DIR.mkdir(exist_ok=True)
+
+# Analyzed schemas keyed by database path; the test schema never changes between tests
+_SCHEMA_CACHE = {}
+
+def _get_schema(db_conn):
+    """Analyze the database schema once and reuse it for every test."""
+    key = db_conn.config.database
+    if key not in _SCHEMA_CACHE:
+        _SCHEMA_CACHE[key] = SchemaAnalyzer(db_conn).analyze_schema()
+    return _SCHEMA_CACHE[key]
+
 def print_header(title: str):
     """Print formatted header."""
     print(f"\n{'='*60}")
@@ -44,9 +64,13 @@ def print_section(title: str):
     print(f"📊 {title}")
     print(f"{'-'*40}")
 
+def multi_row_placeholders(columns: int, rows: int) -> str:
+    """Build the VALUES list for inserting all rows in one statement."""
+    return ",".join(["(" + ",".join(["?"] * columns) + ")"] * rows)
+
 def create_test_database_with_existing_data():
     """Create test database with some existing data."""
-    db_path = project_root / "fast_reuse_test.db"
+    db_path = DB_DIR / "fast_reuse_test.db"
     
     # Remove existing database
     if db_path.exists():
@@ -54,8 +78,12 @@ def create_test_database_with_existing_data():
     
     print_section("Creating Test Database with Existing Data")
     
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode so the schema and seed rows share one explicit transaction;
+    # the PRAGMAs (journal_mode=WAL in particular) must run before BEGIN
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    tune_sqlite_connection(conn)
     cursor = conn.cursor()
+    cursor.execute("BEGIN")
     
     # Create a realistic user table
     cursor.execute("""
@@ -91,6 +119,8 @@ def create_test_database_with_existing_data():
         )
     """)
     
+    cursor.execute("CREATE INDEX idx_orders_user_id ON orders(user_id)")
+    
     # Insert some existing data to reuse
     existing_users = [
         ('john_doe', 'john@example.com', 'John', 'Doe', 25, 'USA', 'New York', 'Engineer', 75000.00, 1, '{"skills": ["Python", "SQL"]}'),
@@ -105,10 +135,10 @@ def create_test_database_with_existing_data():
         ('isabel_gonzalez', 'isabel@example.com', 'Isabel', 'Gonzalez', 33, 'Argentina', 'Buenos Aires', 'Operations', 58000.00, 1, '{"skills": ["Operations", "Logistics"]}')
     ]
     
-    cursor.executemany("""
+    cursor.execute(f"""
         INSERT INTO users (username, email, first_name, last_name, age, country, city, occupation, salary, is_active, profile_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, existing_users)
+        VALUES {multi_row_placeholders(11, len(existing_users))}
+    """, list(chain.from_iterable(existing_users)))
     
     # Insert some existing orders
     existing_orders = [
@@ -119,12 +149,12 @@ def create_test_database_with_existing_data():
         (4, 'shipped', 199.99, 'Australia', 'Sydney', 'credit_card', 'International shipping'),
     ]
     
-    cursor.executemany("""
+    cursor.execute(f"""
         INSERT INTO orders (user_id, status, total_amount, shipping_country, shipping_city, payment_method, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, existing_orders)
+        VALUES {multi_row_placeholders(7, len(existing_orders))}
+    """, list(chain.from_iterable(existing_orders)))
     
-    conn.commit()
+    cursor.execute("COMMIT")
     conn.close()
     
     print(f"✅ Test database created: {db_path}")
@@ -132,113 +162,111 @@ def create_test_database_with_existing_data():
     
     return str(db_path)
 
-def test_fast_data_reuse_basic():
+@contextmanager
+def deferred_indexes(db_conn, table: str):
+    """Drop a table's non-unique indexes for a bulk load and rebuild them afterwards.
+    
+    Indexes leading with a foreign key column are kept while foreign key
+    enforcement is on.
+    """
+    with db_conn.engine.begin() as conn:
+        indexes = conn.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :table "
+            "AND sql IS NOT NULL AND sql NOT LIKE '%UNIQUE%'"
+        ), {"table": table}).fetchall()
+        if conn.execute(text("PRAGMA foreign_keys")).scalar():
+            fk_columns = {row[3] for row in conn.execute(text(f"PRAGMA foreign_key_list({table})"))}
+            indexes = [
+                (name, sql) for name, sql in indexes
+                if conn.execute(text(f"PRAGMA index_info({name})")).fetchone()[2] not in fk_columns
+            ]
+        for name, _ in indexes:
+            conn.execute(text(f"DROP INDEX {name}"))
+    
+    if indexes:
+        print(f"🗂️  Deferred {len(indexes)} index(es) on {table}: {', '.join(name for name, _ in indexes)}")
+    try:
+        yield
+    finally:
+        with db_conn.engine.begin() as conn:
+            for _, sql in indexes:
+                conn.execute(text(sql))
+
+def test_fast_data_reuse_basic(db_conn, schema):
     """Test basic fast data reuse functionality."""
     print_header("Fast Data Reuse - Basic Test")
     
-    db_path = create_test_database_with_existing_data()
+    # Create fast data reuser
+    fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=10000, fast_mode=True)
     
-    # Connect to database
-    db_config = DatabaseConfig(
-        host="",
-        port=0,
-        database=db_path,
-        username="",
-        password="",
-        driver="sqlite"
-    )
+    # Test basic functionality
+    print_section("Testing Basic Fast Data Reuse")
     
-    with DatabaseConnection(db_config) as db_conn:
-        db_conn.connect()
-        
-        # Analyze schema
-        analyzer = SchemaAnalyzer(db_conn)
-        schema = analyzer.analyze_schema("test_db")
-        
-        # Create fast data reuser
-        fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=10000, fast_mode=True)
+    # Prepare tables
+    for table_name in ['users', 'orders']:
+        print(f"🔧 Preparing {table_name} for fast data reuse...")
+        success = fast_reuser.prepare_table_for_fast_insertion(table_name)
         
-        # Test basic functionality
-        print_section("Testing Basic Fast Data Reuse")
-        
-        # Prepare tables
-        for table_name in ['users', 'orders']:
-            print(f"🔧 Preparing {table_name} for fast data reuse...")
-            success = fast_reuser.prepare_table_for_fast_insertion(table_name)
-            
-            if success:
-                stats = fast_reuser.get_reuse_statistics(table_name)
-                print(f"✅ {table_name} prepared:")
-                print(f"   📊 Existing rows: {stats['total_existing_rows']}")
-                print(f"   📝 Sampled rows: {stats['sampled_rows']}")
-                print(f"   🔄 Reusable rows: {stats['reusable_rows']}")
-                print(f"   📈 Reuse ratio: {stats['reuse_ratio']:.1%}")
-            else:
-                print(f"❌ {table_name} could not be prepared")
+        if success:
+            stats = fast_reuser.get_reuse_statistics(table_name)
+            print(f"✅ {table_name} prepared:")
+            print(f"   📊 Existing rows: {stats['total_existing_rows']}")
+            print(f"   📝 Sampled rows: {stats['sampled_rows']}")
+            print(f"   🔄 Reusable rows: {stats['reusable_rows']}")
+            print(f"   📈 Reuse ratio: {stats['reuse_ratio']:.1%}")
+        else:
+            print(f"❌ {table_name} could not be prepared")
 
-def test_fast_data_reuse_performance():
+def test_fast_data_reuse_performance(db_conn, schema):
     """Test fast data reuse performance with different scales."""
     print_header("Fast Data Reuse - Performance Test")
     
-    db_path = project_root / "fast_reuse_test.db"
+    # Create fast data reuser
+    fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=10000, fast_mode=True)
     
-    # Connect to database
-    db_config = DatabaseConfig(
-        host="",
-        port=0,
-        database=str(db_path),
-        username="",
-        password="",
-        driver="sqlite"
-    )
+    # Performance tests with different scales
+    test_cases = [
+        {'rows': 10000, 'label': 'Small (10K)'},
+        {'rows': 50000, 'label': 'Medium (50K)'},
+        {'rows': 200000, 'label': 'Large (200K)'},
+        {'rows': 1000000, 'label': 'Very Large (1M)'}
+    ]
     
-    with DatabaseConnection(db_config) as db_conn:
-        db_conn.connect()
-        
-        # Analyze schema
-        analyzer = SchemaAnalyzer(db_conn)
-        schema = analyzer.analyze_schema("test_db")
-        
-        # Create fast data reuser
-        fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=10000, fast_mode=True)
-        
-        # Performance tests with different scales
-        test_cases = [
-            {'rows': 10000, 'label': 'Small (10K)'},
-            {'rows': 50000, 'label': 'Medium (50K)'},
-            {'rows': 200000, 'label': 'Large (200K)'},
-            {'rows': 1000000, 'label': 'Very Large (1M)'}
-        ]
-        
-        print_section("Performance Comparison Tests")
-        
+    print_section("Performance Comparison Tests")
+    
+    # (label, rows, elapsed ns, rows/s) per completed scale, summarised at the end
+    results = []
+    
+    # Non-unique indexes are rebuilt once after all scales instead of per insert
+    with deferred_indexes(db_conn, 'orders'):
         for test_case in test_cases:
             rows = test_case['rows']
             label = test_case['label']
             
             print(f"\n🎯 Testing {label} - {rows:,} rows")
             
-            # Progress callback for every 1000 records
-            progress_count = 0
-            def progress_callback(table, current, total):
-                nonlocal progress_count
-                if current % 1000 == 0 and current != progress_count:
-                    progress_count = current
-                    percentage = (current / total) * 100
-                    print(f"  📊 Progress: {current:,}/{total:,} ({percentage:.1f}%)")
+            # Progress callback, throttled by the reuser to once per progress_interval rows
+            def progress_callback(table, current, total, batch_size):
+                percentage = (current / total) * 100
+                sys.stdout.write(f"  📊 Progress: {current:,}/{total:,} ({percentage:.1f}%)\n")
+                if int(percentage) % 10 == 0:
+                    sys.stdout.flush()
             
             try:
-                start_time = time.time()
+                t0 = time.perf_counter_ns()
                 
-                # Fast insert using data reuse
-                result = fast_reuser.fast_insert_millions('orders', rows, progress_callback)
+                # Fast insert using data reuse, one transaction per scale
+                with db_conn.bulk_transaction():
+                    result = fast_reuser.fast_insert_millions(
+                        'orders', rows, progress_callback, wrap_transaction=False
+                    )
                 
-                end_time = time.time()
-                total_time = end_time - start_time
-                rate = result['rows_inserted'] / total_time if total_time > 0 else 0
+                dt = time.perf_counter_ns() - t0
+                rate = result['rows_inserted'] * 1e9 / dt if dt > 0 else 0
+                results.append((label, result['rows_inserted'], dt, rate))
                 
                 print(f"  ✅ Completed: {result['rows_inserted']:,} rows")
-                print(f"  ⏱️  Time: {total_time:.2f}s")
+                print(f"  ⏱️  Time: {dt / 1e9:.3f}s")
                 print(f"  🚄 Rate: {rate:,.0f} rows/s")
                 print(f"  📝 Method: {result['method']}")
                 
@@ -254,152 +282,117 @@ def test_fast_data_reuse_performance():
                     
             except Exception as e:
                 print(f"  ❌ Failed: {e}")
+    
+    print_section("Performance Summary")
+    print(f"  {'Scale':<18} {'Rows':>12} {'Time (s)':>10} {'Rows/s':>14}")
+    for label, rows, dt, rate in results:
+        print(f"  {label:<18} {rows:>12,} {dt / 1e9:>10.3f} {rate:>14,.0f}")
 
-def test_ultra_fast_processor_integration():
+def test_ultra_fast_processor_integration(db_conn, schema):
     """Test integration with UltraFastProcessor."""
     print_header("Ultra-Fast Processor Integration Test")
     
-    db_path = project_root / "fast_reuse_test.db"
+    print_section("Testing Ultra-Fast Processor with Fast Data Reuse")
     
-    # Connect to database
-    db_config = DatabaseConfig(
-        host="",
-        port=0,
-        database=str(db_path),
-        username="",
-        password="",
-        driver="sqlite"
+    # Create configuration with fast data reuse enabled
+    config = create_high_performance_config(
+        target_tables={'orders': 500000},
+        performance_mode=PerformanceMode.ULTRA_HIGH,
+        enable_duplicates=True,
+        duplicate_strategy=DuplicateStrategy.FAST_DATA_REUSE,
+        seed=42
     )
     
-    with DatabaseConnection(db_config) as db_conn:
-        db_conn.connect()
-        
-        # Analyze schema
-        analyzer = SchemaAnalyzer(db_conn)
-        schema = analyzer.analyze_schema("test_db")
-        
-        print_section("Testing Ultra-Fast Processor with Fast Data Reuse")
-        
-        # Create configuration with fast data reuse enabled
-        config = create_high_performance_config(
-            target_tables={'orders': 500000},
-            performance_mode=PerformanceMode.ULTRA_HIGH,
-            enable_duplicates=True,
-            duplicate_strategy=DuplicateStrategy.FAST_DATA_REUSE,
-            seed=42
-        )
-        
-        # Override fast data reuse settings
-        config.duplicates.enable_fast_data_reuse = True
-        config.duplicates.data_reuse_sample_size = 10000
-        config.duplicates.data_reuse_probability = 0.95
-        config.duplicates.fast_insertion_mode = True
-        config.duplicates.progress_update_interval = 1000
-        
-        print(f"🔧 Configuration:")
-        print(f"   Performance Mode: {config.performance.performance_mode}")
-        print(f"   Duplicate Strategy: {config.duplicates.global_duplicate_strategy}")
-        print(f"   Fast Data Reuse: {config.duplicates.enable_fast_data_reuse}")
-        print(f"   Sample Size: {config.duplicates.data_reuse_sample_size:,}")
-        print(f"   Reuse Probability: {config.duplicates.data_reuse_probability:.1%}")
-        
-        # Create ultra-fast processor
-        processor = create_ultra_fast_processor(schema, config, db_conn)
-        
-        # Progress tracking
-        def progress_callback(table, current, total):
-            if current % 5000 == 0:  # Update every 5K for this test
-                percentage = (current / total) * 100
-                elapsed = time.time() - start_time
-                rate = current / elapsed if elapsed > 0 else 0
-                print(f"  📈 Progress: {current:,}/{total:,} ({percentage:.1f}%) | Rate: {rate:,.0f} rows/s")
-        
-        # Process 500K records
-        target_rows = 500000
-        print(f"\n🚀 Processing {target_rows:,} records with integrated fast data reuse...")
-        
-        start_time = time.time()
-        report = processor.process_millions_of_records('orders', target_rows, progress_callback)
-        total_time = time.time() - start_time
-        
-        print(f"\n🎉 Integration test completed!")
-        print(f"📊 Results:")
-        print(f"   📈 Rows generated: {report.total_rows_generated:,}")
-        print(f"   ⏱️  Total time: {total_time:.2f}s")
-        print(f"   🚄 Average rate: {report.average_rows_per_second:,.0f} rows/s")
+    # Override fast data reuse settings
+    config.duplicates.enable_fast_data_reuse = True
+    config.duplicates.data_reuse_sample_size = 10000
+    config.duplicates.data_reuse_probability = 0.95
+    config.duplicates.fast_insertion_mode = True
+    config.duplicates.progress_update_interval = 1000
+    
+    print(f"🔧 Configuration:")
+    print(f"   Performance Mode: {config.performance.performance_mode}")
+    print(f"   Duplicate Strategy: {config.duplicates.global_duplicate_strategy}")
+    print(f"   Fast Data Reuse: {config.duplicates.enable_fast_data_reuse}")
+    print(f"   Sample Size: {config.duplicates.data_reuse_sample_size:,}")
+    print(f"   Reuse Probability: {config.duplicates.data_reuse_probability:.1%}")
+    
+    # Create ultra-fast processor
+    processor = create_ultra_fast_processor(schema, config, db_conn)
+    
+    # Progress tracking
+    def progress_callback(table, current, total):
+        if current % 5000 == 0:  # Update every 5K for this test
+            percentage = (current / total) * 100
+            elapsed = time.time() - start_time
+            rate = current / elapsed if elapsed > 0 else 0
+            print(f"  📈 Progress: {current:,}/{total:,} ({percentage:.1f}%) | Rate: {rate:,.0f} rows/s")
+    
+    # Process 500K records
+    target_rows = 500000
+    print(f"\n🚀 Processing {target_rows:,} records with integrated fast data reuse...")
+    
+    start_time = time.time()
+    report = processor.process_millions_of_records('orders', target_rows, progress_callback)
+    total_time = time.time() - start_time
+    
+    print(f"\n🎉 Integration test completed!")
+    print(f"📊 Results:")
+    print(f"   📈 Rows generated: {report.total_rows_generated:,}")
+    print(f"   ⏱️  Total time: {total_time:.2f}s")
+    print(f"   🚄 Average rate: {report.average_rows_per_second:,.0f} rows/s")
+
+def count_duplicates(db_conn, table: str, column: str) -> int:
+    """Count surplus rows for a column via two index-friendly counts instead of a GROUP BY."""
+    return db_conn.execute_query(
+        f"SELECT (SELECT COUNT({column}) FROM {table}) - (SELECT COUNT(DISTINCT {column}) FROM {table})"
+    )[0][0]
 
-def test_constraint_respect():
+def duplicate_examples(db_conn, table: str, column: str, limit: int = 10):
+    """Fetch a few offending values once duplicates are known to exist."""
+    return db_conn.execute_query(
+        f"SELECT {column}, COUNT(*) FROM {table} GROUP BY {column} HAVING COUNT(*) > 1 LIMIT {limit}"
+    )
+
+def test_constraint_respect(db_conn, schema):
     """Test that constraints are properly respected."""
     print_header("Constraint Respect Test")
     
-    db_path = project_root / "fast_reuse_test.db"
+    print_section("Testing Constraint Respect")
     
-    # Connect to database
-    db_config = DatabaseConfig(
-        host="",
-        port=0,
-        database=str(db_path),
-        username="",
-        password="",
-        driver="sqlite"
-    )
+    # Create fast data reuser
+    fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=1000, fast_mode=True)
     
-    with DatabaseConnection(db_config) as db_conn:
-        db_conn.connect()
-        
-        # Analyze schema
-        analyzer = SchemaAnalyzer(db_conn)
-        schema = analyzer.analyze_schema("test_db")
-        
-        print_section("Testing Constraint Respect")
-        
-        # Create fast data reuser
-        fast_reuser = create_fast_data_reuser(db_conn, schema, sample_size=1000, fast_mode=True)
-        
-        # Check what columns can be safely reused
-        fast_reuser.prepare_table_for_fast_insertion('users')
-        stats = fast_reuser.get_reuse_statistics('users')
-        
-        print(f"📊 Users table analysis:")
-        print(f"   Total columns: {len(schema.get_table('users').columns)}")
-        print(f"   Reusable columns: {len(stats.get('unique_values_count', {}))}")
-        print(f"   Columns with data: {list(stats.get('unique_values_count', {}).keys())}")
-        
-        # Generate a small batch to verify constraints
-        print(f"\n🧪 Testing constraint compliance with 1000 records...")
+    # Check what columns can be safely reused
+    fast_reuser.prepare_table_for_fast_insertion('users')
+    stats = fast_reuser.get_reuse_statistics('users')
+    
+    print(f"📊 Users table analysis:")
+    print(f"   Total columns: {len(schema.get_table('users').columns)}")
+    print(f"   Reusable columns: {len(stats.get('unique_values_count', {}))}")
+    print(f"   Columns with data: {list(stats.get('unique_values_count', {}).keys())}")
+    
+    # Generate a small batch to verify constraints
+    print(f"\n🧪 Testing constraint compliance with 1000 records...")
+    
+    try:
+        result = fast_reuser.fast_insert_millions('users', 1000)
+        print(f"✅ Successfully inserted {result['rows_inserted']} rows")
+        print(f"   No constraint violations detected")
         
-        try:
-            result = fast_reuser.fast_insert_millions('users', 1000)
-            print(f"✅ Successfully inserted {result['rows_inserted']} rows")
-            print(f"   No constraint violations detected")
-            
-            # Check for any duplicate primary keys or unique values
-            unique_violations = db_conn.execute_query("""
-                SELECT user_id, COUNT(*) as count 
-                FROM users 
-                GROUP BY user_id 
-                HAVING COUNT(*) > 1
-            """)
-            
-            if unique_violations:
-                print(f"❌ Found {len(unique_violations)} primary key violations!")
+        # Check for any duplicate primary keys or unique values
+        db_conn.execute_query("PRAGMA optimize")
+        for column, label in [('user_id', 'primary key'), ('email', 'email uniqueness')]:
+            duplicates = count_duplicates(db_conn, 'users', column)
+            if duplicates:
+                print(f"❌ Found {duplicates} {label} violations!")
+                for value, count in duplicate_examples(db_conn, 'users', column):
+                    print(f"   {column}={value!r} appears {count} times")
             else:
-                print(f"✅ No primary key violations found")
-                
-            email_violations = db_conn.execute_query("""
-                SELECT email, COUNT(*) as count 
-                FROM users 
-                GROUP BY email 
-                HAVING COUNT(*) > 1
-            """)
+                print(f"✅ No {label} violations found")
             
-            if email_violations:
-                print(f"❌ Found {len(email_violations)} email uniqueness violations!")
-            else:
-                print(f"✅ No email uniqueness violations found")
-                
-        except Exception as e:
-            print(f"❌ Constraint test failed: {e}")
+    except Exception as e:
+        print(f"❌ Constraint test failed: {e}")
 
 def main():
     """Main test function."""
@@ -414,29 +407,34 @@ def main():
     
     # Run test suite
     try:
-        test_fast_data_reuse_basic()
-        test_constraint_respect()
-        test_fast_data_reuse_performance()
-        test_ultra_fast_processor_integration()
-        
-        print_header("Test Suite Completed Successfully!")
+        db_path = create_test_database_with_existing_data()
+        db_config = DatabaseConfig(host="", port=0, database=db_path, username="", password="", driver="sqlite")
         
-        # Final performance summary
-        db_path = project_root / "fast_reuse_test.db"
-        if db_path.exists():
-            size_mb = db_path.stat().st_size / (1024 * 1024)
+        # One connection (and one schema analysis) shared by every test
+        with DatabaseConnection(db_config) as db_conn:
+            schema = _get_schema(db_conn)
+            
+            test_fast_data_reuse_basic(db_conn, schema)
+            test_constraint_respect(db_conn, schema)
+            test_fast_data_reuse_performance(db_conn, schema)
+            test_ultra_fast_processor_integration(db_conn, schema)
+            
+            print_header("Test Suite Completed Successfully!")
+            
+            # Final performance summary
+            size_mb = Path(db_path).stat().st_size / (1024 * 1024)
             print(f"📊 Final database size: {size_mb:.1f}MB")
             print(f"📁 Database location: {db_path}")
             
             # Get final row counts
-            db_config = DatabaseConfig(host="", port=0, database=str(db_path), username="", password="", driver="sqlite")
-            with DatabaseConnection(db_config) as db_conn:
-                db_conn.connect()
-                
-                user_count = db_conn.execute_query("SELECT COUNT(*) FROM users")[0][0]
-                order_count = db_conn.execute_query("SELECT COUNT(*) FROM orders")[0][0]
-                
-                print(f"📈 Final counts: {user_count:,} users, {order_count:,} orders")
+            user_count = db_conn.execute_query("SELECT COUNT(*) FROM users")[0][0]
+            order_count = db_conn.execute_query("SELECT COUNT(*) FROM orders")[0][0]
+            
+            print(f"📈 Final counts: {user_count:,} users, {order_count:,} orders")
+        
+        if "--persist" in sys.argv:
+            db_path = shutil.copy2(db_path, project_root / Path(db_path).name)
+            print(f"💾 Database persisted to: {db_path}")
         
         print(f"\n🧹 To clean up: rm {db_path}")
         
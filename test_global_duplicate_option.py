@@ -4,41 +4,32 @@ Test Global Duplicate Option Functionality
 Demonstrates the new global duplicate control options with constraint awareness.
 """
 
+# Run inside your intended venv; conda activation is a no-op for a running interpreter.
+
 import os
 import sys
+import shutil
 import sqlite3
 import subprocess
+from collections import Counter
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def activate_conda_environment():
-    """Activate conda environment if available."""
-    try:
-        # Check if conda is available
-        result = subprocess.run(['conda', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Conda is available")
-            # Try to activate MyVenv environment
-            try:
-                subprocess.run(['conda', 'activate', 'MyVenv'], check=True, shell=True)
-                print("✅ Conda environment 'MyVenv' activated")
-                return True
-            except subprocess.CalledProcessError:
-                print("⚠️  Conda environment 'MyVenv' not found, using current environment")
-                return False
-        else:
-            print("⚠️  Conda not available, using current Python environment")
-            return False
-    except FileNotFoundError:
-        print("⚠️  Conda not found, using current Python environment")
-        return False
+from dbmocker.cli import cli
+from perf_helpers import scratch_db_dir
+
+# Pass --persist to copy the final scratch database back into the project directory
+DB_DIR = Path(scratch_db_dir()) / "dbmocker_tests"
+DB_DIR.mkdir(exist_ok=True)
 
 def create_test_database():
     """Create a test database with various constraint scenarios."""
-    db_path = Path(__file__).parent / "test_global_duplicates.db"
+    db_path = DB_DIR / "test_global_duplicates.db"
     
     # Remove existing database
     if db_path.exists():
@@ -89,8 +80,35 @@ def create_test_database():
     print(f"✅ Test database created: {db_path}")
     return str(db_path)
 
-def run_test_case(test_name, command_args, description):
-    """Run a test case and show results."""
+def invoke_cli(cli_args, capture=False):
+    """Run ``dbmocker <cli_args>`` and return ``(returncode, stdout, stderr)``.
+    
+    The CLI runs in this interpreter so the dbmocker imports are paid once per
+    suite; pass --isolated to launch a fresh ``python -m dbmocker.cli`` instead.
+    """
+    if "--isolated" in sys.argv:
+        result = subprocess.run([sys.executable, "-m", "dbmocker.cli"] + cli_args,
+                                capture_output=capture, text=True, cwd=project_root)
+        return result.returncode, result.stdout, result.stderr
+    
+    stdout, stderr = (StringIO(), StringIO()) if capture else (sys.stdout, sys.stderr)
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            cli.main(args=cli_args, prog_name="dbmocker")
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    
+    if capture:
+        return returncode, stdout.getvalue(), stderr.getvalue()
+    return returncode, None, None
+
+def run_test_case(test_name, command_args, description, capture=False):
+    """Run a test case and show results.
+    
+    Output streams straight to the terminal unless ``capture`` is set, in which
+    case it is buffered and printed after the command finishes.
+    """
     print(f"\n" + "="*60)
     print(f"🧪 {test_name}")
     print(f"📝 {description}")
@@ -116,16 +134,18 @@ def run_test_case(test_name, command_args, description):
     
     # Run command
     try:
-        result = subprocess.run(full_cmd, capture_output=True, text=True, cwd=project_root)
+        returncode, stdout, stderr = invoke_cli(full_cmd[3:], capture=capture)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Command executed successfully!")
-            print("\n📊 Output:")
-            print(result.stdout)
+            if capture:
+                print("\n📊 Output:")
+                print(stdout)
         else:
             print("❌ Command failed!")
-            print("\n🚨 Error output:")
-            print(result.stderr)
+            if capture:
+                print("\n🚨 Error output:")
+                print(stderr)
             
     except Exception as e:
         print(f"❌ Exception occurred: {e}")
@@ -148,18 +168,20 @@ def inspect_database_content(db_path):
         for status, count in status_counts:
             print(f"  {status}: {count} records")
         
-        # Check orders table
+        # Check orders table: one scan grouped by both columns, pivoted into each distribution
         print("\n📦 ORDERS TABLE:")
-        cursor.execute("SELECT order_status, COUNT(*) as count FROM orders GROUP BY order_status ORDER BY count DESC")
-        order_status_counts = cursor.fetchall()
+        cursor.execute("SELECT order_status, priority, COUNT(*) FROM orders GROUP BY order_status, priority")
+        order_status_counts = Counter()
+        priority_counts = Counter()
+        for status, priority, count in cursor.fetchall():
+            order_status_counts[status] += count
+            priority_counts[priority] += count
         print("Order status distribution:")
-        for status, count in order_status_counts:
+        for status, count in order_status_counts.most_common():
             print(f"  {status}: {count} records")
             
-        cursor.execute("SELECT priority, COUNT(*) as count FROM orders GROUP BY priority ORDER BY count DESC")
-        priority_counts = cursor.fetchall()
         print("Priority distribution:")
-        for priority, count in priority_counts:
+        for priority, count in priority_counts.most_common():
             print(f"  {priority}: {count} records")
         
         # Check products table
@@ -180,9 +202,6 @@ def main():
     print("🚀 Testing Global Duplicate Option Functionality")
     print("===============================================")
     
-    # Activate conda environment
-    activate_conda_environment()
-    
     # Create test database
     db_path = create_test_database()
     
@@ -245,12 +264,12 @@ def main():
     print()
     
     try:
-        result = subprocess.run(actual_cmd, capture_output=True, text=True, cwd=project_root)
+        returncode, stdout, stderr = invoke_cli(actual_cmd[3:], capture=True)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Data generation completed successfully!")
             print("\n📊 Output:")
-            print(result.stdout)
+            print(stdout)
             
             # Inspect the generated data
             inspect_database_content(db_path)
@@ -258,11 +277,14 @@ def main():
         else:
             print("❌ Data generation failed!")
             print("\n🚨 Error output:")
-            print(result.stderr)
+            print(stderr)
             
     except Exception as e:
         print(f"❌ Exception occurred: {e}")
     
+    if "--persist" in sys.argv:
+        db_path = shutil.copy2(db_path, project_root / Path(db_path).name)
+    
     print(f"\n✅ Test completed! Database saved at: {db_path}")
     print("\n📋 Summary:")
     print("  • Test 1: Demonstrates generate-new-only mode (default)")
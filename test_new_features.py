@@ -10,22 +10,27 @@ from pathlib import Path
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+from dbmocker.core.database import DatabaseConnection, DatabaseConfig, tune_sqlite_connection
 from dbmocker.core.analyzer import SchemaAnalyzer
 from dbmocker.core.models import GenerationConfig, TableGenerationConfig, ColumnGenerationConfig
 from dbmocker.core.parallel_generator import ParallelDataGenerator, ParallelDataInserter
+from perf_helpers import scratch_db_dir
+
+TMPDIR = scratch_db_dir()
 
 
 def create_test_database():
     """Create a test SQLite database with multiple tables."""
     # Create temporary database
-    db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    db_file = tempfile.NamedTemporaryFile(suffix='.db', dir=TMPDIR, delete=False)
     db_path = db_file.name
     db_file.close()
     
-    # Create tables
-    conn = sqlite3.connect(db_path)
+    # Create tables in one explicit transaction (autocommit mode otherwise)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    tune_sqlite_connection(conn)
     cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Users table
     cursor.execute('''
@@ -61,7 +66,7 @@ def create_test_database():
         )
     ''')
     
-    conn.commit()
+    cursor.execute("COMMIT")
     conn.close()
     
     return db_path
@@ -141,17 +146,11 @@ def test_parallel_generation(db_path, rows=10000):
         
         start_time = time.time()
         
-        # Generate data for users
-        users_data = generator.generate_data_for_table_parallel('users', rows)
-        
-        # Generate data for orders
-        orders_data = generator.generate_data_for_table_parallel('orders', rows * 2)
-        
-        # Generate data for products
-        products_data = generator.generate_data_for_table_parallel('products', rows // 2)
+        # Generate users, orders and products through one shared worker pool
+        results = generator.generate_for_tables({'users': rows, 'orders': rows * 2, 'products': rows // 2})
         
         generation_time = time.time() - start_time
-        total_rows = len(users_data) + len(orders_data) + len(products_data)
+        total_rows = sum(len(data) for data in results.values())
         
         print(f"  ✅ Generated {total_rows:,} rows in {generation_time:.2f}s")
         print(f"  📊 Performance: {total_rows/generation_time:,.0f} rows/second")
@@ -208,25 +207,22 @@ def test_duplicate_generation(db_path, rows=5000):
         start_time = time.time()
         
         # Generate data with duplicates
-        users_data = generator.generate_data_for_table_parallel('users', rows)
-        orders_data = generator.generate_data_for_table_parallel('orders', rows)
+        users_data = generator.generate_data_for_table_as_columns('users', rows)
+        orders_data = generator.generate_data_for_table_as_columns('orders', rows)
         
         generation_time = time.time() - start_time
         
-        # Verify duplicates
-        user_statuses = [row['status'] for row in users_data]
-        order_statuses = [row['status'] for row in orders_data]
-        
-        unique_user_statuses = set(user_statuses)
-        unique_order_statuses = set(order_statuses)
+        # Verify duplicates straight from the status columns
+        user_statuses = users_data['status']
+        order_statuses = orders_data['status']
         
-        print(f"  ✅ Generated {len(users_data):,} users and {len(orders_data):,} orders in {generation_time:.2f}s")
-        print(f"  🔄 User statuses: {unique_user_statuses} (should be {'premium'})")
-        print(f"  🔄 Order statuses: {unique_order_statuses} (should be {'completed'})")
+        print(f"  ✅ Generated {len(user_statuses):,} users and {len(order_statuses):,} orders in {generation_time:.2f}s")
+        print(f"  🔄 User status: {next(iter(user_statuses), None)} (should be {'premium'})")
+        print(f"  🔄 Order status: {next(iter(order_statuses), None)} (should be {'completed'})")
         
-        # Verify all values are duplicates as expected
-        assert len(unique_user_statuses) == 1 and 'premium' in unique_user_statuses
-        assert len(unique_order_statuses) == 1 and 'completed' in unique_order_statuses
+        # Verify all values are duplicates as expected, stopping at the first mismatch
+        assert user_statuses and all(status == 'premium' for status in user_statuses), "duplicate mode failed for users"
+        assert order_statuses and all(status == 'completed' for status in order_statuses), "duplicate mode failed for orders"
         
         print("  ✅ Duplicate generation working correctly!")
 
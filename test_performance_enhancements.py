@@ -7,19 +7,19 @@ for DBMocker with millions of records.
 import time
 import logging
 from pathlib import Path
-from sqlalchemy import text
 
-from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+from dbmocker.core.database import DatabaseConnection
 from dbmocker.core.analyzer import SchemaAnalyzer
-from dbmocker.core.models import GenerationConfig, TableGenerationConfig, ColumnGenerationConfig
+from dbmocker.core.models import DatabaseSchema, GenerationConfig, TableGenerationConfig, ColumnGenerationConfig
 from dbmocker.core.parallel_generator import ParallelDataGenerator, ParallelDataInserter
+from perf_helpers import make_perf_db_config, create_perf_database, remove_sqlite_files
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def test_performance_enhancements():
+def test_performance_enhancements(perf_db: DatabaseConnection, perf_schema: DatabaseSchema):
     """Test the new performance and duplicate features."""
     
     print("🚀 Testing DBMocker Performance Enhancements")
@@ -36,16 +36,38 @@ def test_performance_enhancements():
         }
     ]
     
-    # Create in-memory SQLite database for testing
-    db_config = DatabaseConfig(
-        host='localhost',
-        port=1,  # Dummy port for SQLite
-        database=':memory:',
-        username='',
-        password='',
-        driver='sqlite'
+    db_conn = perf_db
+    schema = perf_schema
+    
+    # Create generation config with new features
+    generation_config = GenerationConfig(
+        batch_size=10000,
+        rows_per_process=100000,
+        truncate_existing=True,
+        bulk_copy=True  # COPY on PostgreSQL; other drivers keep multi-row INSERTs
+    )
+    
+    # Add table config with duplicate options
+    table_config = TableGenerationConfig()
+    
+    # Test different duplicate modes
+    table_config.column_configs['status'] = ColumnGenerationConfig(
+        duplicate_mode="allow_duplicates",
+        duplicate_value="active"
+    )
+    
+    table_config.column_configs['email'] = ColumnGenerationConfig(
+        duplicate_mode="smart_duplicates",
+        duplicate_probability=0.6,
+        max_duplicate_values=10
     )
     
+    generation_config.table_configs['test_users'] = table_config
+    
+    # One generator and inserter for every test config; worker processes persist between runs
+    generator = ParallelDataGenerator(schema, generation_config, db_conn)
+    inserter = ParallelDataInserter(db_conn, schema, generation_config)
+    
     print("📊 Performance Test Results:")
     print("-" * 30)
     
@@ -55,103 +77,49 @@ def test_performance_enhancements():
         print(f"   Multiprocessing: {test_config.get('enable_multiprocessing', False)}")
         print(f"   Workers: {test_config['max_workers']}")
         
-        # Create test database connection
         try:
-            with DatabaseConnection(db_config) as db_conn:
-                # Create a simple test table
-                with db_conn.get_session() as session:
-                    session.execute(text("""
-                        CREATE TABLE IF NOT EXISTS test_users (
-                            id INTEGER PRIMARY KEY,
-                            name TEXT,
-                            email TEXT,
-                            status TEXT,
-                            age INTEGER,
-                            created_at TEXT
-                        )
-                    """))
-                    session.commit()
-                
-                # Analyze schema
-                analyzer = SchemaAnalyzer(db_conn)
-                schema = analyzer.analyze_schema()
-                
-                # Create generation config with new features
-                generation_config = GenerationConfig(
-                    batch_size=10000,
-                    max_workers=test_config['max_workers'],
-                    enable_multiprocessing=test_config.get('enable_multiprocessing', False),
-                    max_processes=test_config.get('max_processes', 2),
-                    rows_per_process=100000,
-                    truncate_existing=True
-                )
-                
-                # Add table config with duplicate options
-                table_config = TableGenerationConfig(rows_to_generate=test_config['rows'])
-                
-                # Test different duplicate modes
-                table_config.column_configs['status'] = ColumnGenerationConfig(
-                    duplicate_mode="allow_duplicates",
-                    duplicate_value="active"
-                )
-                
-                table_config.column_configs['email'] = ColumnGenerationConfig(
-                    duplicate_mode="smart_duplicates",
-                    duplicate_probability=0.6,
-                    max_duplicate_values=10
-                )
-                
-                generation_config.table_configs['test_users'] = table_config
-                
-                # Create parallel generator
-                generator = ParallelDataGenerator(schema, generation_config, db_conn)
-                inserter = ParallelDataInserter(db_conn, schema)
-                
-                # Measure generation time
-                start_time = time.time()
-                
-                generated_data = generator.generate_data_for_table_parallel('test_users', test_config['rows'])
-                
-                generation_time = time.time() - start_time
-                
-                # Measure insertion time
-                insert_start_time = time.time()
-                
-                # Use parallel insertion if available
-                if hasattr(inserter, 'insert_data_parallel'):
-                    stats = inserter.insert_data_parallel(
-                        'test_users', 
-                        generated_data, 
-                        generation_config.batch_size,
-                        generation_config.max_workers
-                    )
-                else:
-                    # Fallback to regular insertion
-                    table = schema.get_table('test_users')
-                    rows_inserted = inserter.insert_data(table, generated_data, generation_config.batch_size)
-                    stats = type('Stats', (), {'total_rows_generated': rows_inserted})()
-                
-                insertion_time = time.time() - insert_start_time
-                total_time = time.time() - start_time
-                
-                # Calculate performance metrics
-                rows_per_sec_gen = len(generated_data) / generation_time if generation_time > 0 else 0
-                rows_per_sec_insert = stats.total_rows_generated / insertion_time if insertion_time > 0 else 0
-                rows_per_sec_total = stats.total_rows_generated / total_time if total_time > 0 else 0
-                
-                print(f"   ✅ Generated: {len(generated_data):,} rows in {generation_time:.2f}s ({rows_per_sec_gen:,.0f} rows/sec)")
-                print(f"   ✅ Inserted: {stats.total_rows_generated:,} rows in {insertion_time:.2f}s ({rows_per_sec_insert:,.0f} rows/sec)")
-                print(f"   📈 Total: {total_time:.2f}s ({rows_per_sec_total:,.0f} rows/sec overall)")
-                
-                # Test duplicate validation by querying some results
-                result = db_conn.execute_query("SELECT DISTINCT status FROM test_users LIMIT 10")
-                distinct_statuses = [row[0] for row in result] if result else []
-                print(f"   🔍 Distinct statuses: {distinct_statuses} (should show duplicate behavior)")
-                
-                result = db_conn.execute_query("SELECT DISTINCT email FROM test_users LIMIT 10")
-                distinct_emails = [row[0] for row in result] if result else []
-                print(f"   📧 Sample emails: {len(distinct_emails)} unique from sample (smart duplicates)")
-                
+            generator.reconfigure(
+                max_workers=test_config['max_workers'],
+                enable_multiprocessing=test_config.get('enable_multiprocessing', False),
+                max_processes=test_config.get('max_processes', 2)
+            )
+            table_config.rows_to_generate = test_config['rows']
+            
+            # Measure the end-to-end pipeline: chunks are inserted while later ones are generated
+            start_ns = time.perf_counter_ns()
+            
+            # Columnar chunks: one array per column, no per-row dicts
+            chunks = generator.generate_columnar_chunks(
+                'test_users', test_config['rows'], chunk_size=generation_config.batch_size
+            )
+            stats = inserter.insert_columns_pipelined('test_users', chunks, generation_config.max_workers)
+            generated_rows = stats.table_stats['test_users']['rows_requested']
+            
+            total_ns = time.perf_counter_ns() - start_ns
+            n_rows = stats.total_rows_generated
+            
+            # Calculate performance metrics
+            rows_per_sec_total = n_rows * 1e9 / total_ns if total_ns > 0 else 0
+            
+            print(f"   ✅ Generated: {generated_rows:,} rows")
+            print(f"   ✅ Inserted: {n_rows:,} rows")
+            print(f"   📈 Total: {total_ns / 1e9:.6f}s ({rows_per_sec_total:,.0f} rows/sec overall, generation and insertion overlapped)")
+            
+            # Test duplicate validation: both aggregates in one scan and one round-trip
+            if db_conn.config.driver == 'postgresql':
+                status_agg = "array_agg(DISTINCT status)"
+            else:
+                status_agg = "group_concat(DISTINCT status)"
+            result = db_conn.execute_query(
+                f"SELECT {status_agg}, COUNT(DISTINCT email) FROM test_users"
+            )
+            statuses, distinct_email_count = result[0] if result else (None, 0)
+            if isinstance(statuses, str):
+                statuses = statuses.split(',')
+            distinct_statuses = (statuses or [])[:10]
+            print(f"   🔍 Distinct statuses: {distinct_statuses} (should show duplicate behavior)")
+            print(f"   📧 Distinct emails: {distinct_email_count} (smart duplicates)")
+            
         except Exception as e:
             print(f"   ❌ Test failed: {e}")
             continue
@@ -166,106 +134,90 @@ def test_performance_enhancements():
     print(f"   • ✅ Automatic performance optimization")
     
 
-def test_duplicate_modes():
+def test_duplicate_modes(perf_db: DatabaseConnection, perf_schema: DatabaseSchema):
     """Test the different duplicate generation modes."""
     
     print("\n🎯 Testing Duplicate Generation Modes")
     print("=" * 40)
     
-    # Create test database
-    db_config = DatabaseConfig(
-        host='localhost',
-        port=1,  # Dummy port for SQLite
-        database=':memory:',
-        username='',
-        password='',
-        driver='sqlite'
-    )
+    db_conn = perf_db
+    schema = perf_schema
+    
+    # Test each duplicate mode
+    duplicate_modes = [
+        {
+            'name': 'Generate New (Default)',
+            'mode': 'generate_new',
+            'config': {}
+        },
+        {
+            'name': 'Allow Duplicates',
+            'mode': 'allow_duplicates',
+            'config': {'duplicate_value': 'electronics'}
+        },
+        {
+            'name': 'Smart Duplicates',
+            'mode': 'smart_duplicates',
+            'config': {
+                'duplicate_probability': 0.7,
+                'max_duplicate_values': 3
+            }
+        }
+    ]
     
-    with DatabaseConnection(db_config) as db_conn:
-        # Create test table
-        with db_conn.get_session() as session:
-            session.execute(text("""
-                CREATE TABLE test_products (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT,
-                    category TEXT,
-                    status TEXT,
-                    priority INTEGER
-                )
-            """))
-            session.commit()
+    for mode_test in duplicate_modes:
+        print(f"\n🔬 Testing: {mode_test['name']}")
         
-        # Analyze schema
-        analyzer = SchemaAnalyzer(db_conn)
-        schema = analyzer.analyze_schema()
+        # Create generation config
+        generation_config = GenerationConfig(batch_size=1000)
+        table_config = TableGenerationConfig(rows_to_generate=100)
         
-        # Test each duplicate mode
-        duplicate_modes = [
-            {
-                'name': 'Generate New (Default)',
-                'mode': 'generate_new',
-                'config': {}
-            },
-            {
-                'name': 'Allow Duplicates',
-                'mode': 'allow_duplicates',
-                'config': {'duplicate_value': 'electronics'}
-            },
-            {
-                'name': 'Smart Duplicates',
-                'mode': 'smart_duplicates',
-                'config': {
-                    'duplicate_probability': 0.7,
-                    'max_duplicate_values': 3
-                }
-            }
-        ]
+        # Configure duplicate mode for category column
+        table_config.column_configs['category'] = ColumnGenerationConfig(
+            duplicate_mode=mode_test['mode'],
+            **mode_test['config']
+        )
         
-        for mode_test in duplicate_modes:
-            print(f"\n🔬 Testing: {mode_test['name']}")
-            
-            # Create generation config
-            generation_config = GenerationConfig(batch_size=1000)
-            table_config = TableGenerationConfig(rows_to_generate=100)
-            
-            # Configure duplicate mode for category column
-            table_config.column_configs['category'] = ColumnGenerationConfig(
-                duplicate_mode=mode_test['mode'],
-                **mode_test['config']
-            )
-            
-            generation_config.table_configs['test_products'] = table_config
-            
-            # Generate data
-            generator = ParallelDataGenerator(schema, generation_config, db_conn)
-            generated_data = generator.generate_data_for_table_parallel('test_products', 100)
-            
-            # Analyze results
-            categories = [row['category'] for row in generated_data if 'category' in row]
-            unique_categories = set(categories)
-            
-            print(f"   📊 Generated {len(generated_data)} rows")
-            print(f"   📈 Unique categories: {len(unique_categories)} out of {len(categories)} total")
-            print(f"   🎯 Categories: {list(unique_categories)[:5]}{'...' if len(unique_categories) > 5 else ''}")
-            
-            if mode_test['mode'] == 'allow_duplicates':
-                print(f"   ✅ Expected: All rows should have same category value")
-            elif mode_test['mode'] == 'smart_duplicates':
-                print(f"   ✅ Expected: Limited unique values (max {mode_test['config']['max_duplicate_values']})")
-            else:
-                print(f"   ✅ Expected: Mostly unique values")
+        generation_config.table_configs['test_products'] = table_config
+        
+        # Generate data
+        generator = ParallelDataGenerator(schema, generation_config, db_conn)
+        generated_data = generator.generate_columnar('test_products', 100)
+        
+        # Analyze results
+        categories = generated_data['category'].tolist() if 'category' in generated_data else []
+        unique_categories = set(categories)
+        
+        print(f"   📊 Generated {len(categories)} rows")
+        print(f"   📈 Unique categories: {len(unique_categories)} out of {len(categories)} total")
+        print(f"   🎯 Categories: {list(unique_categories)[:5]}{'...' if len(unique_categories) > 5 else ''}")
+        
+        if mode_test['mode'] == 'allow_duplicates':
+            print(f"   ✅ Expected: All rows should have same category value")
+        elif mode_test['mode'] == 'smart_duplicates':
+            print(f"   ✅ Expected: Limited unique values (max {mode_test['config']['max_duplicate_values']})")
+        else:
+            print(f"   ✅ Expected: Mostly unique values")
 
 
 if __name__ == "__main__":
     print("🚀 DBMocker Enhanced Performance & Duplicate Features Test")
     print("=" * 60)
     
-    # Test performance enhancements
-    test_performance_enhancements()
-    
-    # Test duplicate modes  
-    test_duplicate_modes()
+    # Both tests share one on-disk database and its schema, as the pytest fixtures do
+    shared_db_config = make_perf_db_config()
+    shared_db = create_perf_database(shared_db_config)
+    try:
+        shared_schema = SchemaAnalyzer(shared_db).analyze_schema()
+        
+        # Test performance enhancements
+        test_performance_enhancements(shared_db, shared_schema)
+        
+        # Test duplicate modes  
+        test_duplicate_modes(shared_db, shared_schema)
+    finally:
+        shared_db.close()
+        remove_sqlite_files(shared_db_config.database)
     
     print(f"\n✨ All tests completed!")
     print(f"\n📚 Usage Examples:")
@@ -3,15 +3,60 @@
 import pytest
 import tempfile
 import os
-from unittest.mock import Mock
+from unittest.mock import Mock, create_autospec
 
+from faker import Faker
+
+from dbmocker.core import database as database_module
 from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+from dbmocker.core.generator import DataGenerator
 from dbmocker.core.models import (
     DatabaseSchema, TableInfo, ColumnInfo, ConstraintInfo,
-    ColumnType, ConstraintType
+    ColumnType, ConstraintType, GenerationConfig, TableGenerationConfig,
+    ColumnGenerationConfig
 )
 
 
+# Shared read-only configs; built at import so Pydantic's first-use cost lands outside the tests
+DEFAULT_GEN_CONFIG = GenerationConfig(seed=42)
+DEFAULT_TABLE_CONFIG = TableGenerationConfig()
+
+
+# Session fixtures are built once per xdist worker; tests sharing them are kept together
+XDIST_GROUPS = {
+    "data_generator": "generator",
+    "users_rows": "generator",
+    "shared_faker": "generator",
+    "empty_generator": "generator",
+}
+
+
+def pytest_addoption(parser):
+    """Register DBMocker-specific command line options."""
+    parser.addoption(
+        "--skip-defaults", action="store_true", default=False,
+        help="deselect tests marked 'defaults' that only re-check model default values"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin tests that share expensive session fixtures to one worker under ``--dist loadgroup``.
+    
+    With ``--skip-defaults``, tests marked ``defaults`` are deselected.
+    """
+    if config.getoption("--skip-defaults"):
+        deselected = [item for item in items if item.get_closest_marker("defaults")]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if not item.get_closest_marker("defaults")]
+    
+    for item in items:
+        for fixture_name, group in XDIST_GROUPS.items():
+            if fixture_name in item.fixturenames:
+                item.add_marker(pytest.mark.xdist_group(group))
+                break
+
+
 @pytest.fixture
 def temp_db_file():
     """Create a temporary database file for SQLite testing."""
@@ -22,6 +67,64 @@ def temp_db_file():
         os.unlink(path)
 
 
+# Fields of the PostgreSQL test configuration, shared by pg_config and make_config
+PG_CONFIG_FIELDS = dict(
+    host="localhost",
+    port=5432,
+    database="test_db",
+    username="test_user",
+    password="test_pass",
+    driver="postgresql"
+)
+
+
+@pytest.fixture(scope="session")
+def pg_config():
+    """PostgreSQL configuration shared by tests that only read it."""
+    return DatabaseConfig(**PG_CONFIG_FIELDS)
+
+
+@pytest.fixture
+def make_config():
+    """Factory for configs derived from PG_CONFIG_FIELDS, built without re-running validation.
+    
+    Only for tests where config validation is not under test.
+    """
+    def _make(**overrides) -> DatabaseConfig:
+        return DatabaseConfig.model_construct(**{**PG_CONFIG_FIELDS, **overrides})
+    return _make
+
+
+@pytest.fixture
+def mock_create_engine(monkeypatch):
+    """Signature-checked stand-in for ``create_engine`` in ``dbmocker.core.database``."""
+    mock = create_autospec(database_module.create_engine)
+    monkeypatch.setattr(database_module, "create_engine", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def sqlite_memory_config():
+    """Config for a private in-memory SQLite database."""
+    return DatabaseConfig(
+        host="localhost",
+        port=0,  # SQLite ignores the port
+        database=":memory:",
+        username="",
+        password="",
+        driver="sqlite"
+    )
+
+
+@pytest.fixture(scope="session")
+def sqlite_conn(sqlite_memory_config):
+    """Real connection to an in-memory SQLite database, opened once per session."""
+    db_conn = DatabaseConnection(sqlite_memory_config)
+    db_conn.connect()
+    yield db_conn
+    db_conn.close()
+
+
 @pytest.fixture
 def mock_db_config():
     """Create a mock database configuration for testing."""
@@ -400,3 +503,121 @@ def sample_schema():
         database_name="sample_ecommerce_db",
         tables=[users_table, categories_table, products_table, orders_table, order_items_table]
     )
+
+
+def _build_users_table() -> TableInfo:
+    return TableInfo(
+        name="users",
+        columns=[
+            ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
+            ColumnInfo(name="name", data_type=ColumnType.VARCHAR, max_length=100, is_nullable=False),
+            ColumnInfo(name="email", data_type=ColumnType.VARCHAR, max_length=255, is_nullable=False,
+                      detected_pattern="email"),
+            ColumnInfo(name="age", data_type=ColumnType.INTEGER, is_nullable=True,
+                      min_value=18, max_value=100),
+            ColumnInfo(name="created_at", data_type=ColumnType.TIMESTAMP, is_nullable=False)
+        ],
+        constraints=[
+            ConstraintInfo(name="users_pkey", type=ConstraintType.PRIMARY_KEY, columns=["id"]),
+            ConstraintInfo(name="users_email_unique", type=ConstraintType.UNIQUE, columns=["email"])
+        ]
+    )
+
+
+def _build_orders_table() -> TableInfo:
+    user_fk = ConstraintInfo(name="orders_user_fk", type=ConstraintType.FOREIGN_KEY,
+                             columns=["user_id"], referenced_table="users", referenced_columns=["id"])
+    table = TableInfo(
+        name="orders",
+        columns=[
+            ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
+            ColumnInfo(name="user_id", data_type=ColumnType.INTEGER, is_nullable=False),
+            ColumnInfo(name="total", data_type=ColumnType.DECIMAL, precision=10, scale=2, is_nullable=False),
+            ColumnInfo(name="status", data_type=ColumnType.ENUM, 
+                      enum_values=["pending", "confirmed", "shipped", "delivered"], is_nullable=False)
+        ],
+        constraints=[
+            ConstraintInfo(name="orders_pkey", type=ConstraintType.PRIMARY_KEY, columns=["id"]),
+            user_fk
+        ]
+    )
+    
+    # Constraints are immutable, so the FK list can share the instance
+    table.foreign_keys = [user_fk]
+    return table
+
+
+@pytest.fixture(scope="session")
+def users_table():
+    """Users table of the DataGenerator test schema."""
+    return _build_users_table()
+
+
+@pytest.fixture(scope="session")
+def orders_table():
+    """Orders table of the DataGenerator test schema, referencing users."""
+    return _build_orders_table()
+
+
+@pytest.fixture
+def generator_schema(request):
+    """Schema holding only the tables a test asks for via ``@pytest.mark.schema_tables``.
+    
+    Unmarked tests get both users and orders; table fixtures are built lazily, once per session.
+    """
+    marker = request.node.get_closest_marker("schema_tables")
+    names = marker.args if marker else ("users_table", "orders_table")
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[request.getfixturevalue(name) for name in names]
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_faker():
+    """One Faker for all generator tests; provider setup is its slow part.
+    
+    Each seeded DataGenerator reseeds it, so tests do not inherit each other's Faker state.
+    """
+    faker = Faker()
+    faker.seed_instance(42)
+    return faker
+
+
+@pytest.fixture
+def data_generator(generator_schema, shared_faker):
+    """Fresh seeded DataGenerator per test, since tests mutate its caches."""
+    return DataGenerator(generator_schema, DEFAULT_GEN_CONFIG, faker=shared_faker)
+
+
+@pytest.fixture(scope="session")
+def empty_generator(shared_faker):
+    """Generator over a schema with no tables, for lookup-failure tests."""
+    return DataGenerator(DatabaseSchema(database_name="empty_db", tables=[]), DEFAULT_GEN_CONFIG,
+                         faker=shared_faker)
+
+
+@pytest.fixture(scope="session")
+def users_rows(users_table, shared_faker):
+    """100 generated users rows, produced once and shared read-only across tests."""
+    schema = DatabaseSchema(database_name="test_db", tables=[users_table])
+    generator = DataGenerator(schema, DEFAULT_GEN_CONFIG, faker=shared_faker)
+    return generator.generate_data_for_table("users", 100)
+
+
+@pytest.fixture(scope="session")
+def default_gen_config():
+    """Default-constructed GenerationConfig; read-only."""
+    return GenerationConfig()
+
+
+@pytest.fixture(scope="session")
+def default_table_config():
+    """Default-constructed TableGenerationConfig; read-only."""
+    return TableGenerationConfig()
+
+
+@pytest.fixture(scope="session")
+def default_column_config():
+    """Default-constructed ColumnGenerationConfig; read-only."""
+    return ColumnGenerationConfig()
@@ -0,0 +1,141 @@
+"""Tests for fast data reuse sampling and the background storage worker."""
+
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from dbmocker.core.fast_data_reuse import ExistingDataSampler, SAMPLING_STRATEGIES, StorageWorker
+
+
+@pytest.fixture
+def sample_tables(sqlite_conn):
+    """A 1000-row rowid table and a WITHOUT ROWID table in the session SQLite database."""
+    with sqlite_conn.engine.begin() as conn:
+        for name, suffix in (("reuse_rowid", ""), ("reuse_no_rowid", " WITHOUT ROWID")):
+            conn.execute(text(f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, label TEXT){suffix}"))
+            conn.execute(text(f"INSERT INTO {name} (id, label) VALUES (:id, :label)"),
+                         [{"id": i, "label": f"row{i}"} for i in range(1000)])
+    yield sqlite_conn
+    with sqlite_conn.engine.begin() as conn:
+        conn.execute(text("DROP TABLE reuse_rowid"))
+        conn.execute(text("DROP TABLE reuse_no_rowid"))
+
+
+@pytest.fixture
+def worker_table(sqlite_conn):
+    """An empty table in the session SQLite database, dropped afterwards."""
+    with sqlite_conn.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE worker_items (id INTEGER PRIMARY KEY)"))
+    yield sqlite_conn
+    with sqlite_conn.engine.begin() as conn:
+        conn.execute(text("DROP TABLE worker_items"))
+
+
+def write_ids(connection, batch):
+    """StorageWorker write callback inserting a list of ids."""
+    connection.cursor().executemany("INSERT INTO worker_items (id) VALUES (?)", [(i,) for i in batch])
+    return len(batch)
+
+
+class TestExistingDataSampler:
+    """Test ExistingDataSampler SQLite sampling strategies."""
+    
+    def test_default_strategy(self, sqlite_conn):
+        """Test rowid sampling is the default; WITHOUT ROWID tables fall back to ORDER BY RANDOM()."""
+        assert ExistingDataSampler(sqlite_conn).sampling_strategy == "rowid"
+    
+    def test_unknown_strategy(self, sqlite_conn):
+        """Test an unknown sampling strategy is rejected."""
+        with pytest.raises(ValueError, match="Unknown sampling strategy"):
+            ExistingDataSampler(sqlite_conn, "reservoir")
+    
+    @pytest.mark.parametrize("strategy", SAMPLING_STRATEGIES)
+    @pytest.mark.parametrize("table", ["reuse_rowid", "reuse_no_rowid"])
+    def test_sample_rows(self, sample_tables, strategy, table):
+        """Test every strategy returns distinct, complete rows, including on WITHOUT ROWID tables."""
+        pool = ExistingDataSampler(sample_tables, strategy).sample_existing_data(table, 100)
+        
+        ids = [row["id"] for row in pool.sampled_data]
+        assert pool.total_existing_rows == 1000
+        assert 0 < len(ids) <= 100
+        assert len(set(ids)) == len(ids)
+        assert all(row["label"] == f"row{row['id']}" for row in pool.sampled_data)
+        if strategy != "bernoulli":
+            assert len(ids) == 100
+    
+    def test_bernoulli_sample_varies(self, sample_tables):
+        """Test Bernoulli sampling draws a fresh sample per call rather than a fixed hash."""
+        sampler = ExistingDataSampler(sample_tables, "bernoulli")
+        
+        samples = {frozenset(row["id"] for row in sampler.sample_existing_data("reuse_rowid", 100).sampled_data)
+                   for _ in range(3)}
+        
+        assert len(samples) > 1
+
+
+class TestStorageWorker:
+    """Test StorageWorker inside the caller's bulk transaction."""
+    
+    def test_writes_batches(self, worker_table):
+        """Test every submitted batch is written and reported."""
+        progress = []
+        with worker_table.bulk_transaction():
+            worker = StorageWorker(worker_table, write_ids,
+                                   on_batch_written=lambda total, rows: progress.append((total, rows)))
+            worker.start()
+            for start in range(0, 50, 10):
+                worker.submit(list(range(start, start + 10)))
+            worker.finish()
+        
+        assert worker.rows_written == 50
+        assert progress == [(10 * n, 10) for n in range(1, 6)]
+        assert worker_table.execute_query("SELECT COUNT(*) FROM worker_items")[0][0] == 50
+    
+    def test_first_error_stops_writes(self, worker_table):
+        """Test the first write error stops further writes and is re-raised by submit/finish."""
+        written = []
+        
+        def write_batch(connection, batch):
+            if batch == "bad":
+                raise ValueError("bad batch")
+            written.append(batch)
+            return 1
+        
+        worker = StorageWorker(worker_table, write_batch)
+        with pytest.raises(ValueError, match="bad batch"):
+            with worker_table.bulk_transaction():
+                worker.start()
+                try:
+                    for batch in (1, "bad", 3, 4):
+                        worker.submit(batch)
+                finally:
+                    worker.finish()
+        
+        assert written == [1]
+        with pytest.raises(ValueError, match="bad batch"):
+            worker.submit(5)
+    
+    def test_full_queue_blocks(self, worker_table):
+        """Test submit blocks while the bounded queue is full."""
+        release = threading.Event()
+        
+        def write_batch(connection, batch):
+            release.wait()
+            return 1
+        
+        with worker_table.bulk_transaction():
+            worker = StorageWorker(worker_table, write_batch, max_pending=1)
+            worker.start()
+            worker.submit(1)  # taken by the worker, which then waits on release
+            worker.submit(2)  # fills the queue once the worker holds batch 1
+            producer = threading.Thread(target=worker.submit, args=(3,))
+            producer.start()
+            producer.join(timeout=0.2)
+            assert producer.is_alive()
+            
+            release.set()
+            producer.join()
+            worker.finish()
+        
+        assert worker.rows_written == 3
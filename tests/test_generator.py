@@ -1,235 +1,128 @@
 """Tests for data generation functionality."""
 
+import random
+
+import numpy as np
 import pytest
-from unittest.mock import Mock, patch
 from datetime import datetime, date
 from decimal import Decimal
 
-from dbmocker.core.generator import DataGenerator
 from dbmocker.core.models import (
-    DatabaseSchema, TableInfo, ColumnInfo, ConstraintInfo,
-    ColumnType, ConstraintType, GenerationConfig, TableGenerationConfig,
-    ColumnGenerationConfig
+    ColumnInfo, ColumnType, GenerationConfig, TableGenerationConfig, ColumnGenerationConfig
 )
+from dbmocker.core import kernels_numba
+from dbmocker.core.generator import DataGenerator
+from tests.conftest import DEFAULT_GEN_CONFIG, DEFAULT_TABLE_CONFIG
+
+
+# (generator method suffix, column, expected value type, extra check)
+GENERATE_VALUE_CASES = [
+    ("integer", ColumnInfo(name="test_int", data_type=ColumnType.INTEGER),
+     int, lambda v: 1 <= v <= 2147483647),
+    ("varchar", ColumnInfo(name="test_varchar", data_type=ColumnType.VARCHAR, max_length=50),
+     str, lambda v: len(v) <= 50),
+    ("decimal", ColumnInfo(name="test_decimal", data_type=ColumnType.DECIMAL, precision=10, scale=2),
+     Decimal, lambda v: True),
+    ("boolean", ColumnInfo(name="test_bool", data_type=ColumnType.BOOLEAN),
+     bool, lambda v: True),
+    ("date", ColumnInfo(name="test_date", data_type=ColumnType.DATE),
+     date, lambda v: True),
+    ("datetime", ColumnInfo(name="test_datetime", data_type=ColumnType.DATETIME),
+     datetime, lambda v: True),
+    ("enum", ColumnInfo(name="test_enum", data_type=ColumnType.ENUM,
+                        enum_values=["option1", "option2", "option3"]),
+     str, lambda v: v in ["option1", "option2", "option3"]),
+    ("from_pattern", ColumnInfo(name="test_email", data_type=ColumnType.VARCHAR,
+                                detected_pattern="email"),
+     str, lambda v: "@" in v),
+]
 
 
 class TestDataGenerator:
     """Test DataGenerator class."""
     
-    def create_sample_schema(self) -> DatabaseSchema:
-        """Create a sample database schema for testing."""
-        # Create users table
-        users_table = TableInfo(
-            name="users",
-            columns=[
-                ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
-                ColumnInfo(name="name", data_type=ColumnType.VARCHAR, max_length=100, is_nullable=False),
-                ColumnInfo(name="email", data_type=ColumnType.VARCHAR, max_length=255, is_nullable=False,
-                          detected_pattern="email"),
-                ColumnInfo(name="age", data_type=ColumnType.INTEGER, is_nullable=True,
-                          min_value=18, max_value=100),
-                ColumnInfo(name="created_at", data_type=ColumnType.TIMESTAMP, is_nullable=False)
-            ],
-            constraints=[
-                ConstraintInfo(name="users_pkey", type=ConstraintType.PRIMARY_KEY, columns=["id"]),
-                ConstraintInfo(name="users_email_unique", type=ConstraintType.UNIQUE, columns=["email"])
-            ]
-        )
-        
-        # Create orders table
-        orders_table = TableInfo(
-            name="orders",
-            columns=[
-                ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
-                ColumnInfo(name="user_id", data_type=ColumnType.INTEGER, is_nullable=False),
-                ColumnInfo(name="total", data_type=ColumnType.DECIMAL, precision=10, scale=2, is_nullable=False),
-                ColumnInfo(name="status", data_type=ColumnType.ENUM, 
-                          enum_values=["pending", "confirmed", "shipped", "delivered"], is_nullable=False)
-            ],
-            constraints=[
-                ConstraintInfo(name="orders_pkey", type=ConstraintType.PRIMARY_KEY, columns=["id"]),
-                ConstraintInfo(name="orders_user_fk", type=ConstraintType.FOREIGN_KEY, 
-                             columns=["user_id"], referenced_table="users", referenced_columns=["id"])
-            ]
-        )
-        
-        orders_table.foreign_keys = [
-            ConstraintInfo(name="orders_user_fk", type=ConstraintType.FOREIGN_KEY,
-                         columns=["user_id"], referenced_table="users", referenced_columns=["id"])
-        ]
-        
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[users_table, orders_table]
-        )
-    
-    def test_generator_initialization(self):
+    @pytest.mark.schema_tables("users_table")
+    def test_generator_initialization(self, generator_schema, data_generator):
         """Test DataGenerator initialization."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        
-        generator = DataGenerator(schema, config)
-        
-        assert generator.schema == schema
-        assert generator.config == config
-        assert generator.faker is not None
-    
-    def test_generate_integer(self):
-        """Test integer value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_int", data_type=ColumnType.INTEGER)
-        value = generator._generate_integer(column, None)
-        
-        assert isinstance(value, int)
-        assert 1 <= value <= 2147483647
-    
-    def test_generate_integer_with_config(self):
+        assert data_generator.schema == generator_schema
+        assert data_generator.config == DEFAULT_GEN_CONFIG
+        assert data_generator.faker is not None
+    
+    @pytest.mark.parametrize("name,column,expected_type,check", GENERATE_VALUE_CASES,
+                             ids=[case[0] for case in GENERATE_VALUE_CASES])
+    def test_generate_value(self, data_generator, name, column, expected_type, check):
+        """Test type-specific value generation."""
+        value = getattr(data_generator, f"_generate_{name}")(column, None)
+        
+        assert isinstance(value, expected_type)
+        assert check(value)
+    
+    @pytest.mark.parametrize("n", [1, 1000])
+    def test_generate_enum_batch(self, data_generator, n):
+        """Test batched enum value generation."""
+        column = ColumnInfo(name="test_enum", data_type=ColumnType.ENUM,
+                            enum_values=["option1", "option2", "option3"])
+        values = data_generator._generate_enum_batch(column, n)
+        
+        assert len(values) == n
+        assert set(values) <= {"option1", "option2", "option3"}
+    
+    @pytest.mark.schema_tables("users_table", "orders_table")
+    def test_enum_columns_drawn_in_batches(self, data_generator, monkeypatch):
+        """Test row generation takes plain ENUM columns from batched draws."""
+        calls = []
+        generate_enum_batch = data_generator._generate_enum_batch
+        monkeypatch.setattr(data_generator, "_generate_enum_batch",
+                            lambda column, n: calls.append((column.name, n)) or generate_enum_batch(column, n))
+        
+        rows = data_generator.generate_data_for_table("orders", 10)
+        
+        assert calls == [("status", 10)]
+        assert {row["status"] for row in rows} <= {"pending", "confirmed", "shipped", "delivered"}
+    
+    def test_generate_integer_with_config(self, data_generator):
         """Test integer generation with custom configuration."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
         column = ColumnInfo(name="test_int", data_type=ColumnType.INTEGER)
         column_config = ColumnGenerationConfig(min_value=10, max_value=20)
         
-        value = generator._generate_integer(column, column_config)
+        value = data_generator._generate_integer(column, column_config)
         
         assert isinstance(value, int)
         assert 10 <= value <= 20
     
-    def test_generate_varchar(self):
-        """Test varchar value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_varchar", data_type=ColumnType.VARCHAR, max_length=50)
-        value = generator._generate_varchar(column, None)
-        
-        assert isinstance(value, str)
-        assert len(value) <= 50
-    
-    def test_generate_decimal(self):
-        """Test decimal value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_decimal", data_type=ColumnType.DECIMAL, precision=10, scale=2)
-        value = generator._generate_decimal(column, None)
-        
-        assert isinstance(value, Decimal)
-    
-    def test_generate_boolean(self):
-        """Test boolean value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_bool", data_type=ColumnType.BOOLEAN)
-        value = generator._generate_boolean(column, None)
-        
-        assert isinstance(value, bool)
-    
-    def test_generate_date(self):
-        """Test date value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_date", data_type=ColumnType.DATE)
-        value = generator._generate_date(column, None)
-        
-        assert isinstance(value, date)
-    
-    def test_generate_datetime(self):
-        """Test datetime value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_datetime", data_type=ColumnType.DATETIME)
-        value = generator._generate_datetime(column, None)
-        
-        assert isinstance(value, datetime)
-    
-    def test_generate_enum(self):
-        """Test enum value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_enum", data_type=ColumnType.ENUM, 
-                           enum_values=["option1", "option2", "option3"])
-        value = generator._generate_enum(column, None)
-        
-        assert value in ["option1", "option2", "option3"]
-    
-    def test_generate_from_pattern_email(self):
-        """Test pattern-based generation for email."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        column = ColumnInfo(name="test_email", data_type=ColumnType.VARCHAR, 
-                           detected_pattern="email")
-        value = generator._generate_from_pattern(column, None)
-        
-        assert isinstance(value, str)
-        assert "@" in value
-    
-    def test_generate_possible_values(self):
+    def test_generate_possible_values(self, data_generator):
         """Test generation from possible values list."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
         column = ColumnInfo(name="test_choice", data_type=ColumnType.VARCHAR)
         column_config = ColumnGenerationConfig(possible_values=["A", "B", "C"])
         
-        value = generator._generate_varchar(column, column_config)
+        value = data_generator._generate_varchar(column, column_config)
         
         assert value in ["A", "B", "C"]
     
-    def test_null_generation(self):
+    def test_null_generation(self, data_generator):
         """Test null value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
         column = ColumnInfo(name="test_nullable", data_type=ColumnType.VARCHAR, is_nullable=True)
         column_config = ColumnGenerationConfig(null_probability=1.0)  # Always null
         
-        value = generator._generate_column_value(column, TableGenerationConfig(
+        value = data_generator._generate_column_value(column, TableGenerationConfig(
             column_configs={"test_nullable": column_config}
         ))
         
         assert value is None
     
-    def test_is_foreign_key_column(self):
+    @pytest.mark.schema_tables("orders_table")
+    def test_is_foreign_key_column(self, generator_schema, data_generator):
         """Test foreign key column detection."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        orders_table = schema.get_table("orders")
+        orders_table = generator_schema.get_table("orders")
         
-        assert generator._is_foreign_key_column(orders_table, "user_id") is True
-        assert generator._is_foreign_key_column(orders_table, "total") is False
+        assert data_generator._is_foreign_key_column(orders_table, "user_id") is True
+        assert data_generator._is_foreign_key_column(orders_table, "total") is False
     
-    def test_generate_row_basic(self):
+    @pytest.mark.schema_tables("users_table")
+    def test_generate_row_basic(self, generator_schema, data_generator):
         """Test basic row generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        users_table = schema.get_table("users")
-        table_config = TableGenerationConfig()
-        
-        row = generator._generate_row(users_table, table_config)
+        users_table = generator_schema.get_table("users")
+        row = data_generator._generate_row(users_table, DEFAULT_TABLE_CONFIG)
         
         assert "id" in row
         assert "name" in row
@@ -242,73 +135,102 @@ class TestDataGenerator:
         assert isinstance(row["email"], str)
         assert "@" in row["email"]  # Should be email pattern
     
-    def test_generate_data_for_table(self):
+    def test_generate_data_for_table(self, users_rows):
         """Test data generation for entire table."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
+        assert len(users_rows) == 100
+        assert all("id" in row and "@" in row.get("email", "") for row in users_rows)
+    
+    @pytest.mark.schema_tables("users_table")
+    def test_generate_data_for_table_iter_chunks(self, data_generator):
+        """Test streamed generation yields bounded chunks covering all rows."""
+        chunks = list(data_generator.generate_data_for_table_iter("users", 25, chunk_size=10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    
+    @pytest.mark.schema_tables("orders_table")
+    def test_global_smart_duplicates(self, generator_schema, shared_faker):
+        """Test global smart duplicates fill a bounded pool, then rotate through it."""
+        config = GenerationConfig(seed=42, duplicate_allowed=True, global_duplicate_mode="smart_duplicates",
+                                  global_duplicate_probability=1.0, global_max_duplicate_values=3)
+        generator = DataGenerator(generator_schema, config, faker=shared_faker)
+        orders_table = generator_schema.get_table("orders")
+        total_column = orders_table.get_column("total")
+        
+        values = [generator._generate_smart_duplicate_value_global(total_column, orders_table)
+                  for _ in range(30)]
+        
+        pool = values[:3]
+        assert values == pool * 10
+        # Primary keys never join a duplicate pool
+        assert generator._can_allow_duplicates(orders_table, "id") is False
+    
+    def test_shared_faker_reseeded(self, generator_schema, shared_faker):
+        """Test a seeded generator reseeds an injected Faker, whatever earlier draws left behind."""
+        column = ColumnInfo(name="test_varchar", data_type=ColumnType.VARCHAR, max_length=50)
+        
+        def first_value():
+            generator = DataGenerator(generator_schema, DEFAULT_GEN_CONFIG, faker=shared_faker)
+            return generator._generate_varchar(column, None)
         
-        users_data = generator.generate_data_for_table("users", 5)
+        value = first_value()
+        shared_faker.pystr()
         
-        assert len(users_data) == 5
-        assert all("id" in row for row in users_data)
-        assert all("email" in row for row in users_data)
-        assert all("@" in row["email"] for row in users_data)
+        assert first_value() == value
     
-    def test_generate_data_for_table_not_found(self):
-        """Test data generation for non-existent table."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
+    def test_smart_duplicate_picks_reproducible(self, monkeypatch):
+        """Test seeded smart-duplicate picks repeat even when the Numba kernel is available."""
+        def unseeded_kernel(lo, hi, out):
+            out[:] = np.random.default_rng().integers(lo, hi, size=out.size)
         
+        monkeypatch.setattr(kernels_numba, "HAS_NUMBA", True)
+        monkeypatch.setattr(kernels_numba, "_fill_int_uniform_kernel", unseeded_kernel, raising=False)
+        
+        def picks(seed):
+            cache = {'values': list(range(50)), 'picks': iter(()), 'cursor': 0,
+                     'rng': np.random.default_rng(seed)}
+            return [DataGenerator._next_smart_duplicate_value(cache, 0.3) for _ in range(200)]
+        
+        assert picks(42) == picks(42)
+    
+    def test_generate_data_for_table_not_found(self, empty_generator):
+        """Test data generation for non-existent table."""
         with pytest.raises(ValueError, match="Table nonexistent not found"):
-            generator.generate_data_for_table("nonexistent", 5)
+            empty_generator.generate_data_for_table("nonexistent", 5)
     
-    def test_custom_generator(self):
+    def test_custom_generator(self, data_generator):
         """Test custom generator function."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
         column = ColumnInfo(name="test_custom", data_type=ColumnType.VARCHAR)
         
         # Test built-in custom generator
-        value = generator._apply_custom_generator("name", column)
+        value = data_generator._apply_custom_generator("name", column)
         assert isinstance(value, str)
         assert len(value) > 0
         
         # Test non-existent custom generator
-        value = generator._apply_custom_generator("nonexistent", column)
+        value = data_generator._apply_custom_generator("nonexistent", column)
         assert isinstance(value, str)  # Should fall back to default generation
     
-    def test_cache_generated_values(self):
+    @pytest.mark.schema_tables("users_table")
+    def test_cache_generated_values(self, data_generator):
         """Test value caching for FK references."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
         row = {"id": 1, "name": "Test User"}
-        generator._cache_generated_values("users", row)
+        data_generator._cache_generated_values("users", row)
         
-        assert "users" in generator._generated_values
-        assert "id" in generator._generated_values["users"]
-        assert 1 in generator._generated_values["users"]["id"]
+        assert "users" in data_generator._generated_values
+        assert "id" in data_generator._generated_values["users"]
+        assert 1 in data_generator._generated_values["users"]["id"].tolist()
+        # Only key columns are cached, so memory does not grow with every column
+        assert "name" not in data_generator._generated_values["users"]
     
-    @patch('dbmocker.core.generator.random.choice')
-    def test_foreign_key_generation(self, mock_choice):
+    def test_foreign_key_generation(self, generator_schema, data_generator, monkeypatch):
         """Test foreign key value generation."""
-        schema = self.create_sample_schema()
-        config = GenerationConfig(seed=42)
-        generator = DataGenerator(schema, config)
-        
-        # Mock cached values
-        generator._generated_values["users"] = {"id": [1, 2, 3]}
-        mock_choice.return_value = 2
+        # Cached values of the referenced column
+        data_generator._generated_values["users"] = {"id": [1, 2, 3]}
         
-        orders_table = schema.get_table("orders")
+        orders_table = generator_schema.get_table("orders")
         user_id_column = orders_table.get_column("user_id")
         
-        value = generator._generate_foreign_key_value(orders_table, user_id_column)
+        # Fix the pick without reseeding the process-wide RNG other tests draw from
+        monkeypatch.setattr(random, "choice", lambda values: list(values)[-1])
+        value = data_generator._generate_foreign_key_value(orders_table, user_id_column)
         
-        assert value == 2
-        mock_choice.assert_called_once_with([1, 2, 3])
+        assert value == 3
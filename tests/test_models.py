@@ -1,5 +1,8 @@
 """Tests for data models."""
 
+import copy
+from operator import attrgetter
+
 import pytest
 from dbmocker.core.models import (
     ColumnInfo, TableInfo, DatabaseSchema, ConstraintInfo,
@@ -8,304 +11,294 @@ from dbmocker.core.models import (
 )
 
 
+VARCHAR, INTEGER = ColumnType.VARCHAR, ColumnType.INTEGER
+PK, FK, UQ = ConstraintType.PRIMARY_KEY, ConstraintType.FOREIGN_KEY, ConstraintType.UNIQUE
+
+
+# Canonical instances shared by the fixtures below; tests must not mutate them in place
+ID_COL = ColumnInfo(name="id", data_type=INTEGER, is_nullable=False)
+NAME_COL = ColumnInfo(name="name", data_type=VARCHAR, max_length=100)
+EMAIL_COL = ColumnInfo(name="email", data_type=VARCHAR, max_length=255)
+USER_ID_COL = ColumnInfo(name="user_id", data_type=INTEGER)
+
+USERS_PK = ConstraintInfo(name="users_pkey", type=PK, columns=["id"])
+USERS_EMAIL_UQ = ConstraintInfo(name="users_email_unique", type=UQ, columns=["email"])
+ORDERS_USER_FK = ConstraintInfo(
+    name="orders_user_fk",
+    type=FK,
+    columns=["user_id"],
+    referenced_table="users",
+    referenced_columns=["id"]
+)
+USERS_DEPT_FK = ConstraintInfo(
+    name="users_dept_fk",
+    type=FK,
+    columns=["dept_id"],
+    referenced_table="departments",
+    referenced_columns=["id"]
+)
+
+
+@pytest.fixture(scope="module")
+def sample_table() -> TableInfo:
+    """Shared users table; tests that mutate it use ``mutable_sample_table``."""
+    return TableInfo(
+        name="users",
+        columns=[ID_COL, NAME_COL, EMAIL_COL],
+        constraints=[USERS_PK, USERS_EMAIL_UQ],
+        row_count=1000
+    )
+
+
+@pytest.fixture
+def mutable_sample_table(sample_table) -> TableInfo:
+    """Private copy of ``sample_table`` for tests that mutate it."""
+    return copy.deepcopy(sample_table)
+
+
+@pytest.fixture(scope="module")
+def sample_schema() -> DatabaseSchema:
+    """Shared two-table users/orders schema."""
+    users_table = TableInfo(name="users", columns=[ID_COL, NAME_COL])
+    orders_table = TableInfo(
+        name="orders",
+        columns=[ID_COL, USER_ID_COL],
+        foreign_keys=[ORDERS_USER_FK]
+    )
+    
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[users_table, orders_table]
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_deps():
+    """Dependency graph ``sample_schema`` must produce."""
+    return {"users": [], "orders": ["users"]}
+
+
 class TestColumnInfo:
     """Test ColumnInfo data class."""
     
-    def test_column_creation(self):
-        """Test basic column creation."""
-        column = ColumnInfo(
-            name="test_column",
-            data_type=ColumnType.VARCHAR,
-            max_length=100,
-            is_nullable=True
-        )
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {"name": "test_column", "data_type": VARCHAR,
+             "max_length": 100, "is_nullable": True},
+            {"name": "test_column", "data_type": VARCHAR,
+             "max_length": 100, "is_nullable": True,
+             "default_value": None, "is_auto_increment": False},
+            id="varchar",
+        ),
+        pytest.param(
+            {"name": "email", "data_type": VARCHAR,
+             "detected_pattern": "email",
+             "sample_values": ["test@example.com", "user@domain.org"]},
+            {"detected_pattern": "email",
+             "sample_values": ["test@example.com", "user@domain.org"]},
+            id="with_pattern",
+        ),
+    ])
+    def test_column_creation(self, kwargs, expected):
+        """Test column creation, with and without a detected pattern."""
+        column = ColumnInfo(**kwargs)
         
-        assert column.name == "test_column"
-        assert column.data_type == ColumnType.VARCHAR
-        assert column.max_length == 100
-        assert column.is_nullable is True
-        assert column.default_value is None
-        assert column.is_auto_increment is False
-    
-    def test_column_with_pattern(self):
-        """Test column with detected pattern."""
-        column = ColumnInfo(
-            name="email",
-            data_type=ColumnType.VARCHAR,
-            detected_pattern="email",
-            sample_values=["test@example.com", "user@domain.org"]
-        )
-        
-        assert column.detected_pattern == "email"
-        assert len(column.sample_values) == 2
-        assert "test@example.com" in column.sample_values
+        assert attrgetter(*expected)(column) == tuple(expected.values())
 
 
 class TestConstraintInfo:
     """Test ConstraintInfo data class."""
     
-    def test_primary_key_constraint(self):
-        """Test primary key constraint."""
-        constraint = ConstraintInfo(
-            name="users_pkey",
-            type=ConstraintType.PRIMARY_KEY,
-            columns=["id"]
-        )
-        
-        assert constraint.name == "users_pkey"
-        assert constraint.type == ConstraintType.PRIMARY_KEY
-        assert constraint.columns == ["id"]
-        assert constraint.referenced_table is None
-    
-    def test_foreign_key_constraint(self):
-        """Test foreign key constraint."""
-        constraint = ConstraintInfo(
-            name="orders_user_fk",
-            type=ConstraintType.FOREIGN_KEY,
-            columns=["user_id"],
-            referenced_table="users",
-            referenced_columns=["id"],
-            on_delete="CASCADE"
-        )
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {"name": "users_pkey", "type": PK,
+             "columns": ["id"]},
+            {"name": "users_pkey", "type": PK,
+             "columns": ["id"], "referenced_table": None},
+            id="primary_key",
+        ),
+        pytest.param(
+            {"name": "orders_user_fk", "type": FK,
+             "columns": ["user_id"], "referenced_table": "users",
+             "referenced_columns": ["id"], "on_delete": "CASCADE"},
+            {"type": FK, "referenced_table": "users",
+             "referenced_columns": ["id"], "on_delete": "CASCADE"},
+            id="foreign_key",
+        ),
+    ])
+    def test_constraint_creation(self, kwargs, expected):
+        """Test primary key and foreign key constraint creation."""
+        constraint = ConstraintInfo(**kwargs)
         
-        assert constraint.type == ConstraintType.FOREIGN_KEY
-        assert constraint.referenced_table == "users"
-        assert constraint.referenced_columns == ["id"]
-        assert constraint.on_delete == "CASCADE"
+        assert attrgetter(*expected)(constraint) == tuple(expected.values())
 
 
 class TestTableInfo:
     """Test TableInfo data class."""
     
-    def create_sample_table(self) -> TableInfo:
-        """Create a sample table for testing."""
-        columns = [
-            ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
-            ColumnInfo(name="name", data_type=ColumnType.VARCHAR, max_length=100),
-            ColumnInfo(name="email", data_type=ColumnType.VARCHAR, max_length=255)
-        ]
-        
-        constraints = [
-            ConstraintInfo(name="users_pkey", type=ConstraintType.PRIMARY_KEY, columns=["id"]),
-            ConstraintInfo(name="users_email_unique", type=ConstraintType.UNIQUE, columns=["email"])
-        ]
-        
-        return TableInfo(
-            name="users",
-            columns=columns,
-            constraints=constraints,
-            row_count=1000
-        )
-    
-    def test_table_creation(self):
+    def test_table_creation(self, sample_table):
         """Test basic table creation."""
-        table = self.create_sample_table()
-        
-        assert table.name == "users"
-        assert len(table.columns) == 3
-        assert len(table.constraints) == 2
-        assert table.row_count == 1000
+        assert sample_table.name == "users"
+        assert len(sample_table.columns) == 3
+        assert len(sample_table.constraints) == 2
+        assert sample_table.row_count == 1000
     
-    def test_get_column(self):
+    def test_get_column(self, sample_table):
         """Test getting column by name."""
-        table = self.create_sample_table()
-        
-        column = table.get_column("name")
+        column = sample_table.get_column("name")
         assert column is not None
         assert column.name == "name"
-        assert column.data_type == ColumnType.VARCHAR
+        assert column.data_type == VARCHAR
         
         # Test non-existent column
-        column = table.get_column("nonexistent")
+        column = sample_table.get_column("nonexistent")
         assert column is None
     
-    def test_get_primary_key_columns(self):
+    def test_get_column_after_columns_change(self, mutable_sample_table):
+        """Test column lookup sees columns added after the first lookup."""
+        assert mutable_sample_table.get_column("age") is None
+        
+        mutable_sample_table.columns.append(ColumnInfo(name="age", data_type=INTEGER))
+        
+        assert mutable_sample_table.get_column("age").name == "age"
+    
+    def test_get_primary_key_columns(self, sample_table):
         """Test getting primary key columns."""
-        table = self.create_sample_table()
-        pk_columns = table.get_primary_key_columns()
+        pk_columns = sample_table.get_primary_key_columns()
         
         assert pk_columns == ["id"]
     
-    def test_get_foreign_key_columns(self):
+    def test_get_foreign_key_columns(self, mutable_sample_table):
         """Test getting foreign key columns."""
-        table = self.create_sample_table()
-        
         # Add a foreign key constraint
-        fk_constraint = ConstraintInfo(
-            name="users_dept_fk",
-            type=ConstraintType.FOREIGN_KEY,
-            columns=["dept_id"],
-            referenced_table="departments",
-            referenced_columns=["id"]
-        )
-        table.constraints.append(fk_constraint)
+        mutable_sample_table.constraints.append(USERS_DEPT_FK)
         
-        fk_columns = table.get_foreign_key_columns()
+        fk_columns = mutable_sample_table.get_foreign_key_columns()
         assert "dept_id" in fk_columns
 
 
 class TestDatabaseSchema:
     """Test DatabaseSchema data class."""
     
-    def create_sample_schema(self) -> DatabaseSchema:
-        """Create a sample schema for testing."""
-        users_table = TableInfo(
-            name="users",
-            columns=[
-                ColumnInfo(name="id", data_type=ColumnType.INTEGER),
-                ColumnInfo(name="name", data_type=ColumnType.VARCHAR)
-            ]
-        )
-        
-        orders_table = TableInfo(
-            name="orders",
-            columns=[
-                ColumnInfo(name="id", data_type=ColumnType.INTEGER),
-                ColumnInfo(name="user_id", data_type=ColumnType.INTEGER)
-            ],
-            foreign_keys=[
-                ConstraintInfo(
-                    name="orders_user_fk",
-                    type=ConstraintType.FOREIGN_KEY,
-                    columns=["user_id"],
-                    referenced_table="users",
-                    referenced_columns=["id"]
-                )
-            ]
-        )
-        
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[users_table, orders_table]
-        )
-    
-    def test_schema_creation(self):
+    def test_schema_creation(self, sample_schema):
         """Test basic schema creation."""
-        schema = self.create_sample_schema()
-        
-        assert schema.database_name == "test_db"
-        assert len(schema.tables) == 2
-        assert len(schema.views) == 0
+        assert sample_schema.database_name == "test_db"
+        assert len(sample_schema.tables) == 2
+        assert len(sample_schema.views) == 0
     
-    def test_get_table(self):
+    def test_get_table(self, sample_schema):
         """Test getting table by name."""
-        schema = self.create_sample_schema()
-        
-        table = schema.get_table("users")
+        table = sample_schema.get_table("users")
         assert table is not None
         assert table.name == "users"
         
         # Test non-existent table
-        table = schema.get_table("nonexistent")
+        table = sample_schema.get_table("nonexistent")
         assert table is None
     
-    def test_get_table_dependencies(self):
+    def test_get_table_dependencies(self, sample_schema, expected_deps):
         """Test getting table dependencies."""
-        schema = self.create_sample_schema()
-        dependencies = schema.get_table_dependencies()
+        dependencies = sample_schema.get_table_dependencies()
+        
+        assert dependencies == expected_deps
+        assert sample_schema.get_table_dependencies() is dependencies
+    
+    def test_add_table_invalidates_dependencies(self):
+        """Test adding a table recomputes the cached dependency graph."""
+        schema = DatabaseSchema(database_name="test_db")
+        assert schema.get_table_dependencies() == {}
         
-        assert "users" in dependencies
-        assert "orders" in dependencies
-        assert dependencies["users"] == []  # No dependencies
-        assert dependencies["orders"] == ["users"]  # Depends on users
+        schema.add_table(TableInfo(name="users"))
+        
+        assert schema.get_table_dependencies() == {"users": []}
 
 
 class TestGenerationConfig:
     """Test GenerationConfig model."""
     
-    def test_default_config(self):
+    @pytest.mark.defaults
+    def test_default_config(self, default_gen_config):
         """Test default configuration values."""
-        config = GenerationConfig()
+        expected = {"batch_size": 1000, "max_workers": 4, "truncate_existing": False,
+                    "seed": None, "table_configs": {}, "include_tables": None,
+                    "exclude_tables": []}
         
-        assert config.batch_size == 1000
-        assert config.max_workers == 4
-        assert config.truncate_existing is False
-        assert config.seed is None
-        assert len(config.table_configs) == 0
-        assert config.include_tables is None
-        assert len(config.exclude_tables) == 0
+        assert attrgetter(*expected)(default_gen_config) == tuple(expected.values())
     
-    def test_custom_config(self):
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {"batch_size": 500, "max_workers": 2, "truncate_existing": True,
+             "seed": 42, "include_tables": ["users", "orders"],
+             "exclude_tables": ["logs"]},
+            {"batch_size": 500, "max_workers": 2, "truncate_existing": True,
+             "seed": 42, "include_tables": ["users", "orders"],
+             "exclude_tables": ["logs"]},
+            id="custom",
+        ),
+    ])
+    def test_custom_config(self, kwargs, expected):
         """Test custom configuration values."""
-        config = GenerationConfig(
-            batch_size=500,
-            max_workers=2,
-            truncate_existing=True,
-            seed=42,
-            include_tables=["users", "orders"],
-            exclude_tables=["logs"]
-        )
+        config = GenerationConfig(**kwargs)
         
-        assert config.batch_size == 500
-        assert config.max_workers == 2
-        assert config.truncate_existing is True
-        assert config.seed == 42
-        assert config.include_tables == ["users", "orders"]
-        assert config.exclude_tables == ["logs"]
+        assert attrgetter(*expected)(config) == tuple(expected.values())
 
 
 class TestTableGenerationConfig:
     """Test TableGenerationConfig model."""
     
-    def test_default_table_config(self):
+    @pytest.mark.defaults
+    def test_default_table_config(self, default_table_config):
         """Test default table configuration."""
-        config = TableGenerationConfig()
+        expected = {"rows_to_generate": 1000, "column_configs": {},
+                    "custom_generators": {}}
         
-        assert config.rows_to_generate == 1000
-        assert len(config.column_configs) == 0
-        assert len(config.custom_generators) == 0
+        assert attrgetter(*expected)(default_table_config) == tuple(expected.values())
     
-    def test_custom_table_config(self):
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {"rows_to_generate": 5000,
+             "column_configs": {"age": ColumnGenerationConfig(
+                 min_value=1, max_value=100, null_probability=0.1)}},
+            {"rows_to_generate": 5000,
+             "column_configs": {"age": ColumnGenerationConfig(
+                 min_value=1, max_value=100, null_probability=0.1)}},
+            id="custom",
+        ),
+    ])
+    def test_custom_table_config(self, kwargs, expected):
         """Test custom table configuration."""
-        column_config = ColumnGenerationConfig(
-            min_value=1,
-            max_value=100,
-            null_probability=0.1
-        )
-        
-        config = TableGenerationConfig(
-            rows_to_generate=5000,
-            column_configs={"age": column_config}
-        )
+        config = TableGenerationConfig(**kwargs)
         
-        assert config.rows_to_generate == 5000
-        assert "age" in config.column_configs
-        assert config.column_configs["age"].min_value == 1
+        assert attrgetter(*expected)(config) == tuple(expected.values())
 
 
 class TestColumnGenerationConfig:
     """Test ColumnGenerationConfig model."""
     
-    def test_default_column_config(self):
+    @pytest.mark.defaults
+    def test_default_column_config(self, default_column_config):
         """Test default column configuration."""
-        config = ColumnGenerationConfig()
+        expected = {"min_value": None, "max_value": None, "min_length": None,
+                    "max_length": None, "pattern": None, "possible_values": None,
+                    "null_probability": 0.0}
         
-        assert config.min_value is None
-        assert config.max_value is None
-        assert config.min_length is None
-        assert config.max_length is None
-        assert config.pattern is None
-        assert config.possible_values is None
-        assert config.null_probability == 0.0
+        assert attrgetter(*expected)(default_column_config) == tuple(expected.values())
     
-    def test_custom_column_config(self):
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {"min_value": 10, "max_value": 100, "min_length": 5,
+             "max_length": 50, "pattern": r"\d{3}-\d{3}-\d{4}",
+             "possible_values": ["A", "B", "C"], "null_probability": 0.2,
+             "generator_function": "custom_gen"},
+            {"min_value": 10, "max_value": 100, "min_length": 5,
+             "max_length": 50, "pattern": r"\d{3}-\d{3}-\d{4}",
+             "possible_values": ["A", "B", "C"], "null_probability": 0.2,
+             "generator_function": "custom_gen"},
+            id="custom",
+        ),
+    ])
+    def test_custom_column_config(self, kwargs, expected):
         """Test custom column configuration."""
-        config = ColumnGenerationConfig(
-            min_value=10,
-            max_value=100,
-            min_length=5,
-            max_length=50,
-            pattern=r"\d{3}-\d{3}-\d{4}",
-            possible_values=["A", "B", "C"],
-            null_probability=0.2,
-            generator_function="custom_gen"
-        )
+        config = ColumnGenerationConfig(**kwargs)
         
-        assert config.min_value == 10
-        assert config.max_value == 100
-        assert config.min_length == 5
-        assert config.max_length == 50
-        assert config.pattern == r"\d{3}-\d{3}-\d{4}"
-        assert config.possible_values == ["A", "B", "C"]
-        assert config.null_probability == 0.2
-        assert config.generator_function == "custom_gen"
+        assert attrgetter(*expected)(config) == tuple(expected.values())
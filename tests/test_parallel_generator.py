@@ -0,0 +1,282 @@
+"""Tests for the parallel generator and inserter."""
+
+import csv
+import io
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from dbmocker.core import database as database_module
+from dbmocker.core.database import DatabaseConnection, DatabaseConfig
+from dbmocker.core.models import (
+    ColumnGenerationConfig, ColumnInfo, ColumnType, DatabaseSchema, GenerationConfig,
+    TableGenerationConfig, TableInfo
+)
+from dbmocker.core.parallel_generator import ParallelDataGenerator, ParallelDataInserter, _compute_shards
+
+
+# A three-column table: SQLite's 999-variable cap allows 333 rows per INSERT
+ITEMS_TABLE = TableInfo(name="items", columns=[
+    ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False),
+    ColumnInfo(name="name", data_type=ColumnType.VARCHAR, max_length=50),
+    ColumnInfo(name="score", data_type=ColumnType.FLOAT),
+])
+ITEMS_COLUMNS = ["id", "name", "score"]
+
+# One column per columnar dtype; the auto-increment id is left to the database
+METRICS_TABLE = TableInfo(name="metrics", columns=[
+    ColumnInfo(name="id", data_type=ColumnType.INTEGER, is_nullable=False, is_auto_increment=True),
+    ColumnInfo(name="qty", data_type=ColumnType.INTEGER, is_nullable=False),
+    ColumnInfo(name="ratio", data_type=ColumnType.FLOAT, is_nullable=False),
+    ColumnInfo(name="active", data_type=ColumnType.BOOLEAN, is_nullable=False),
+    ColumnInfo(name="label", data_type=ColumnType.VARCHAR, max_length=20, is_nullable=False),
+])
+
+
+@pytest.fixture
+def metrics_generator():
+    """ParallelDataGenerator over a schema holding only ``metrics``."""
+    return ParallelDataGenerator(DatabaseSchema(database_name="test_db", tables=[METRICS_TABLE]),
+                                 GenerationConfig(seed=42), db_connection=None)
+
+
+@pytest.fixture
+def items_table(sqlite_conn):
+    """An empty ``items`` table in the session SQLite database, dropped afterwards."""
+    with sqlite_conn.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT, score REAL)"))
+    yield sqlite_conn
+    with sqlite_conn.engine.begin() as conn:
+        conn.execute(text("DROP TABLE items"))
+
+
+@pytest.fixture
+def file_items_table(temp_db_file):
+    """An empty ``items`` table in a file-backed SQLite database that worker threads share."""
+    db_conn = DatabaseConnection(DatabaseConfig(host="localhost", port=0, database=temp_db_file,
+                                                username="", password="", driver="sqlite"))
+    db_conn.connect()
+    with db_conn.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT, score REAL)"))
+    yield db_conn
+    db_conn.close()
+
+
+def item_rows(start, stop):
+    """Row tuples for ``items`` with ids in ``[start, stop)``."""
+    return [(i, f"item{i}", i / 2) for i in range(start, stop)]
+
+
+def item_chunks(count, chunk_size):
+    """Columnar ``items`` chunks covering ``count`` rows."""
+    for start in range(0, count, chunk_size):
+        ids = np.arange(start, min(start + chunk_size, count))
+        yield {"id": ids, "name": [f"item{i}" for i in ids], "score": ids / 2}
+
+
+class TestCopyRows:
+    """Test ParallelDataInserter._copy_rows."""
+    
+    def test_copy_rows_encoding(self, pg_config):
+        """Test COPY CSV encoding of NULL, booleans, bytea, JSON and \\N text, inside the caller's transaction."""
+        inserter = ParallelDataInserter(DatabaseConnection(pg_config),
+                                        DatabaseSchema(database_name="test_db", tables=[]),
+                                        GenerationConfig(bulk_copy=True))
+        cursor = Mock()
+        sent = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: sent.append(buffer.getvalue())
+        
+        inserter._copy_rows(cursor, "items", ["flag", "payload", "meta", "note"],
+                            [(True, b"\x00\xff", {"a": 1}, None), (False, bytearray(b"ab"), [1], ""),
+                             (True, b"", None, "\\N")])
+        
+        assert list(csv.reader(io.StringIO(sent[0]))) == [
+            ["t", "\\x00ff", '{"a": 1}', "\\N"],
+            ["f", "\\x6162", "[1]", ""],
+            ["t", "\\x", "\\N", "\\N"],
+        ]
+        # Only real NULLs are the bare marker COPY reads as NULL; the \N text is quoted
+        assert sent[0].splitlines()[2] == '"t","\\x",\\N,"\\N"'
+        # The raw connection owns the transaction: no BEGIN/COMMIT on the cursor
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert statements == ["SET LOCAL synchronous_commit = OFF"]
+
+
+class TestExecuteRows:
+    """Test multi-row VALUES grouping in ParallelDataInserter._execute_rows."""
+    
+    def test_grouped_insert_with_remainder(self, items_table):
+        """Test a row count that is not a multiple of the group size is fully inserted with cached SQL."""
+        inserter = ParallelDataInserter(items_table, DatabaseSchema(database_name="test_db", tables=[ITEMS_TABLE]))
+        
+        assert inserter._insert_rows_safe(ITEMS_TABLE, ITEMS_COLUMNS, item_rows(0, 1000), 0) == 1000
+        
+        assert items_table.execute_query("SELECT COUNT(*) FROM items")[0][0] == 1000
+        assert items_table.execute_query("SELECT id, name, score FROM items WHERE id = 999")[0] == (999, "item999", 499.5)
+        # 999 rows went out in three 333-row statements and the last row on its own
+        group_key = ("sqlite", "items", tuple(ITEMS_COLUMNS), 333)
+        assert group_key in database_module._INSERT_SQL_CACHE
+        assert ("sqlite", "items", tuple(ITEMS_COLUMNS), 1) in database_module._INSERT_SQL_CACHE
+        group_sql = database_module._INSERT_SQL_CACHE[group_key]
+        assert group_sql.count("(?, ?, ?)") == 333
+        
+        cache_size = len(database_module._INSERT_SQL_CACHE)
+        inserter._insert_rows_safe(ITEMS_TABLE, ITEMS_COLUMNS, item_rows(1000, 1500), 1)
+        
+        assert items_table.execute_query("SELECT COUNT(*) FROM items")[0][0] == 1500
+        assert len(database_module._INSERT_SQL_CACHE) == cache_size
+        assert database_module.get_insert_sql(items_table, "items", ITEMS_COLUMNS, 333) is group_sql
+
+
+class TestInsertColumnsPipelined:
+    """Test ParallelDataInserter.insert_columns_pipelined."""
+    
+    @staticmethod
+    def _inserter(db_conn):
+        return ParallelDataInserter(db_conn, DatabaseSchema(database_name="test_db", tables=[ITEMS_TABLE]))
+    
+    def test_inserts_all_chunks(self, file_items_table):
+        """Test every chunk is inserted and counted across worker threads."""
+        progress = []
+        stats = self._inserter(file_items_table).insert_columns_pipelined(
+            "items", item_chunks(1050, 100), max_workers=3, prefetch=1,
+            progress_callback=lambda table, inserted, requested: progress.append(inserted)
+        )
+        
+        assert stats.errors == []
+        assert stats.total_rows_generated == 1050
+        assert stats.table_stats["items"]["rows_requested"] == 1050
+        assert file_items_table.execute_query("SELECT COUNT(*) FROM items")[0][0] == 1050
+        assert sorted(progress)[-1] == 1050
+    
+    def test_failed_insert_recorded(self, file_items_table):
+        """Test a failed chunk insert is reported in the stats while the other chunks land."""
+        chunks = list(item_chunks(300, 100))
+        chunks[1] = {"missing": chunks[1]["id"]}
+        
+        stats = self._inserter(file_items_table).insert_columns_pipelined("items", chunks, max_workers=2)
+        
+        assert len(stats.errors) == 1
+        assert stats.errors[0].startswith("Batch 2 failed")
+        assert stats.total_rows_generated == 200
+    
+    def test_worker_exception_propagates(self, file_items_table):
+        """Test an exception raised in a worker thread is re-raised to the caller."""
+        def fail(table, inserted, requested):
+            raise RuntimeError("callback failed")
+        
+        with pytest.raises(RuntimeError, match="callback failed"):
+            self._inserter(file_items_table).insert_columns_pipelined(
+                "items", item_chunks(1000, 100), max_workers=2, prefetch=1, progress_callback=fail
+            )
+
+
+class TestColumnar:
+    """Test the columnar generation and insertion API."""
+    
+    def test_generate_columnar(self, metrics_generator):
+        """Test one array per non-auto-increment column, in table order, with native dtypes."""
+        columns = metrics_generator.generate_columnar("metrics", 25)
+        
+        assert list(columns) == ["qty", "ratio", "active", "label"]
+        assert [columns[name].dtype for name in columns] == [np.int64, np.float64, np.bool_, object]
+        assert all(len(array) == 25 for array in columns.values())
+    
+    def test_to_columnar_keeps_none(self, metrics_generator):
+        """Test a numeric column holding NULLs falls back to an object array that keeps None."""
+        columns = metrics_generator._to_columnar("metrics", {"qty": [1, None, 3], "ratio": [0.5, 1.5, 2.5]})
+        
+        assert columns["qty"].dtype == object
+        assert columns["qty"].tolist() == [1, None, 3]
+        assert columns["ratio"].dtype == np.float64
+    
+    def test_insert_columns_parallel(self, temp_db_file):
+        """Test columnar arrays are inserted as rows, with NumPy scalars bound as Python values."""
+        db_conn = DatabaseConnection(DatabaseConfig(host="localhost", port=0, database=temp_db_file,
+                                                    username="", password="", driver="sqlite"))
+        with db_conn:
+            with db_conn.engine.begin() as conn:
+                conn.execute(text("CREATE TABLE metrics (id INTEGER PRIMARY KEY, qty INTEGER, "
+                                  "ratio REAL, active BOOLEAN, label TEXT)"))
+            inserter = ParallelDataInserter(db_conn, DatabaseSchema(database_name="test_db", tables=[METRICS_TABLE]))
+            columns = {"qty": np.arange(250), "ratio": np.arange(250) / 4,
+                       "active": np.arange(250) % 2 == 0, "label": np.array([f"m{i}" for i in range(250)], dtype=object)}
+            
+            stats = inserter.insert_columns_parallel("metrics", columns, batch_size=100, max_workers=2)
+            
+            assert stats.errors == []
+            assert stats.total_rows_generated == 250
+            assert db_conn.execute_query("SELECT qty, ratio, active, label FROM metrics WHERE qty = 7")[0] == (7, 1.75, 0, "m7")
+
+
+class TestSharding:
+    """Test deterministic sharding and per-shard seeds."""
+    
+    @pytest.mark.parametrize("total_rows,parts", [
+        (0, 4), (3, 8), (10, 4), (12, 4), (1, 1), (100, 0),
+    ], ids=["empty", "fewer_rows_than_workers", "remainder", "even", "single", "no_parts"])
+    def test_shards_cover_range_once(self, total_rows, parts):
+        """Test shards are contiguous, non-empty, near-equal and cover [0, n) exactly once."""
+        shards = _compute_shards(total_rows, parts)
+        
+        covered = [row for start, end in shards for row in range(start, end)]
+        assert covered == list(range(total_rows))
+        assert len(shards) <= max(1, parts)
+        sizes = [end - start for start, end in shards]
+        assert all(size > 0 for size in sizes)
+        assert not sizes or max(sizes) - min(sizes) <= 1
+    
+    @pytest.mark.parametrize("rng_seed", [None, 7], ids=["config_seed", "shared_rng"])
+    def test_task_seeds_stable(self, rng_seed):
+        """Test two generators built alike assign the same shards and seeds."""
+        def tasks():
+            rng = np.random.default_rng(rng_seed) if rng_seed is not None else None
+            generator = ParallelDataGenerator(DatabaseSchema(database_name="test_db", tables=[METRICS_TABLE]),
+                                              GenerationConfig(seed=42, max_workers=4), None, rng=rng)
+            return [(task.start_row, task.end_row, task.seed)
+                    for task in generator._build_thread_tasks("metrics", 10, seed_offset=5)]
+        
+        first = tasks()
+        
+        assert first == tasks()
+        assert [(start, end) for start, end, _ in first] == _compute_shards(10, 4)
+        assert len({seed for _, _, seed in first}) == len(first)
+        if rng_seed is None:
+            assert [seed for _, _, seed in first] == [47, 1047, 2047, 3047]
+
+
+class TestReconfigure:
+    """Test ParallelDataGenerator.reconfigure reaches reused thread generators."""
+    
+    TICKETS_TABLE = TableInfo(name="tickets", columns=[
+        ColumnInfo(name="status", data_type=ColumnType.ENUM, is_nullable=False,
+                   enum_values=["open", "closed", "pending", "merged", "stale"]),
+    ])
+    
+    @pytest.fixture
+    def tickets_generator(self):
+        """Seeded generator over ``tickets``, whose ENUM column is drawn in batches."""
+        return ParallelDataGenerator(DatabaseSchema(database_name="test_db", tables=[self.TICKETS_TABLE]),
+                                     GenerationConfig(seed=42, global_duplicate_mode="allow_duplicates"), None)
+    
+    def _statuses(self, generator):
+        return {row["status"] for row in generator.generate_data_for_table_parallel("tickets", 50)}
+    
+    def test_table_configs(self, tickets_generator):
+        """Test new column possible_values replace the cached batched ENUM draw."""
+        assert len(self._statuses(tickets_generator)) > 1
+        
+        tickets_generator.reconfigure(table_configs={"tickets": TableGenerationConfig(
+            column_configs={"status": ColumnGenerationConfig(possible_values=["ZZZ"])})})
+        
+        assert self._statuses(tickets_generator) == {"ZZZ"}
+    
+    def test_duplicate_allowed(self, tickets_generator):
+        """Test enabling duplicates switches a batched ENUM column to one repeated value."""
+        assert len(self._statuses(tickets_generator)) > 1
+        
+        tickets_generator.reconfigure(duplicate_allowed=True)
+        
+        assert len(self._statuses(tickets_generator)) == 1
@@ -0,0 +1,148 @@
+"""Tests for CHECK-constraint bounds and key sequences in the ultra-fast generator."""
+
+import pytest
+from sqlalchemy import text
+
+from dbmocker.core.enhanced_models import EnhancedGenerationConfig
+from dbmocker.core.models import (
+    ColumnInfo, ColumnType, ConstraintInfo, ConstraintType, DatabaseSchema, TableInfo
+)
+from dbmocker.core.ultra_fast_processor import UltraFastDataGenerator
+
+
+# (CHECK condition, expected inclusive (low, high) for column "age" with step 1)
+CHECK_BOUNDS_CASES = [
+    ("age >= 18", (18, None)),
+    ("age > 18", (19, None)),
+    ("age <= 65", (None, 65)),
+    ("age < 65", (None, 64)),
+    ("age >= 18 AND age < 65", (18, 64)),
+    ("age BETWEEN 18 AND 65", (18, 65)),
+    ("18 <= age", (18, None)),
+    ("65 > age", (None, 64)),
+    ("0 < age AND age <= 120", (1, 120)),
+    ('"age" >= -5', (-5, None)),
+    ("age >= 10 AND age >= 20", (20, None)),
+    ("age >= 18 OR age = 0", (None, None)),
+    ("NOT (age < 18)", (None, None)),
+    ("stage >= 3 AND age2 < 9", (None, None)),
+    ("status IN ('a', 'b')", (None, None)),
+]
+
+
+@pytest.fixture(scope="module")
+def ultra_generator():
+    """Ultra-fast generator over an empty schema; tests set ``current_table`` themselves."""
+    return UltraFastDataGenerator(DatabaseSchema(database_name="test_db", tables=[]), EnhancedGenerationConfig())
+
+
+def people_table(*conditions):
+    """A ``people`` table with an integer ``age`` column and one CHECK per condition."""
+    return TableInfo(
+        name="people",
+        columns=[ColumnInfo(name="age", data_type=ColumnType.INTEGER, is_nullable=False)],
+        constraints=[
+            ConstraintInfo(name=f"people_check_{i}", type=ConstraintType.CHECK, columns=["age"],
+                           check_condition=condition)
+            for i, condition in enumerate(conditions)
+        ]
+    )
+
+
+class TestCheckBounds:
+    """Test UltraFastDataGenerator._check_bounds and its use in column strategies."""
+    
+    @pytest.mark.parametrize("condition,expected", CHECK_BOUNDS_CASES,
+                             ids=[case[0] for case in CHECK_BOUNDS_CASES])
+    def test_check_bounds(self, ultra_generator, condition, expected):
+        """Test range CHECKs parse to inclusive bounds, and unsupported ones to none."""
+        table = people_table(condition)
+        ultra_generator.current_table = table
+        
+        assert ultra_generator._check_bounds(table.columns[0], step=1) == expected
+    
+    def test_bounds_combine_across_constraints(self, ultra_generator):
+        """Test bounds from several CHECK constraints are intersected."""
+        table = people_table("age >= 18", "age < 65", "age <= 70")
+        ultra_generator.current_table = table
+        
+        assert ultra_generator._check_bounds(table.columns[0], step=1) == (18, 64)
+    
+    def test_integer_strategy_range(self, ultra_generator):
+        """Test the exclusive integer draw range keeps inclusive and strict CHECK bounds."""
+        strategy = ultra_generator._create_table_strategy(people_table("age > 17 AND age <= 65"))
+        
+        column_strategy = strategy['column_strategies']['age']
+        assert (column_strategy['min_val'], column_strategy['max_val']) == (18, 66)
+    
+    def test_float_strategy_range(self, ultra_generator):
+        """Test _apply_check_bounds narrows a float strategy, shifting strict bounds by the step."""
+        table = people_table("age > 1.5 AND age <= 2.5")
+        ultra_generator.current_table = table
+        strategy = {'min_val': 0.0, 'max_val': 10000.0}
+        
+        ultra_generator._apply_check_bounds(strategy, table.columns[0], step=0.01)
+        
+        assert strategy == {'min_val': pytest.approx(1.51), 'max_val': 2.5}
+
+
+def codes_table(*conditions, **column_fields):
+    """A ``codes`` table whose integer primary key ``code`` carries one CHECK per condition."""
+    return TableInfo(
+        name="codes",
+        columns=[ColumnInfo(name="code", data_type=ColumnType.INTEGER, is_nullable=False, **column_fields)],
+        constraints=[ConstraintInfo(name="codes_pkey", type=ConstraintType.PRIMARY_KEY, columns=["code"])] + [
+            ConstraintInfo(name=f"codes_check_{i}", type=ConstraintType.CHECK, columns=["code"],
+                           check_condition=condition)
+            for i, condition in enumerate(conditions)
+        ]
+    )
+
+
+class TestKeySequence:
+    """Test the 'sequence' strategy for single-column integer keys."""
+    
+    @staticmethod
+    def _code_strategy(table, db_connection=None, **config_fields):
+        generator = UltraFastDataGenerator(DatabaseSchema(database_name="test_db", tables=[table]),
+                                           EnhancedGenerationConfig(**config_fields), db_connection)
+        return generator.table_strategies[table.name]['column_strategies'][table.columns[0].name]
+    
+    def test_starts_after_existing_max_with_reserved_names(self, sqlite_conn):
+        """Test MAX() is read through quoted identifiers, so reserved-word names still resume the sequence."""
+        with sqlite_conn.engine.begin() as conn:
+            conn.execute(text('CREATE TABLE "order" ("group" INTEGER PRIMARY KEY)'))
+            conn.execute(text('INSERT INTO "order" ("group") VALUES (7), (41)'))
+        try:
+            table = TableInfo(
+                name="order",
+                columns=[ColumnInfo(name="group", data_type=ColumnType.INTEGER, is_nullable=False)],
+                constraints=[ConstraintInfo(name="order_pkey", type=ConstraintType.PRIMARY_KEY, columns=["group"])]
+            )
+            strategy = self._code_strategy(table, sqlite_conn)
+        finally:
+            with sqlite_conn.engine.begin() as conn:
+                conn.execute(text('DROP TABLE "order"'))
+        
+        assert (strategy['method'], strategy['next_val']) == ('sequence', 42)
+    
+    def test_starts_at_check_lower_bound(self):
+        """Test a CHECK lower bound moves the sequence start up."""
+        strategy = self._code_strategy(codes_table("code >= 1000"))
+        
+        assert (strategy['method'], strategy['next_val']) == ('sequence', 1000)
+    
+    def test_starts_at_min_value(self):
+        """Test the column's min_value moves the sequence start up."""
+        strategy = self._code_strategy(codes_table(min_value=500))
+        
+        assert (strategy['method'], strategy['next_val']) == ('sequence', 500)
+    
+    @pytest.mark.parametrize("rows,method", [(50, 'sequence'), (51, 'numpy_int')])
+    def test_upper_bound_must_hold_requested_rows(self, rows, method):
+        """Test the sequence is skipped when a CHECK upper bound cannot hold every requested row."""
+        strategy = self._code_strategy(codes_table("code <= 50"), target_rows_per_table={"codes": rows})
+        
+        assert strategy['method'] == method
+        if method == 'numpy_int':
+            assert strategy['max_val'] == 51